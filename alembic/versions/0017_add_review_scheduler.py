@@ -0,0 +1,35 @@
+"""Add review scheduler setting and algorithm question sets.
+
+Revision ID: 0017_add_review_scheduler
+Revises: 0016_add_user_activity_event_unique_refs
+Create Date: 2026-03-02 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0017_add_review_scheduler"
+down_revision = "0016_add_user_activity_event_unique_refs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add scheduler selection and stored algorithm review questions."""
+    with op.batch_alter_table("user_settings") as batch:
+        batch.add_column(
+            sa.Column("review_scheduler", sa.String(length=16), nullable=True)
+        )
+    with op.batch_alter_table("algorithms") as batch:
+        batch.add_column(
+            sa.Column("review_questions_by_interval", sa.JSON(), nullable=True)
+        )
+
+
+def downgrade() -> None:
+    """Drop scheduler selection and stored algorithm review questions."""
+    with op.batch_alter_table("algorithms") as batch:
+        batch.drop_column("review_questions_by_interval")
+    with op.batch_alter_table("user_settings") as batch:
+        batch.drop_column("review_scheduler")
@@ -0,0 +1,72 @@
+"""Add latest attempt pointer to review items.
+
+Revision ID: 0018_add_review_item_last_attempt
+Revises: 0017_add_review_scheduler
+Create Date: 2026-03-03 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0018_add_review_item_last_attempt"
+down_revision = "0017_add_review_scheduler"
+branch_labels = None
+depends_on = None
+
+# (item table, attempt table, attempt rating column)
+REVIEW_TABLES: list[tuple[str, str, str]] = [
+    ("review_schedule_items", "review_attempts", "gpt_rating_1_to_5"),
+    ("algorithm_review_items", "algorithm_review_attempts", "rating_1_to_5"),
+]
+
+
+def upgrade() -> None:
+    """Add last_attempt_id/last_rating and backfill them from attempts."""
+    conn = op.get_bind()
+    for item_table, attempt_table, rating_column in REVIEW_TABLES:
+        with op.batch_alter_table(item_table) as batch:
+            batch.add_column(sa.Column("last_attempt_id", sa.Integer(), nullable=True))
+            batch.add_column(sa.Column("last_rating", sa.Integer(), nullable=True))
+            batch.create_index(
+                f"ix_{item_table}_user_status_due",
+                ["user_id", "status", "due_date"],
+                unique=False,
+            )
+
+        conn.execute(
+            sa.text(
+                f"""
+                UPDATE {item_table}
+                SET last_attempt_id = (
+                    SELECT a.id
+                    FROM {attempt_table} a
+                    WHERE a.review_item_id = {item_table}.id
+                    ORDER BY a.created_at DESC, a.id DESC
+                    LIMIT 1
+                )
+                """
+            )
+        )
+        conn.execute(
+            sa.text(
+                f"""
+                UPDATE {item_table}
+                SET last_rating = (
+                    SELECT a.{rating_column}
+                    FROM {attempt_table} a
+                    WHERE a.id = {item_table}.last_attempt_id
+                )
+                WHERE last_attempt_id IS NOT NULL
+                """
+            )
+        )
+
+
+def downgrade() -> None:
+    """Drop the latest attempt pointer columns."""
+    for item_table, _, _ in REVIEW_TABLES:
+        with op.batch_alter_table(item_table) as batch:
+            batch.drop_index(f"ix_{item_table}_user_status_due")
+            batch.drop_column("last_rating")
+            batch.drop_column("last_attempt_id")
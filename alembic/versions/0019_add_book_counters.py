@@ -0,0 +1,58 @@
+"""Add denormalized reading counters to books.
+
+Revision ID: 0019_add_book_counters
+Revises: 0018_add_review_item_last_attempt
+Create Date: 2026-03-10 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0019_add_book_counters"
+down_revision = "0018_add_review_item_last_attempt"
+branch_labels = None
+depends_on = None
+
+# (column, server default, aggregate over reading_parts p)
+COUNTER_COLUMNS: list[tuple[str, str, str]] = [
+    ("parts_total", "0", "COUNT(p.id)"),
+    ("sessions_total", "0", "COUNT(p.session_seconds)"),
+    ("reading_seconds_total", "0", "COALESCE(SUM(p.session_seconds), 0)"),
+    ("pages_read_sum", "0", "COALESCE(SUM(p.pages_read), 0)"),
+    ("next_part_index", "1", "COALESCE(MAX(p.part_index), 0) + 1"),
+]
+
+
+def upgrade() -> None:
+    """Add book counters and backfill them from reading parts."""
+    with op.batch_alter_table("books") as batch:
+        for column_name, default, _ in COUNTER_COLUMNS:
+            batch.add_column(
+                sa.Column(
+                    column_name,
+                    sa.Integer(),
+                    nullable=False,
+                    server_default=default,
+                )
+            )
+        batch.add_column(sa.Column("last_page_end", sa.Integer(), nullable=True))
+
+    aggregates = [
+        (column_name, aggregate) for column_name, _, aggregate in COUNTER_COLUMNS
+    ]
+    aggregates.append(("last_page_end", "MAX(p.page_end)"))
+    assignments = ",\n".join(
+        f"{column_name} = (SELECT {aggregate} FROM reading_parts p "
+        "WHERE p.book_id = books.id)"
+        for column_name, aggregate in aggregates
+    )
+    op.get_bind().execute(sa.text(f"UPDATE books SET {assignments}"))
+
+
+def downgrade() -> None:
+    """Drop book counters."""
+    with op.batch_alter_table("books") as batch:
+        batch.drop_column("last_page_end")
+        for column_name, _, _ in reversed(COUNTER_COLUMNS):
+            batch.drop_column(column_name)
@@ -0,0 +1,35 @@
+"""Index reading parts by book and part index.
+
+Revision ID: 0020_add_reading_part_book_index
+Revises: 0019_add_book_counters
+Create Date: 2026-03-12 00:00:00.000000
+"""
+
+from alembic import op
+
+revision = "0020_add_reading_part_book_index"
+down_revision = "0019_add_book_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace the book_id index with a (book_id, part_index) index."""
+    op.create_index(
+        "ix_reading_parts_book_part_index",
+        "reading_parts",
+        ["book_id", "part_index"],
+        unique=False,
+    )
+    op.drop_index("ix_reading_parts_book_id", table_name="reading_parts")
+
+
+def downgrade() -> None:
+    """Restore the single-column book_id index."""
+    op.create_index(
+        "ix_reading_parts_book_id",
+        "reading_parts",
+        ["book_id"],
+        unique=False,
+    )
+    op.drop_index("ix_reading_parts_book_part_index", table_name="reading_parts")
@@ -0,0 +1,40 @@
+"""Add soft delete and purge progress to books.
+
+Revision ID: 0021_add_book_soft_delete
+Revises: 0020_add_reading_part_book_index
+Create Date: 2026-03-14 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0021_add_book_soft_delete"
+down_revision = "0020_add_reading_part_book_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add deleted_at, purge_status and purged_rows columns."""
+    with op.batch_alter_table("books") as batch:
+        batch.add_column(
+            sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True)
+        )
+        batch.add_column(sa.Column("purge_status", sa.String(20), nullable=True))
+        batch.add_column(
+            sa.Column(
+                "purged_rows",
+                sa.Integer(),
+                nullable=False,
+                server_default="0",
+            )
+        )
+
+
+def downgrade() -> None:
+    """Drop soft delete columns."""
+    with op.batch_alter_table("books") as batch:
+        batch.drop_column("purged_rows")
+        batch.drop_column("purge_status")
+        batch.drop_column("deleted_at")
@@ -0,0 +1,85 @@
+"""Add denormalized review counters to reading parts and algorithms.
+
+Revision ID: 0022_add_review_counters
+Revises: 0021_add_book_soft_delete
+Create Date: 2026-03-15 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0022_add_review_counters"
+down_revision = "0021_add_book_soft_delete"
+branch_labels = None
+depends_on = None
+
+# (parent table, item table, item parent column, attempt table, rating column)
+COUNTER_TABLES: list[tuple[str, str, str, str, str]] = [
+    (
+        "reading_parts",
+        "review_schedule_items",
+        "reading_part_id",
+        "review_attempts",
+        "gpt_rating_1_to_5",
+    ),
+    (
+        "algorithms",
+        "algorithm_review_items",
+        "algorithm_id",
+        "algorithm_review_attempts",
+        "rating_1_to_5",
+    ),
+]
+COUNTER_COLUMNS = [
+    "total_reviews",
+    "completed_reviews",
+    "gpt_attempts_total",
+    "gpt_rating_sum",
+]
+
+
+def upgrade() -> None:
+    """Add review counters and backfill them from review rows."""
+    bind = op.get_bind()
+    for parent, items, parent_column, attempts, rating in COUNTER_TABLES:
+        with op.batch_alter_table(parent) as batch:
+            for column_name in COUNTER_COLUMNS:
+                batch.add_column(
+                    sa.Column(
+                        column_name,
+                        sa.Integer(),
+                        nullable=False,
+                        server_default="0",
+                    )
+                )
+
+        item_filter = f"FROM {items} i WHERE i.{parent_column} = {parent}.id"
+        attempt_filter = (
+            f"FROM {attempts} a JOIN {items} i ON a.review_item_id = i.id "
+            f"WHERE i.{parent_column} = {parent}.id AND a.{rating} IS NOT NULL"
+        )
+        aggregates = [
+            ("total_reviews", f"SELECT COUNT(i.id) {item_filter}"),
+            (
+                "completed_reviews",
+                f"SELECT COUNT(i.id) {item_filter} AND i.status = 'done'",
+            ),
+            ("gpt_attempts_total", f"SELECT COUNT(a.id) {attempt_filter}"),
+            (
+                "gpt_rating_sum",
+                f"SELECT COALESCE(SUM(a.{rating}), 0) {attempt_filter}",
+            ),
+        ]
+        assignments = ",\n".join(
+            f"{column_name} = ({aggregate})" for column_name, aggregate in aggregates
+        )
+        bind.execute(sa.text(f"UPDATE {parent} SET {assignments}"))
+
+
+def downgrade() -> None:
+    """Drop review counters."""
+    for parent, *_ in reversed(COUNTER_TABLES):
+        with op.batch_alter_table(parent) as batch:
+            for column_name in reversed(COUNTER_COLUMNS):
+                batch.drop_column(column_name)
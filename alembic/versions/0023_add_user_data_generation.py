@@ -0,0 +1,34 @@
+"""Add per-user data generation for conditional GETs.
+
+Revision ID: 0023_add_user_data_generation
+Revises: 0022_add_review_counters
+Create Date: 2026-03-16 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0023_add_user_data_generation"
+down_revision = "0022_add_review_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the data_generation column to users."""
+    with op.batch_alter_table("users") as batch:
+        batch.add_column(
+            sa.Column(
+                "data_generation",
+                sa.Integer(),
+                nullable=False,
+                server_default="0",
+            )
+        )
+
+
+def downgrade() -> None:
+    """Drop the data_generation column."""
+    with op.batch_alter_table("users") as batch:
+        batch.drop_column("data_generation")
@@ -0,0 +1,46 @@
+"""Add the polled cache invalidation table.
+
+Revision ID: 0024_add_cache_invalidations
+Revises: 0023_add_user_data_generation
+Create Date: 2026-03-18 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0024_add_cache_invalidations"
+down_revision = "0023_add_user_data_generation"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create cache_invalidations."""
+    op.create_table(
+        "cache_invalidations",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("origin", sa.String(length=64), nullable=False),
+        sa.Column("channel", sa.String(length=64), nullable=False),
+        sa.Column("keys", sa.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+    )
+    op.create_index(
+        "ix_cache_invalidations_created_at",
+        "cache_invalidations",
+        ["created_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop cache_invalidations."""
+    op.drop_index(
+        "ix_cache_invalidations_created_at",
+        table_name="cache_invalidations",
+    )
+    op.drop_table("cache_invalidations")
@@ -0,0 +1,48 @@
+import { readdir, readFile, stat, writeFile } from "node:fs/promises";
+import path from "node:path";
+import { brotliCompressSync, constants, gzipSync } from "node:zlib";
+
+const DIST_DIR = path.resolve(process.argv[2] || "dist");
+const COMPRESSIBLE = /\.(html|js|mjs|css|svg|json|txt|map|xml|webmanifest)$/i;
+// Below ~1 KB the encoding overhead eats most of the saving.
+const MIN_BYTES = 1024;
+
+const listFiles = async (dir) => {
+  const entries = await readdir(dir, { withFileTypes: true });
+  const nested = await Promise.all(
+    entries.map((entry) => {
+      const fullPath = path.join(dir, entry.name);
+      return entry.isDirectory() ? listFiles(fullPath) : [fullPath];
+    }),
+  );
+  return nested.flat();
+};
+
+const encoders = [
+  [".br", (body) => brotliCompressSync(body, { params: { [constants.BROTLI_PARAM_QUALITY]: 11 } })],
+  [".gz", (body) => gzipSync(body, { level: 9 })],
+];
+
+const compressFile = async (filePath) => {
+  const body = await readFile(filePath);
+  let written = 0;
+  for (const [suffix, encode] of encoders) {
+    const encoded = encode(body);
+    if (encoded.length >= body.length) {
+      continue;
+    }
+    // Written after the original, so the server sees a sibling at least as new.
+    await writeFile(filePath + suffix, encoded);
+    written += 1;
+  }
+  return written;
+};
+
+const files = (await listFiles(DIST_DIR)).filter((filePath) => COMPRESSIBLE.test(filePath));
+let total = 0;
+for (const filePath of files) {
+  if ((await stat(filePath)).size >= MIN_BYTES) {
+    total += await compressFile(filePath);
+  }
+}
+console.log(`compress-dist: wrote ${total} precompressed files in ${DIST_DIR}`);
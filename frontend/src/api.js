@@ -218,6 +218,26 @@ export const requestText = async (path, options = {}) => {
   return text;
 };
 
+let promptsVersionPromise = null;
+
+const getPromptsVersion = () => {
+  if (!promptsVersionPromise) {
+    promptsVersionPromise = requestText("/prompts/version")
+      .then((text) => JSON.parse(text).version)
+      .catch((error) => {
+        promptsVersionPromise = null;
+        throw error;
+      });
+  }
+  return promptsVersionPromise;
+};
+
+// Versioned prompt URLs are served as immutable, so the browser cache keeps them.
+export const requestPrompt = async (name) => {
+  const version = await getPromptsVersion();
+  return requestText(`/prompts/${name}?v=${encodeURIComponent(version)}`);
+};
+
 export const getErrorMessage = (error) => {
   if (!error) {
     return "Неизвестная ошибка.";
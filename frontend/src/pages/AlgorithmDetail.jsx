@@ -1,7 +1,7 @@
 import { useEffect, useMemo, useRef, useState } from "react";
 import { Link, useParams } from "react-router-dom";
 
-import { getErrorMessage, request, requestText } from "../api.js";
+import { getErrorMessage, request, requestPrompt } from "../api.js";
 import ErrorBanner from "../components/ErrorBanner.jsx";
 
 const AlgorithmDetail = () => {
@@ -448,7 +448,7 @@ const AlgorithmDetail = () => {
     }
     setPromptLoading(true);
     try {
-      const template = await requestText("/prompts/check_algorithm_answers");
+      const template = await requestPrompt("check_algorithm_answers");
       setPromptTemplate(template);
       return template;
     } finally {
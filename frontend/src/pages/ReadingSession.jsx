@@ -1,7 +1,7 @@
 import { useEffect, useMemo, useRef, useState } from "react";
 import { Link } from "react-router-dom";
 
-import { getErrorMessage, request, requestText } from "../api.js";
+import { getErrorMessage, request, requestPrompt } from "../api.js";
 
 const splitLines = (value) =>
   value
@@ -488,13 +488,13 @@ const ReadingSession = () => {
       let parts = [];
       if (hasCode) {
         [template, parts, algorithmTemplate] = await Promise.all([
-          requestText("/prompts/generate_summary_and_questions"),
+          requestPrompt("generate_summary_and_questions"),
           request(`/parts?book_id=${selectedBook}`),
-          requestText("/prompts/generate_algorithms_from_code"),
+          requestPrompt("generate_algorithms_from_code"),
         ]);
       } else {
         [template, parts] = await Promise.all([
-          requestText("/prompts/generate_summary_and_questions"),
+          requestPrompt("generate_summary_and_questions"),
           request(`/parts?book_id=${selectedBook}`),
         ]);
       }
@@ -1,6 +1,6 @@
 import { useCallback, useEffect, useMemo, useRef, useState } from "react";
 
-import { getErrorMessage, request, requestText } from "../api.js";
+import { getErrorMessage, request, requestPrompt } from "../api.js";
 import { formatDueDate } from "../date.js";
 import Markdown from "../components/Markdown.jsx";
 
@@ -510,7 +510,7 @@ const Reviews = () => {
     try {
       setPromptLoading(true);
       if (!promptTemplate) {
-        const template = await requestText("/prompts/check_answers");
+        const template = await requestPrompt("check_answers");
         setPromptTemplate(template);
       }
       setShowPrompt(true);
@@ -543,7 +543,7 @@ const Reviews = () => {
     try {
       setAlgorithmPromptLoading(true);
       if (!algorithmPromptTemplate) {
-        const template = await requestText("/prompts/check_algorithm_answers");
+        const template = await requestPrompt("check_algorithm_answers");
         setAlgorithmPromptTemplate(template);
       }
       setAlgorithmShowPrompt(true);
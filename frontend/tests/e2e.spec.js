@@ -163,7 +163,15 @@ test("session prompt -> import part -> open review", async ({ page }) => {
     });
   });
 
-  await page.route("**/prompts/generate_summary_and_questions", async (route) => {
+  await page.route("**/prompts/version", async (route) => {
+    await route.fulfill({
+      status: 200,
+      contentType: "application/json",
+      body: JSON.stringify({ version: "test" }),
+    });
+  });
+
+  await page.route("**/prompts/generate_summary_and_questions?v=test", async (route) => {
     await route.fulfill({
       status: 200,
       contentType: "text/plain",
@@ -0,0 +1,163 @@
+"""Gzip response compression with size thresholds and ratio metrics."""
+
+from __future__ import annotations
+
+import logging
+import os
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from studying_light.api.static import accepts_encoding
+from studying_light.services.compression_stats import (
+    CompressionStats,
+    compression_stats,
+)
+
+logger = logging.getLogger(__name__)
+
+GZIP_MINIMUM_SIZE_ENV = "GZIP_MINIMUM_SIZE"
+GZIP_COMPRESS_LEVEL_ENV = "GZIP_COMPRESS_LEVEL"
+DEFAULT_MINIMUM_SIZE = 1024
+# Level 6 gets most of level 9's ratio at a fraction of the CPU per request.
+DEFAULT_COMPRESS_LEVEL = 6
+# Compressed formats gain nothing from gzip; event streams must not buffer.
+EXCLUDED_CONTENT_TYPES = (
+    "application/gzip",
+    "application/x-gzip",
+    "application/zip",
+    "application/x-zip-compressed",
+    "audio/",
+    "font/woff",
+    "image/",
+    "text/event-stream",
+    "video/",
+)
+# GZipMiddleware passes through any response that already names an encoding;
+# excluded responses carry this marker past it and lose it on the way out.
+_PASS_THROUGH_ENCODING = "identity"
+
+
+def _env_int(name: str, default: int) -> int:
+    raw_value = (os.getenv(name) or "").strip()
+    if not raw_value:
+        return default
+    try:
+        return int(raw_value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, raw_value)
+        return default
+
+
+def is_excluded_content_type(content_type: str) -> bool:
+    """Check whether a media type is not worth compressing."""
+    media_type = content_type.partition(";")[0].strip().lower()
+    # SVG is XML text and compresses well, unlike the other image types.
+    return media_type.startswith(EXCLUDED_CONTENT_TYPES) and media_type != (
+        "image/svg+xml"
+    )
+
+
+class _ResponseMeter:
+    """Tracks one response on both sides of the gzip middleware."""
+
+    def __init__(self) -> None:
+        self.encoded_by_app = False
+        self.excluded = False
+        self.streamed = False
+        self.compressed = False
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def before_gzip(self, message: Message) -> Message:
+        """Inspect a message the app sends and mark excluded responses."""
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(raw=message["headers"])
+            self.encoded_by_app = "content-encoding" in headers
+            self.excluded = not self.encoded_by_app and is_excluded_content_type(
+                headers.get("content-type", "")
+            )
+            if self.excluded:
+                headers["Content-Encoding"] = _PASS_THROUGH_ENCODING
+        elif message["type"] == "http.response.body":
+            self.bytes_in += len(message.get("body", b""))
+            self.streamed = self.streamed or message.get("more_body", False)
+        return message
+
+    def after_gzip(self, message: Message) -> Message:
+        """Restore excluded responses and weaken ETags of gzipped ones."""
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(raw=message["headers"])
+            if self.excluded:
+                del headers["Content-Encoding"]
+            elif not self.encoded_by_app and headers.get("content-encoding"):
+                # The gzip body differs from the one a strong ETag names.
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+            self.compressed = (
+                not self.excluded
+                and not self.encoded_by_app
+                and headers.get("content-encoding") == "gzip"
+            )
+        elif message["type"] == "http.response.body":
+            self.bytes_out += len(message.get("body", b""))
+        return message
+
+
+class CompressionMiddleware:
+    """Gzip responses above a minimum size, streaming bodies incrementally.
+
+    Bodies that already carry a Content-Encoding (precompressed assets and
+    prompts) and archive or media types are passed through untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int | None = None,
+        compresslevel: int | None = None,
+        *,
+        stats: CompressionStats | None = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = (
+            _env_int(GZIP_MINIMUM_SIZE_ENV, DEFAULT_MINIMUM_SIZE)
+            if minimum_size is None
+            else minimum_size
+        )
+        self.compresslevel = (
+            _env_int(GZIP_COMPRESS_LEVEL_ENV, DEFAULT_COMPRESS_LEVEL)
+            if compresslevel is None
+            else compresslevel
+        )
+        self.stats = compression_stats if stats is None else stats
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Compress through GZipMiddleware when the client accepts gzip."""
+        if scope["type"] != "http" or not accepts_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), "gzip"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        meter = _ResponseMeter()
+
+        async def app_before_gzip(scope: Scope, receive: Receive, send: Send) -> None:
+            async def send_to_gzip(message: Message) -> None:
+                await send(meter.before_gzip(message))
+
+            await self.app(scope, receive, send_to_gzip)
+
+        async def send_to_client(message: Message) -> None:
+            await send(meter.after_gzip(message))
+
+        gzip = GZipMiddleware(app_before_gzip, self.minimum_size, self.compresslevel)
+        await gzip(scope, receive, send_to_client)
+        if meter.compressed:
+            self.stats.record(
+                meter.bytes_in,
+                meter.bytes_out,
+                streamed=meter.streamed,
+            )
@@ -1,9 +1,13 @@
 """Prompt template endpoints."""
 
+import hashlib
+from functools import lru_cache
 from importlib import resources
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import PlainTextResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import PlainTextResponse, Response
+
+from studying_light.api.static import InMemoryFile
 
 router: APIRouter = APIRouter()
 
@@ -13,22 +17,57 @@ ALLOWED_PROMPTS: set[str] = {
     "generate_algorithms_from_code",
     "check_algorithm_answers",
 }
+PROMPT_MEDIA_TYPE = "text/plain; charset=utf-8"
+# Requests pinned to the current version never change; others revalidate.
+VERSIONED_CACHE_CONTROL = "public, max-age=31536000, immutable"
+UNVERSIONED_CACHE_CONTROL = "public, no-cache"
+
+
+@lru_cache(maxsize=1)
+def load_prompt_templates() -> dict[str, InMemoryFile]:
+    """Read and compress every prompt template once per process."""
+    package = resources.files("studying_light.prompts")
+    templates = {}
+    for name in sorted(ALLOWED_PROMPTS):
+        file_path = package.joinpath(f"{name}.txt")
+        if not file_path.is_file():
+            continue
+        body = file_path.read_text(encoding="utf-8").encode("utf-8")
+        templates[name] = InMemoryFile.build(body, media_type=PROMPT_MEDIA_TYPE)
+    return templates
+
+
+@lru_cache(maxsize=1)
+def prompts_version() -> str:
+    """Return a hash that changes whenever any prompt template changes."""
+    digests = "".join(
+        f"{name}:{template.digest}\n"
+        for name, template in load_prompt_templates().items()
+    )
+    return hashlib.sha256(digests.encode()).hexdigest()[:16]
+
+
+@router.get("/prompts/version")
+def get_prompts_version() -> dict[str, str]:
+    """Return the prompt set version for cache-busting template URLs."""
+    return {"version": prompts_version()}
 
 
 @router.get("/prompts/{name}", response_class=PlainTextResponse)
-def get_prompt(name: str) -> str:
+def get_prompt(name: str, request: Request, v: str | None = None) -> Response:
     """Return a prompt template by name."""
-    if name not in ALLOWED_PROMPTS:
+    template = load_prompt_templates().get(name) if name in ALLOWED_PROMPTS else None
+    if template is None:
         raise HTTPException(
             status_code=404,
             detail={"detail": "Prompt not found", "code": "NOT_FOUND"},
         )
 
-    package = resources.files("studying_light.prompts")
-    file_path = package.joinpath(f"{name}.txt")
-    if not file_path.is_file():
-        raise HTTPException(
-            status_code=404,
-            detail={"detail": "Prompt not found", "code": "NOT_FOUND"},
-        )
-    return file_path.read_text(encoding="utf-8")
+    return template.response(
+        request,
+        cache_control=(
+            VERSIONED_CACHE_CONTROL
+            if v == prompts_version()
+            else UNVERSIONED_CACHE_CONTROL
+        ),
+    )
@@ -0,0 +1,208 @@
+"""In-memory and precompressed static file serving."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from fastapi import Request, status
+from fastapi.responses import Response
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from studying_light.api.v1.responses import etag_matches
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+# Preferred first; the build step writes .br and .gz siblings.
+PRECOMPRESSED_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+# Vite names built assets `<name>-<content hash>.<ext>`.
+HASHED_ASSET_RE = re.compile(r"-[A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+$")
+
+
+def accepts_encoding(accept_encoding: str, coding: str) -> bool:
+    """Check whether an Accept-Encoding header allows a content coding."""
+    for entry in accept_encoding.split(","):
+        name, _, params = entry.partition(";")
+        if name.strip().lower() not in {coding, "*"}:
+            continue
+        quality = params.strip()
+        if not quality.startswith("q="):
+            return True
+        try:
+            return float(quality[2:]) > 0
+        except ValueError:
+            return False
+    return False
+
+
+@dataclass(frozen=True)
+class InMemoryFile:
+    """File body held in memory with precompressed variants and an ETag."""
+
+    body: bytes
+    media_type: str
+    digest: str
+    encoded: Mapping[str, bytes] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        body: bytes,
+        *,
+        media_type: str,
+        encoded: Mapping[str, bytes] | None = None,
+    ) -> InMemoryFile:
+        """Hash the body and gzip it unless a gzip variant is given."""
+        variants = dict(encoded or {})
+        if "gzip" not in variants:
+            # mtime=0 keeps the compressed bytes stable for the same body.
+            variants["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+        return cls(
+            body=body,
+            media_type=media_type,
+            digest=hashlib.sha256(body).hexdigest()[:32],
+            encoded=variants,
+        )
+
+    def etag(self, coding: str | None = None) -> str:
+        """Return the strong ETag of one encoding of the body."""
+        return f'"{self.digest}-{coding}"' if coding else f'"{self.digest}"'
+
+    def response(self, request: Request, *, cache_control: str) -> Response:
+        """Return the best encoding the client accepts, or 304."""
+        accept_encoding = request.headers.get("accept-encoding", "")
+        coding = next(
+            (
+                coding
+                for coding, _ in PRECOMPRESSED_SUFFIXES
+                if coding in self.encoded and accepts_encoding(accept_encoding, coding)
+            ),
+            None,
+        )
+        headers = {
+            "ETag": self.etag(coding),
+            "Cache-Control": cache_control,
+            "Vary": "Accept-Encoding",
+        }
+        if etag_matches(request, headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        if coding is None:
+            return Response(
+                content=self.body,
+                media_type=self.media_type,
+                headers=headers,
+            )
+        headers["Content-Encoding"] = coding
+        return Response(
+            content=self.encoded[coding],
+            media_type=self.media_type,
+            headers=headers,
+        )
+
+
+def read_in_memory_file(path: Path, *, media_type: str) -> InMemoryFile | None:
+    """Read a file and its precompressed siblings, or None if it is missing."""
+    if not path.is_file():
+        return None
+    encoded = {}
+    for coding, suffix in PRECOMPRESSED_SUFFIXES:
+        sibling = path.with_name(path.name + suffix)
+        if sibling.is_file():
+            encoded[coding] = sibling.read_bytes()
+    return InMemoryFile.build(path.read_bytes(), media_type=media_type, encoded=encoded)
+
+
+@lru_cache(maxsize=4)
+def load_spa_index(static_dir: Path) -> InMemoryFile | None:
+    """Load the SPA entrypoint once per process."""
+    return read_in_memory_file(
+        static_dir / "index.html",
+        media_type="text/html; charset=utf-8",
+    )
+
+
+@lru_cache(maxsize=4096)
+def _precompressed_sibling(
+    full_path: str,
+    coding: str,
+    mtime_ns: int,
+) -> tuple[str, os.stat_result] | None:
+    suffix = dict(PRECOMPRESSED_SUFFIXES)[coding]
+    try:
+        sibling_stat = os.stat(full_path + suffix)
+    except OSError:
+        return None
+    # A sibling older than the file belongs to a previous build.
+    if sibling_stat.st_mtime_ns < mtime_ns:
+        return None
+    return full_path + suffix, sibling_stat
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves .br/.gz siblings and caches hashed assets.
+
+    Only mounts created with ``immutable_hashed_assets`` (the Vite build
+    output) cache hashed names for a year; hand-named files elsewhere could
+    match the pattern without carrying a content hash.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        immutable_hashed_assets: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.immutable_hashed_assets = immutable_hashed_assets
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Serve the best precompressed variant with caching headers."""
+        request_headers = Headers(scope=scope)
+        accept_encoding = request_headers.get("accept-encoding", "")
+        full_path = os.fspath(full_path)
+        headers = {
+            "Cache-Control": (
+                IMMUTABLE_CACHE_CONTROL
+                if self.immutable_hashed_assets and HASHED_ASSET_RE.search(full_path)
+                else REVALIDATE_CACHE_CONTROL
+            ),
+            "Vary": "Accept-Encoding",
+        }
+        served_path, served_stat = full_path, stat_result
+        for coding, _ in PRECOMPRESSED_SUFFIXES:
+            if not accepts_encoding(accept_encoding, coding):
+                continue
+            sibling = _precompressed_sibling(full_path, coding, stat_result.st_mtime_ns)
+            if sibling is not None:
+                served_path, served_stat = sibling
+                headers["Content-Encoding"] = coding
+                break
+
+        media_type = mimetypes.guess_type(full_path)[0] or "text/plain"
+        response = FileResponse(
+            served_path,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            stat_result=served_stat,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
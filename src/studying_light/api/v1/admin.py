@@ -10,6 +10,13 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from studying_light.api.v1.deps import get_current_admin_user
+from studying_light.api.v1.pagination import (
+    PageParams,
+    page_params,
+    page_response,
+    paginate,
+    parse_fields,
+)
 from studying_light.api.v1.schemas import (
     AdminIssueTempPasswordOut,
     AdminPasswordResetRequestOut,
@@ -19,6 +26,7 @@ from studying_light.api.v1.schemas import (
     AdminUserPerformanceDetailOut,
     AdminUserPerformanceItemOut,
     AdminUsersPerformanceListOut,
+    ReviewForecastOut,
 )
 from studying_light.db.models.password_reset_request import PasswordResetRequest
 from studying_light.db.models.user import User
@@ -31,6 +39,13 @@ from studying_light.services.admin_performance_service import (
     list_users_performance,
 )
 from studying_light.services.audit_log import record_audit_event
+from studying_light.services.compression_stats import compression_stats
+from studying_light.services.response_cache import get_response_cache
+from studying_light.services.review_forecast import (
+    FORECAST_MAX_DAILY_CAPACITY,
+    FORECAST_MAX_DAYS,
+    get_review_forecast,
+)
 
 router: APIRouter = APIRouter(prefix="/admin")
 
@@ -57,7 +72,7 @@ def _is_online(last_seen_at: datetime | None, now: datetime) -> bool:
 
 
 def _build_admin_user_out(user: User, now: datetime) -> AdminUserOut:
-    return AdminUserOut(
+    return AdminUserOut.model_construct(
         id=user.id,
         email=user.email,
         is_active=user.is_active,
@@ -106,12 +121,15 @@ def _ensure_user_exists(
 def list_users(
     query: str | None = None,
     status: str | None = None,
+    fields: str | None = None,
+    page: PageParams = Depends(page_params),
     session: Session = Depends(get_session),
     current_admin: User = Depends(get_current_admin_user),
 ) -> list[AdminUserOut]:
     """List users for admin."""
     del current_admin
-    stmt = select(User).order_by(User.created_at.desc())
+    selected_fields = parse_fields(fields, AdminUserOut)
+    stmt = select(User)
     if query:
         lowered = f"%{query.strip().lower()}%"
         stmt = stmt.where(User.email.ilike(lowered))
@@ -128,9 +146,19 @@ def list_users(
             )
         stmt = stmt.where(User.is_active.is_(status_value == "active"))
 
-    users = session.execute(stmt).scalars().all()
+    rows, next_cursor = paginate(
+        session,
+        stmt,
+        page,
+        keys=[User.created_at, User.id],
+        descending=True,
+    )
     now = datetime.now(timezone.utc)
-    return [_build_admin_user_out(user, now) for user in users]
+    return page_response(
+        [_build_admin_user_out(user, now) for (user,) in rows],
+        next_cursor=next_cursor,
+        fields=selected_fields,
+    )
 
 
 @router.get("/users/performance")
@@ -169,6 +197,53 @@ def list_users_performance_view(
     )
 
 
+@router.get("/reviews/forecast")
+def review_forecast_view(
+    user_id: uuid.UUID | None = None,
+    days: int = Query(default=30, ge=1, le=FORECAST_MAX_DAYS),
+    daily_capacity: int | None = Query(
+        default=None,
+        ge=1,
+        le=FORECAST_MAX_DAILY_CAPACITY,
+    ),
+    session: Session = Depends(get_session),
+    current_admin: User = Depends(get_current_admin_user),
+) -> ReviewForecastOut:
+    """Forecast review load for one user or for all users."""
+    del current_admin
+    if user_id is not None:
+        _ensure_user_exists(session, user_id=user_id)
+    try:
+        forecast = get_review_forecast(
+            session,
+            user_id=user_id,
+            today=date.today(),
+            days=days,
+            daily_capacity=daily_capacity,
+        )
+    except ValueError as exc:
+        raise _validation_error(str(exc)) from exc
+    return ReviewForecastOut(**forecast)
+
+
+@router.get("/response-cache")
+def response_cache_stats_view(
+    current_admin: User = Depends(get_current_admin_user),
+) -> dict[str, int]:
+    """Return hit, miss and eviction counters of the response cache."""
+    del current_admin
+    return get_response_cache().stats()
+
+
+@router.get("/compression")
+def compression_stats_view(
+    current_admin: User = Depends(get_current_admin_user),
+) -> dict[str, float]:
+    """Return gzip response counters and the compression ratio."""
+    del current_admin
+    return compression_stats.snapshot()
+
+
 @router.get("/users/{user_id}/performance")
 def get_user_performance_view(
     user_id: uuid.UUID,
@@ -303,15 +378,16 @@ def deactivate_user(
 @router.get("/password-resets")
 def list_password_resets(
     status: str | None = None,
+    fields: str | None = None,
+    page: PageParams = Depends(page_params),
     session: Session = Depends(get_session),
     current_admin: User = Depends(get_current_admin_user),
 ) -> list[AdminPasswordResetRequestOut]:
     """List password reset requests."""
     del current_admin
-    stmt = (
-        select(PasswordResetRequest, User.email)
-        .join(User, User.id == PasswordResetRequest.user_id)
-        .order_by(PasswordResetRequest.requested_at.desc())
+    selected_fields = parse_fields(fields, AdminPasswordResetRequestOut)
+    stmt = select(PasswordResetRequest, User.email).join(
+        User, User.id == PasswordResetRequest.user_id
     )
     if status:
         status_value = status.strip().lower()
@@ -325,19 +401,29 @@ def list_password_resets(
             )
         stmt = stmt.where(PasswordResetRequest.status == status_value)
 
-    rows = session.execute(stmt).all()
-    return [
-        AdminPasswordResetRequestOut(
-            id=item.id,
-            user_id=item.user_id,
-            email=email,
-            status=item.status,
-            requested_at=item.requested_at,
-            processed_at=item.processed_at,
-            processed_by_admin_id=item.processed_by_admin_id,
-        )
-        for item, email in rows
-    ]
+    rows, next_cursor = paginate(
+        session,
+        stmt,
+        page,
+        keys=[PasswordResetRequest.requested_at, PasswordResetRequest.id],
+        descending=True,
+    )
+    return page_response(
+        [
+            AdminPasswordResetRequestOut.model_construct(
+                id=item.id,
+                user_id=item.user_id,
+                email=email,
+                status=item.status,
+                requested_at=item.requested_at,
+                processed_at=item.processed_at,
+                processed_by_admin_id=item.processed_by_admin_id,
+            )
+            for item, email in rows
+        ],
+        next_cursor=next_cursor,
+        fields=selected_fields,
+    )
 
 
 @router.post("/password-resets/{request_id}/issue-temp-password")
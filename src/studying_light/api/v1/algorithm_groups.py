@@ -4,7 +4,15 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 
-from studying_light.api.v1.deps import get_current_user
+from studying_light.api.v1.deps import conditional_get, get_current_user
+from studying_light.api.v1.pagination import (
+    PageParams,
+    page_params,
+    page_response,
+    paginate,
+    parse_fields,
+)
+from studying_light.api.v1.responses import cached_response
 from studying_light.api.v1.schemas import (
     AlgorithmGroupAlgorithmOut,
     AlgorithmGroupCreate,
@@ -61,12 +69,17 @@ def _build_group_detail(
 
 
 @router.get("/algorithm-groups")
+@cached_response("algorithms")
 def list_algorithm_groups(
     query: str | None = None,
+    fields: str | None = None,
+    page: PageParams = Depends(page_params),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
+    etag: str = Depends(conditional_get),
 ) -> list[AlgorithmGroupListOut]:
     """List algorithm groups with optional title search."""
+    selected_fields = parse_fields(fields, AlgorithmGroupListOut)
     counts_subquery = (
         select(
             Algorithm.group_id,
@@ -83,7 +96,6 @@ def list_algorithm_groups(
         )
         .outerjoin(counts_subquery, counts_subquery.c.group_id == AlgorithmGroup.id)
         .where(AlgorithmGroup.user_id == current_user.id)
-        .order_by(AlgorithmGroup.title)
     )
 
     if query:
@@ -91,20 +103,31 @@ def list_algorithm_groups(
         if normalized:
             stmt = stmt.where(AlgorithmGroup.title_norm.like(f"%{normalized}%"))
 
-    rows = session.execute(stmt).all()
-    return [
-        AlgorithmGroupListOut(
-            id=group.id,
-            title=group.title,
-            description=group.description,
-            notes=group.notes,
-            algorithms_count=int(algorithms_count or 0),
-        )
-        for group, algorithms_count in rows
-    ]
+    rows, next_cursor = paginate(
+        session,
+        stmt,
+        page,
+        keys=[AlgorithmGroup.title, AlgorithmGroup.id],
+    )
+    return page_response(
+        [
+            AlgorithmGroupListOut.model_construct(
+                id=group.id,
+                title=group.title,
+                description=group.description,
+                notes=group.notes,
+                algorithms_count=int(algorithms_count or 0),
+            )
+            for group, algorithms_count in rows
+        ],
+        next_cursor=next_cursor,
+        fields=selected_fields,
+        etag=etag,
+    )
 
 
 @router.get("/algorithm-groups/{group_id}")
+@cached_response("algorithms")
 def get_algorithm_group(
     group_id: int,
     session: Session = Depends(get_session),
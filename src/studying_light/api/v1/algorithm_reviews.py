@@ -3,19 +3,27 @@
 from datetime import date, datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import case, func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Load, Session
 
 from studying_light.api.v1.deps import get_current_user
+from studying_light.api.v1.responses import ModelListResponse
 from studying_light.api.v1.schemas import (
     AlgorithmReviewAttemptOut,
+    AlgorithmReviewBatchCompletePayload,
+    AlgorithmReviewBatchCompleteResponse,
+    AlgorithmReviewBatchCompleteResultOut,
     AlgorithmReviewCompletePayload,
     AlgorithmReviewDetailOut,
     AlgorithmReviewFeedbackPayload,
     AlgorithmReviewItemOut,
     AlgorithmReviewStatsOut,
+    ReviewSpreadDayOut,
+    ReviewSpreadOut,
+    ReviewSpreadPayload,
 )
-from studying_light.db.models.algorithm import Algorithm
+from studying_light.db.constants import ACTIVITY_KIND_REVIEW_ALGORITHM_THEORY
+from studying_light.db.models.algorithm import ALGORITHM_CONTENT_GROUP, Algorithm
 from studying_light.db.models.algorithm_group import AlgorithmGroup
 from studying_light.db.models.algorithm_review_attempt import AlgorithmReviewAttempt
 from studying_light.db.models.algorithm_review_item import AlgorithmReviewItem
@@ -23,8 +31,16 @@ from studying_light.db.models.user import User
 from studying_light.db.session import get_session
 from studying_light.services.activity_tracker import (
     record_algorithm_review_theory,
+    record_events_bulk,
     upsert_algorithm_review_theory_feedback,
 )
+from studying_light.services.review_backlog import (
+    load_spread_window,
+    plan_spread,
+    spread_overdue,
+)
+from studying_light.services.review_counters import average_rating
+from studying_light.services.review_scheduler import sync_algorithm_review_schedule
 
 router: APIRouter = APIRouter()
 
@@ -36,7 +52,7 @@ def _build_algorithm_review_item_out(
     gpt_rating_1_to_5: int | None = None,
 ) -> AlgorithmReviewItemOut:
     """Build algorithm review item response."""
-    return AlgorithmReviewItemOut(
+    return AlgorithmReviewItemOut.model_construct(
         id=item.id,
         algorithm_id=item.algorithm_id,
         interval_days=item.interval_days,
@@ -56,18 +72,8 @@ def algorithm_reviews_today(
 ) -> list[AlgorithmReviewItemOut]:
     """List planned algorithm review items scheduled for today or later."""
     today = date.today()
-    latest_rating = (
-        select(AlgorithmReviewAttempt.rating_1_to_5)
-        .where(
-            AlgorithmReviewAttempt.review_item_id == AlgorithmReviewItem.id,
-            AlgorithmReviewAttempt.user_id == current_user.id,
-        )
-        .order_by(AlgorithmReviewAttempt.created_at.desc())
-        .limit(1)
-        .scalar_subquery()
-    )
     rows = session.execute(
-        select(AlgorithmReviewItem, Algorithm, AlgorithmGroup, latest_rating)
+        select(AlgorithmReviewItem, Algorithm, AlgorithmGroup)
         .join(Algorithm, AlgorithmReviewItem.algorithm_id == Algorithm.id)
         .join(AlgorithmGroup, Algorithm.group_id == AlgorithmGroup.id)
         .where(
@@ -78,10 +84,65 @@ def algorithm_reviews_today(
         .order_by(AlgorithmReviewItem.due_date, AlgorithmReviewItem.id)
     ).all()
 
-    return [
-        _build_algorithm_review_item_out(item, algorithm, group, rating)
-        for item, algorithm, group, rating in rows
-    ]
+    return ModelListResponse(
+        [
+            _build_algorithm_review_item_out(item, algorithm, group, item.last_rating)
+            for item, algorithm, group in rows
+        ]
+    )
+
+
+@router.post("/algorithm-reviews/spread-overdue")
+def spread_overdue_algorithm_reviews(
+    payload: ReviewSpreadPayload,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ReviewSpreadOut:
+    """Spread overdue algorithm review items across the next days."""
+    today_date = date.today()
+    overdue_ids, due_by_day = load_spread_window(
+        session,
+        AlgorithmReviewItem,
+        current_user.id,
+        today=today_date,
+        days=payload.days,
+        lock=not payload.dry_run,
+    )
+    overdue_count = len(overdue_ids)
+    try:
+        plan = plan_spread(
+            overdue_count,
+            start_date=today_date,
+            days=payload.days,
+            daily_cap=payload.daily_cap,
+            due_by_day=due_by_day,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=422,
+            detail={"detail": str(exc), "code": "VALIDATION_ERROR"},
+        ) from exc
+
+    updated_count = 0
+    if not payload.dry_run:
+        updated_count = spread_overdue(
+            session,
+            AlgorithmReviewItem,
+            current_user.id,
+            overdue_ids=overdue_ids,
+            plan=plan,
+        )
+        session.commit()
+
+    return ReviewSpreadOut(
+        dry_run=payload.dry_run,
+        overdue_count=overdue_count,
+        updated_count=updated_count,
+        days=[
+            ReviewSpreadDayOut(due_date=due_date, count=count)
+            for due_date, count in plan
+        ],
+    )
 
 
 @router.get("/algorithm-reviews/stats")
@@ -96,70 +157,29 @@ def algorithm_review_stats(
             AlgorithmGroup.title,
             Algorithm.id,
             Algorithm.title,
-            func.count(AlgorithmReviewItem.id),
-            func.coalesce(
-                func.sum(case((AlgorithmReviewItem.status == "done", 1), else_=0)),
-                0,
-            ),
+            Algorithm.total_reviews,
+            Algorithm.completed_reviews,
+            Algorithm.gpt_attempts_total,
+            Algorithm.gpt_rating_sum,
         )
         .join(AlgorithmGroup, Algorithm.group_id == AlgorithmGroup.id)
-        .outerjoin(
-            AlgorithmReviewItem,
-            AlgorithmReviewItem.algorithm_id == Algorithm.id,
-        )
         .where(
             AlgorithmGroup.user_id == current_user.id,
             Algorithm.user_id == current_user.id,
         )
-        .group_by(
-            AlgorithmGroup.id,
-            AlgorithmGroup.title,
-            Algorithm.id,
-            Algorithm.title,
-        )
         .order_by(AlgorithmGroup.id, Algorithm.id)
     ).all()
 
-    gpt_rows = session.execute(
-        select(
-            Algorithm.id,
-            func.count(AlgorithmReviewAttempt.id),
-            func.avg(AlgorithmReviewAttempt.rating_1_to_5),
-        )
-        .join(
-            AlgorithmReviewItem,
-            AlgorithmReviewItem.algorithm_id == Algorithm.id,
-        )
-        .join(
-            AlgorithmReviewAttempt,
-            AlgorithmReviewAttempt.review_item_id == AlgorithmReviewItem.id,
-        )
-        .where(AlgorithmReviewAttempt.rating_1_to_5.is_not(None))
-        .where(
-            Algorithm.user_id == current_user.id,
-            AlgorithmReviewItem.user_id == current_user.id,
-            AlgorithmReviewAttempt.user_id == current_user.id,
-        )
-        .group_by(Algorithm.id)
-    ).all()
-
-    gpt_stats: dict[int, tuple[int, float | None]] = {}
-    for algorithm_id, attempts_total, average_rating in gpt_rows:
-        average_value = float(average_rating) if average_rating is not None else None
-        if average_value is not None:
-            average_value = round(average_value, 2)
-        gpt_stats[int(algorithm_id)] = (int(attempts_total or 0), average_value)
-
     return [
         AlgorithmReviewStatsOut(
-            group_id=int(group_id),
+            group_id=group_id,
             group_title=group_title,
-            algorithm_id=int(algorithm_id),
+            algorithm_id=algorithm_id,
             algorithm_title=algorithm_title,
-            total_reviews=int(total_reviews or 0),
-            completed_reviews=int(completed_reviews or 0),
-            gpt_attempts_total=gpt_stats.get(int(algorithm_id), (0, None))[0],
-            gpt_average_rating=gpt_stats.get(int(algorithm_id), (0, None))[1],
+            total_reviews=total_reviews,
+            completed_reviews=completed_reviews,
+            gpt_attempts_total=gpt_attempts_total,
+            gpt_average_rating=average_rating(gpt_rating_sum, gpt_attempts_total),
         )
         for (
             group_id,
@@ -168,6 +188,8 @@ def algorithm_review_stats(
             algorithm_title,
             total_reviews,
             completed_reviews,
+            gpt_attempts_total,
+            gpt_rating_sum,
         ) in rows
     ]
 
@@ -189,6 +211,7 @@ def algorithm_review_detail(
             Algorithm.user_id == current_user.id,
             AlgorithmGroup.user_id == current_user.id,
         )
+        .options(Load(Algorithm).undefer_group(ALGORITHM_CONTENT_GROUP))
         .limit(1)
     ).first()
 
@@ -199,15 +222,11 @@ def algorithm_review_detail(
         )
 
     review_item, algorithm, group = row
-    attempt = session.execute(
-        select(AlgorithmReviewAttempt)
-        .where(
-            AlgorithmReviewAttempt.review_item_id == review_id,
-            AlgorithmReviewAttempt.user_id == current_user.id,
-        )
-        .order_by(AlgorithmReviewAttempt.created_at.desc())
-        .limit(1)
-    ).scalar_one_or_none()
+    attempt = (
+        session.get(AlgorithmReviewAttempt, review_item.last_attempt_id)
+        if review_item.last_attempt_id is not None
+        else None
+    )
 
     return AlgorithmReviewDetailOut(
         id=review_item.id,
@@ -259,6 +278,8 @@ def complete_algorithm_review(
     )
     session.add(attempt)
     session.flush()
+    review_item.last_attempt_id = attempt.id
+    review_item.last_rating = None
     record_algorithm_review_theory(
         session,
         user_id=current_user.id,
@@ -268,6 +289,11 @@ def complete_algorithm_review(
         started_at=attempt.created_at,
         ended_at=review_item.completed_at,
     )
+    sync_algorithm_review_schedule(
+        session,
+        user_id=current_user.id,
+        algorithm_id=review_item.algorithm_id,
+    )
     session.commit()
 
     algorithm = session.execute(
@@ -298,6 +324,105 @@ def complete_algorithm_review(
     return _build_algorithm_review_item_out(review_item, algorithm, group)
 
 
+@router.post("/algorithm-reviews/complete-batch")
+def complete_algorithm_reviews_batch(
+    payload: AlgorithmReviewBatchCompletePayload,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> AlgorithmReviewBatchCompleteResponse:
+    """Complete many algorithm review items in a single transaction."""
+    review_ids = [entry.review_id for entry in payload.items]
+    rows = session.execute(
+        select(AlgorithmReviewItem, Algorithm, AlgorithmGroup)
+        .join(Algorithm, AlgorithmReviewItem.algorithm_id == Algorithm.id)
+        .join(AlgorithmGroup, Algorithm.group_id == AlgorithmGroup.id)
+        .where(
+            AlgorithmReviewItem.id.in_(review_ids),
+            AlgorithmReviewItem.user_id == current_user.id,
+            Algorithm.user_id == current_user.id,
+            AlgorithmGroup.user_id == current_user.id,
+        )
+    ).all()
+    rows_by_id = {item.id: (item, algorithm, group) for item, algorithm, group in rows}
+
+    completed_at = datetime.now(timezone.utc)
+    attempts: list[tuple[AlgorithmReviewItem, AlgorithmReviewAttempt]] = []
+    for entry in payload.items:
+        row = rows_by_id.get(entry.review_id)
+        if row is None:
+            continue
+        review_item = row[0]
+        review_item.status = "done"
+        review_item.completed_at = completed_at
+        attempts.append(
+            (
+                review_item,
+                AlgorithmReviewAttempt(
+                    user_id=current_user.id,
+                    review_item_id=review_item.id,
+                    answers=entry.answers,
+                    created_at=completed_at,
+                ),
+            )
+        )
+
+    if attempts:
+        session.add_all([attempt for _, attempt in attempts])
+        session.flush()
+        for review_item, attempt in attempts:
+            review_item.last_attempt_id = attempt.id
+            review_item.last_rating = None
+        record_events_bulk(
+            session,
+            [
+                {
+                    "user_id": current_user.id,
+                    "activity_kind": ACTIVITY_KIND_REVIEW_ALGORITHM_THEORY,
+                    "algorithm_id": review_item.algorithm_id,
+                    "algorithm_review_item_id": review_item.id,
+                    "algorithm_review_attempt_id": attempt.id,
+                    "started_at": completed_at,
+                    "ended_at": completed_at,
+                }
+                for review_item, attempt in attempts
+            ],
+        )
+
+        for algorithm_id in dict.fromkeys(
+            review_item.algorithm_id for review_item, _ in attempts
+        ):
+            sync_algorithm_review_schedule(
+                session,
+                user_id=current_user.id,
+                algorithm_id=algorithm_id,
+            )
+
+    results: list[AlgorithmReviewBatchCompleteResultOut] = []
+    for entry in payload.items:
+        row = rows_by_id.get(entry.review_id)
+        if row is None:
+            results.append(
+                AlgorithmReviewBatchCompleteResultOut(
+                    review_id=entry.review_id,
+                    status="not_found",
+                )
+            )
+            continue
+        results.append(
+            AlgorithmReviewBatchCompleteResultOut(
+                review_id=entry.review_id,
+                status="completed",
+                review_item=_build_algorithm_review_item_out(*row),
+            )
+        )
+    session.commit()
+
+    return AlgorithmReviewBatchCompleteResponse(
+        completed=len(attempts),
+        results=results,
+    )
+
+
 @router.post("/algorithm-reviews/{review_id}/save_gpt_feedback")
 def save_algorithm_gpt_feedback(
     review_id: int,
@@ -318,15 +443,11 @@ def save_algorithm_gpt_feedback(
             detail={"detail": "Algorithm review item not found", "code": "NOT_FOUND"},
         )
 
-    attempt = session.execute(
-        select(AlgorithmReviewAttempt)
-        .where(
-            AlgorithmReviewAttempt.review_item_id == review_id,
-            AlgorithmReviewAttempt.user_id == current_user.id,
-        )
-        .order_by(AlgorithmReviewAttempt.created_at.desc())
-        .limit(1)
-    ).scalar_one_or_none()
+    attempt = (
+        session.get(AlgorithmReviewAttempt, review_item.last_attempt_id)
+        if review_item.last_attempt_id is not None
+        else None
+    )
 
     if attempt is None:
         attempt = AlgorithmReviewAttempt(
@@ -340,6 +461,8 @@ def save_algorithm_gpt_feedback(
     gpt_payload = payload.gpt_check_result.model_dump(mode="json")
     attempt.gpt_check_json = gpt_payload
     attempt.rating_1_to_5 = payload.gpt_check_result.overall.rating_1_to_5
+    review_item.last_attempt_id = attempt.id
+    review_item.last_rating = attempt.rating_1_to_5
     upsert_algorithm_review_theory_feedback(
         session,
         user_id=current_user.id,
@@ -353,6 +476,11 @@ def save_algorithm_gpt_feedback(
         result_label=None,
         meta_json={"feedback_saved": True},
     )
+    sync_algorithm_review_schedule(
+        session,
+        user_id=current_user.id,
+        algorithm_id=review_item.algorithm_id,
+    )
     session.commit()
     session.refresh(attempt)
 
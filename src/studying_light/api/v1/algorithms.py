@@ -4,10 +4,18 @@ import logging
 from datetime import date, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Load, Session
 
 from studying_light.api.v1.deps import get_current_user
+from studying_light.api.v1.pagination import (
+    PageParams,
+    page_params,
+    page_response,
+    paginate,
+    parse_fields,
+)
+from studying_light.api.v1.responses import cached_response
 from studying_light.api.v1.schemas import (
     AlgorithmCodeSnippetOut,
     AlgorithmDetailOut,
@@ -18,16 +26,21 @@ from studying_light.api.v1.schemas import (
     ReadingPartOut,
 )
 from studying_light.api.v1.structures import AlgorithmGroupPayload
-from studying_light.db.models.algorithm import Algorithm
+from studying_light.db.models.algorithm import ALGORITHM_CONTENT_GROUP, Algorithm
 from studying_light.db.models.algorithm_code_snippet import AlgorithmCodeSnippet
 from studying_light.db.models.algorithm_group import (
     AlgorithmGroup,
     normalize_group_title,
 )
 from studying_light.db.models.algorithm_review_item import AlgorithmReviewItem
-from studying_light.db.models.reading_part import ReadingPart
+from studying_light.db.models.reading_part import (
+    READING_PART_CONTENT_GROUP,
+    ReadingPart,
+)
 from studying_light.db.models.user import User
 from studying_light.db.session import get_session
+from studying_light.services.review_scheduler import get_user_review_scheduler
+from studying_light.services.user_settings import get_settings_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -36,48 +49,52 @@ router: APIRouter = APIRouter()
 DEFAULT_INTERVALS: list[int] = [1, 7, 16, 35, 90]
 
 
-def get_or_create_group(
+def get_or_create_groups(
     session: Session,
     user: User,
-    title: str,
+    titles: list[str],
     *,
-    description: str | None = None,
-    notes: str | None = None,
-    cache: dict[str, AlgorithmGroup] | None = None,
-) -> tuple[AlgorithmGroup, bool]:
-    """Fetch a group by normalized title or create it once."""
-    normalized = normalize_group_title(title)
-    if cache is not None:
-        cached = cache.get(normalized)
-        if cached is not None:
-            return cached, False
-
-    existing = (
-        session.execute(
+    group_payload_by_norm: dict[str, AlgorithmGroupPayload] | None = None,
+) -> tuple[dict[str, AlgorithmGroup], int]:
+    """Fetch groups by normalized title and create the missing ones in bulk."""
+    titles_by_norm: dict[str, str] = {}
+    for title in titles:
+        titles_by_norm.setdefault(normalize_group_title(title), title.strip())
+    if not titles_by_norm:
+        return {}, 0
+
+    groups_by_norm = {
+        group.title_norm: group
+        for group in session.scalars(
             select(AlgorithmGroup).where(
-                AlgorithmGroup.title_norm == normalized,
                 AlgorithmGroup.user_id == user.id,
+                AlgorithmGroup.title_norm.in_(titles_by_norm),
             )
         )
-        .scalars()
-        .first()
-    )
-    if existing is not None:
-        if cache is not None:
-            cache[normalized] = existing
-        return existing, False
-
-    group = AlgorithmGroup(
-        user_id=user.id,
-        title=title.strip(),
-        description=description,
-        notes=notes,
-    )
-    session.add(group)
-    session.flush()
-    if cache is not None:
-        cache[normalized] = group
-    return group, True
+    }
+    payloads = group_payload_by_norm or {}
+    new_rows = []
+    for normalized, title in titles_by_norm.items():
+        if normalized in groups_by_norm:
+            continue
+        group_payload = payloads.get(normalized)
+        new_rows.append(
+            {
+                "user_id": user.id,
+                "title": title,
+                "title_norm": normalized,
+                "description": group_payload.description if group_payload else None,
+                "notes": group_payload.notes if group_payload else None,
+            }
+        )
+    if new_rows:
+        created_groups = session.scalars(
+            insert(AlgorithmGroup).returning(AlgorithmGroup),
+            new_rows,
+        ).all()
+        for group in created_groups:
+            groups_by_norm[group.title_norm] = group
+    return groups_by_norm, len(new_rows)
 
 
 def _get_questions_for_interval(
@@ -95,8 +112,11 @@ def _get_questions_for_interval(
 
 
 @router.get("/algorithms")
+@cached_response("algorithms", "reviews")
 def list_algorithms(
     group_id: int,
+    fields: str | None = None,
+    page: PageParams = Depends(page_params),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> list[AlgorithmListOut]:
@@ -113,6 +133,7 @@ def list_algorithms(
             detail={"detail": "Algorithm group not found", "code": "NOT_FOUND"},
         )
 
+    selected_fields = parse_fields(fields, AlgorithmListOut)
     counts_subquery = (
         select(
             AlgorithmReviewItem.algorithm_id,
@@ -122,7 +143,8 @@ def list_algorithms(
         .group_by(AlgorithmReviewItem.algorithm_id)
         .subquery()
     )
-    rows = session.execute(
+    rows, next_cursor = paginate(
+        session,
         select(
             Algorithm,
             func.coalesce(counts_subquery.c.review_items_count, 0),
@@ -131,25 +153,31 @@ def list_algorithms(
         .where(
             Algorithm.group_id == group_id,
             Algorithm.user_id == current_user.id,
-        )
-        .order_by(Algorithm.id)
-    ).all()
+        ),
+        page,
+        keys=[Algorithm.id],
+    )
 
-    return [
-        AlgorithmListOut(
-            id=algorithm.id,
-            group_id=group.id,
-            group_title=group.title,
-            title=algorithm.title,
-            summary=algorithm.summary,
-            complexity=algorithm.complexity,
-            review_items_count=int(review_items_count or 0),
-        )
-        for algorithm, review_items_count in rows
-    ]
+    return page_response(
+        [
+            AlgorithmListOut.model_construct(
+                id=algorithm.id,
+                group_id=group.id,
+                group_title=group.title,
+                title=algorithm.title,
+                summary=algorithm.summary,
+                complexity=algorithm.complexity,
+                review_items_count=int(review_items_count or 0),
+            )
+            for algorithm, review_items_count in rows
+        ],
+        next_cursor=next_cursor,
+        fields=selected_fields,
+    )
 
 
 @router.get("/algorithms/{algorithm_id}")
+@cached_response("algorithms", "reviews", "books")
 def get_algorithm_detail(
     algorithm_id: int,
     session: Session = Depends(get_session),
@@ -164,6 +192,7 @@ def get_algorithm_detail(
             Algorithm.user_id == current_user.id,
             AlgorithmGroup.user_id == current_user.id,
         )
+        .options(Load(Algorithm).undefer_group(ALGORITHM_CONTENT_GROUP))
         .limit(1)
     ).first()
 
@@ -188,10 +217,12 @@ def get_algorithm_detail(
     )
     source_part = (
         session.execute(
-            select(ReadingPart).where(
+            select(ReadingPart)
+            .where(
                 ReadingPart.id == algorithm.source_part_id,
                 ReadingPart.user_id == current_user.id,
             )
+            .options(Load(ReadingPart).undefer_group(READING_PART_CONTENT_GROUP))
         ).scalar_one_or_none()
         if algorithm.source_part_id
         else None
@@ -246,8 +277,6 @@ def import_algorithms(
         if title:
             group_payload_by_norm[normalize_group_title(title)] = group
 
-    group_cache_by_norm: dict[str, AlgorithmGroup] = {}
-    group_cache_by_id: dict[int, AlgorithmGroup] = {}
     for item in payload.algorithms:
         questions_map = item.review_questions_by_interval.root
         for interval_value in DEFAULT_INTERVALS:
@@ -260,111 +289,145 @@ def import_algorithms(
                             "review_questions_by_interval must include non-empty "
                             f"questions for interval {interval_value}"
                         ),
-                            "code": "ALGORITHM_IMPORT_INVALID",
-                        },
-                    )
-
-    groups_created = 0
-    algorithms_created = 0
-    algorithms_created_items: list[AlgorithmImportResult] = []
-    review_items_created = 0
-    base_date = date.today()
+                        "code": "ALGORITHM_IMPORT_INVALID",
+                    },
+                )
 
-    for item in payload.algorithms:
-        group: AlgorithmGroup
-        if item.group_id is not None:
-            group = group_cache_by_id.get(item.group_id)
-            if group is None:
-                group = session.execute(
-                    select(AlgorithmGroup).where(
-                        AlgorithmGroup.id == item.group_id,
-                        AlgorithmGroup.user_id == current_user.id,
-                    )
-                ).scalar_one_or_none()
-                if not group:
-                    raise HTTPException(
-                        status_code=404,
-                        detail={
-                            "detail": "Algorithm group not found",
-                            "code": "NOT_FOUND",
-                        },
-                    )
-                group_cache_by_id[item.group_id] = group
-        else:
-            group_title_new = item.group_title_new or ""
-            normalized = normalize_group_title(group_title_new)
-            group = group_cache_by_norm.get(normalized)
-            if group is None:
-                group_payload = group_payload_by_norm.get(normalized)
-                group, created = get_or_create_group(
-                    session,
-                    current_user,
-                    group_title_new,
-                    description=group_payload.description if group_payload else None,
-                    notes=group_payload.notes if group_payload else None,
-                    cache=group_cache_by_norm,
+    group_ids = {
+        item.group_id for item in payload.algorithms if item.group_id is not None
+    }
+    groups_by_id: dict[int, AlgorithmGroup] = {}
+    if group_ids:
+        groups_by_id = {
+            group.id: group
+            for group in session.scalars(
+                select(AlgorithmGroup).where(
+                    AlgorithmGroup.id.in_(group_ids),
+                    AlgorithmGroup.user_id == current_user.id,
                 )
-                if created:
-                    groups_created += 1
+            )
+        }
+        if len(groups_by_id) != len(group_ids):
+            raise HTTPException(
+                status_code=404,
+                detail={"detail": "Algorithm group not found", "code": "NOT_FOUND"},
+            )
 
-        if item.source_part_id is not None:
-            source_part = session.execute(
-                select(ReadingPart).where(
-                    ReadingPart.id == item.source_part_id,
+    source_part_ids = {
+        item.source_part_id
+        for item in payload.algorithms
+        if item.source_part_id is not None
+    }
+    if source_part_ids:
+        found_part_ids = set(
+            session.scalars(
+                select(ReadingPart.id).where(
+                    ReadingPart.id.in_(source_part_ids),
                     ReadingPart.user_id == current_user.id,
                 )
-            ).scalar_one_or_none()
-            if not source_part:
-                raise HTTPException(
-                    status_code=404,
-                    detail={"detail": "Reading part not found", "code": "NOT_FOUND"},
-                )
-        algorithm = Algorithm(
-            user_id=current_user.id,
-            group_id=group.id,
-            source_part_id=item.source_part_id,
-            title=item.title,
-            summary=item.summary,
-            when_to_use=item.when_to_use,
-            complexity=item.complexity,
-            invariants=item.invariants,
-            steps=item.steps,
-            corner_cases=item.corner_cases,
+            )
         )
-        session.add(algorithm)
-        session.flush()
-        algorithms_created += 1
+        if found_part_ids != source_part_ids:
+            raise HTTPException(
+                status_code=404,
+                detail={"detail": "Reading part not found", "code": "NOT_FOUND"},
+            )
+
+    groups_by_norm, groups_created = get_or_create_groups(
+        session,
+        current_user,
+        [
+            item.group_title_new or ""
+            for item in payload.algorithms
+            if item.group_id is None
+        ],
+        group_payload_by_norm=group_payload_by_norm,
+    )
+
+    settings = get_settings_snapshot(session, current_user.id)
+    scheduler = get_user_review_scheduler(settings)
+    initial_steps = scheduler.initial_steps(DEFAULT_INTERVALS)
+    algorithm_rows = []
+    for item in payload.algorithms:
+        if item.group_id is not None:
+            group = groups_by_id[item.group_id]
+        else:
+            group = groups_by_norm[normalize_group_title(item.group_title_new or "")]
+        questions_map = item.review_questions_by_interval.root
+        algorithm_rows.append(
+            {
+                "user_id": current_user.id,
+                "group_id": group.id,
+                "source_part_id": item.source_part_id,
+                "title": item.title,
+                "summary": item.summary,
+                "when_to_use": item.when_to_use,
+                "complexity": item.complexity,
+                "invariants": item.invariants,
+                "steps": item.steps,
+                "corner_cases": item.corner_cases,
+                "review_questions_by_interval": {
+                    str(interval_value): _get_questions_for_interval(
+                        questions_map, interval_value
+                    )
+                    for interval_value in DEFAULT_INTERVALS
+                },
+                # Review items are bulk inserted below, past the counter hooks.
+                "total_reviews": len(initial_steps),
+            }
+        )
+    # The table-level insert keeps rows with and without source_part_id in one
+    # statement (ORM bulk inserts split batches on None values).
+    algorithms_table = Algorithm.__table__
+    algorithm_ids = session.scalars(
+        insert(algorithms_table).returning(
+            algorithms_table.c.id, sort_by_parameter_order=True
+        ),
+        algorithm_rows,
+    ).all()
+
+    base_date = date.today()
+    algorithms_created_items: list[AlgorithmImportResult] = []
+    snippet_rows = []
+    review_item_rows = []
+    for item, algorithm_id, algorithm_row in zip(
+        payload.algorithms, algorithm_ids, algorithm_rows, strict=True
+    ):
         algorithms_created_items.append(
             AlgorithmImportResult(
-                algorithm_id=algorithm.id,
-                group_id=group.id,
+                algorithm_id=algorithm_id,
+                group_id=algorithm_row["group_id"],
             )
         )
-
-        snippet = AlgorithmCodeSnippet(
-            user_id=current_user.id,
-            algorithm_id=algorithm.id,
-            code_kind=item.code.code_kind,
-            language=item.code.language,
-            code_text=item.code.code_text,
-            is_reference=True,
+        snippet_rows.append(
+            {
+                "user_id": current_user.id,
+                "algorithm_id": algorithm_id,
+                "code_kind": item.code.code_kind,
+                "language": item.code.language,
+                "code_text": item.code.code_text,
+                "is_reference": True,
+            }
         )
-        session.add(snippet)
-
-        questions_map = item.review_questions_by_interval.root
-        for interval_value in DEFAULT_INTERVALS:
-            questions = _get_questions_for_interval(questions_map, interval_value)
-            review_item = AlgorithmReviewItem(
-                user_id=current_user.id,
-                algorithm_id=algorithm.id,
-                interval_days=interval_value,
-                due_date=base_date + timedelta(days=interval_value),
-                status="planned",
-                questions=questions,
+        review_questions_by_interval = algorithm_row["review_questions_by_interval"]
+        for step in initial_steps:
+            interval_value = DEFAULT_INTERVALS[step]
+            review_item_rows.append(
+                {
+                    "user_id": current_user.id,
+                    "algorithm_id": algorithm_id,
+                    "interval_days": interval_value,
+                    "due_date": base_date + timedelta(days=interval_value),
+                    "status": "planned",
+                    "questions": review_questions_by_interval[str(interval_value)],
+                }
             )
-            session.add(review_item)
-            review_items_created += 1
 
+    session.execute(insert(AlgorithmCodeSnippet), snippet_rows)
+    if review_item_rows:
+        session.execute(insert(AlgorithmReviewItem), review_item_rows)
+    algorithms_created = len(algorithm_ids)
+    review_items_created = len(review_item_rows)
     session.commit()
 
     logger.info(
@@ -19,7 +19,6 @@ from studying_light.api.v1.schemas import (
 )
 from studying_light.db.models.password_reset_request import PasswordResetRequest
 from studying_light.db.models.user import User
-from studying_light.db.models.user_settings import UserSettings
 from studying_light.db.session import get_session
 from studying_light.security import (
     create_access_token,
@@ -27,7 +26,10 @@ from studying_light.security import (
     is_legacy_sha256_hash,
     verify_password,
 )
-from studying_light.services.user_settings import build_default_settings
+from studying_light.services.user_settings import (
+    build_default_settings,
+    get_settings_snapshot,
+)
 
 router: APIRouter = APIRouter(prefix="/auth")
 
@@ -143,14 +145,14 @@ def me(
     current_user: User = Depends(get_current_user),
 ) -> AuthMeOut:
     """Return current authenticated user profile."""
-    settings = session.get(UserSettings, current_user.id)
+    settings = get_settings_snapshot(session, current_user.id)
     return AuthMeOut(
         id=current_user.id,
         email=current_user.email,
         is_active=current_user.is_active,
         is_admin=current_user.is_admin,
         must_change_password=current_user.must_change_password,
-        timezone=settings.timezone if settings else None,
+        timezone=settings.timezone if settings.persisted else None,
     )
 
 
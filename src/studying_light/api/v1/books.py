@@ -1,115 +1,78 @@
 """Book endpoints."""
 
-from uuid import UUID
-
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import delete, func, select
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from studying_light.api.v1.deps import get_current_user
-from studying_light.api.v1.schemas import BookCreate, BookStatsOut, BookUpdate
+from studying_light.api.v1.deps import conditional_get, get_current_user
+from studying_light.api.v1.pagination import (
+    PageParams,
+    page_params,
+    page_response,
+    paginate,
+    parse_fields,
+)
+from studying_light.api.v1.responses import cached_response
+from studying_light.api.v1.schemas import (
+    BookCreate,
+    BookPurgeOut,
+    BookStatsOut,
+    BookUpdate,
+)
 from studying_light.db.models.book import Book
-from studying_light.db.models.reading_part import ReadingPart
-from studying_light.db.models.review_attempt import ReviewAttempt
-from studying_light.db.models.review_schedule_item import ReviewScheduleItem
 from studying_light.db.models.user import User
 from studying_light.db.session import get_session
+from studying_light.services.book_counters import pages_read_total
+from studying_light.services.book_purge import (
+    PURGE_PENDING,
+    purge_book_in_background,
+    soft_delete_book,
+)
 
 router: APIRouter = APIRouter()
 
 
-def _collect_book_stats(
-    session: Session,
-    user_id: UUID,
-    book_ids: list[int],
-) -> tuple[dict[int, int], dict[int, tuple[int, int, int]]]:
-    """Collect aggregated reading stats for the given books."""
-    if not book_ids:
-        return {}, {}
-
-    pages_rows = session.execute(
-        select(
-            ReadingPart.book_id,
-            func.coalesce(
-                func.max(ReadingPart.page_end),
-                func.sum(ReadingPart.pages_read),
-                0,
-            ),
-        )
-        .where(ReadingPart.book_id.in_(book_ids))
-        .where(ReadingPart.user_id == user_id)
-        .group_by(ReadingPart.book_id)
-    ).all()
-    pages_by_book = {book_id: int(total or 0) for book_id, total in pages_rows}
-
-    stats_rows = session.execute(
-        select(
-            ReadingPart.book_id,
-            func.count(ReadingPart.id),
-            func.count(ReadingPart.session_seconds),
-            func.coalesce(func.sum(ReadingPart.session_seconds), 0),
-        )
-        .where(ReadingPart.book_id.in_(book_ids))
-        .where(ReadingPart.user_id == user_id)
-        .group_by(ReadingPart.book_id)
-    ).all()
-    stats_by_book: dict[int, tuple[int, int, int]] = {}
-    for book_id, parts_total, sessions_total, seconds_total in stats_rows:
-        stats_by_book[int(book_id)] = (
-            int(parts_total or 0),
-            int(sessions_total or 0),
-            int(seconds_total or 0),
-        )
-    return pages_by_book, stats_by_book
-
-
-def _build_book_stats_out(
-    book: Book,
-    pages_by_book: dict[int, int],
-    stats_by_book: dict[int, tuple[int, int, int]],
-) -> BookStatsOut:
-    """Build a book response with stats."""
-    parts_total, sessions_total, seconds_total = stats_by_book.get(
-        book.id,
-        (0, 0, 0),
-    )
-    if sessions_total == 0 and parts_total > 0:
-        sessions_total = parts_total
-    return BookStatsOut(
+def _build_book_stats_out(book: Book) -> BookStatsOut:
+    """Build a book response from its maintained counters."""
+    sessions_total = book.sessions_total
+    if sessions_total == 0 and book.parts_total > 0:
+        sessions_total = book.parts_total
+    return BookStatsOut.model_construct(
         id=book.id,
         title=book.title,
         author=book.author,
         status=book.status,
         pages_total=book.pages_total,
-        pages_read_total=pages_by_book.get(book.id, 0),
-        parts_total=parts_total,
+        pages_read_total=pages_read_total(book),
+        parts_total=book.parts_total,
         sessions_total=sessions_total,
-        reading_seconds_total=seconds_total,
+        reading_seconds_total=book.reading_seconds_total,
     )
 
 
 @router.get("/books")
+@cached_response("books")
 def list_books(
+    fields: str | None = None,
+    page: PageParams = Depends(page_params),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
+    etag: str = Depends(conditional_get),
 ) -> list[BookStatsOut]:
-    """List all books."""
-    books = (
-        session.execute(
-            select(Book)
-            .where(Book.user_id == current_user.id)
-            .order_by(Book.id)
-        )
-        .scalars()
-        .all()
-    )
-    book_ids = [book.id for book in books]
-    pages_by_book, stats_by_book = _collect_book_stats(
+    """List books one keyset page at a time."""
+    selected_fields = parse_fields(fields, BookStatsOut)
+    rows, next_cursor = paginate(
         session,
-        current_user.id,
-        book_ids,
+        select(Book).where(Book.user_id == current_user.id, Book.deleted_at.is_(None)),
+        page,
+        keys=[Book.id],
+    )
+    return page_response(
+        [_build_book_stats_out(book) for (book,) in rows],
+        next_cursor=next_cursor,
+        fields=selected_fields,
+        etag=etag,
     )
-    return [_build_book_stats_out(book, pages_by_book, stats_by_book) for book in books]
 
 
 @router.post("/books", status_code=status.HTTP_201_CREATED)
@@ -129,12 +92,7 @@ def create_book(
     session.add(book)
     session.commit()
     session.refresh(book)
-    pages_by_book, stats_by_book = _collect_book_stats(
-        session,
-        current_user.id,
-        [book.id],
-    )
-    return _build_book_stats_out(book, pages_by_book, stats_by_book)
+    return _build_book_stats_out(book)
 
 
 @router.patch("/books/{book_id}")
@@ -146,7 +104,11 @@ def update_book(
 ) -> BookStatsOut:
     """Update an existing book."""
     book = session.execute(
-        select(Book).where(Book.id == book_id, Book.user_id == current_user.id)
+        select(Book).where(
+            Book.id == book_id,
+            Book.user_id == current_user.id,
+            Book.deleted_at.is_(None),
+        )
     ).scalar_one_or_none()
     if not book:
         raise HTTPException(
@@ -173,23 +135,23 @@ def update_book(
 
     session.commit()
     session.refresh(book)
-    pages_by_book, stats_by_book = _collect_book_stats(
-        session,
-        current_user.id,
-        [book.id],
-    )
-    return _build_book_stats_out(book, pages_by_book, stats_by_book)
+    return _build_book_stats_out(book)
 
 
 @router.delete("/books/{book_id}")
 def delete_book(
     book_id: int,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> dict[str, str]:
-    """Delete a book."""
+    """Hide a book and purge its reading parts and reviews in the background."""
     book = session.execute(
-        select(Book).where(Book.id == book_id, Book.user_id == current_user.id)
+        select(Book).where(
+            Book.id == book_id,
+            Book.user_id == current_user.id,
+            Book.deleted_at.is_(None),
+        )
     ).scalar_one_or_none()
     if not book:
         raise HTTPException(
@@ -197,47 +159,29 @@ def delete_book(
             detail={"detail": "Book not found", "code": "NOT_FOUND"},
         )
 
-    part_ids = (
-        session.execute(
-            select(ReadingPart.id).where(
-                ReadingPart.book_id == book_id,
-                ReadingPart.user_id == current_user.id,
-            )
-        )
-        .scalars()
-        .all()
-    )
-    if part_ids:
-        review_item_ids = (
-            session.execute(
-                select(ReviewScheduleItem.id).where(
-                    ReviewScheduleItem.reading_part_id.in_(part_ids),
-                    ReviewScheduleItem.user_id == current_user.id,
-                )
-            )
-            .scalars()
-            .all()
+    soft_delete_book(book)
+    session.commit()
+    background_tasks.add_task(purge_book_in_background, session.get_bind(), book_id)
+    return {"status": "deleted", "purge_status": PURGE_PENDING}
+
+
+@router.get("/books/{book_id}/purge")
+def get_book_purge(
+    book_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> BookPurgeOut:
+    """Return purge progress of a deleted book."""
+    book = session.execute(
+        select(Book).where(
+            Book.id == book_id,
+            Book.user_id == current_user.id,
+            Book.deleted_at.is_not(None),
         )
-        if review_item_ids:
-            session.execute(
-                delete(ReviewAttempt).where(
-                    ReviewAttempt.review_item_id.in_(review_item_ids),
-                    ReviewAttempt.user_id == current_user.id,
-                )
-            )
-            session.execute(
-                delete(ReviewScheduleItem).where(
-                    ReviewScheduleItem.id.in_(review_item_ids),
-                    ReviewScheduleItem.user_id == current_user.id,
-                )
-            )
-        session.execute(
-            delete(ReadingPart).where(
-                ReadingPart.id.in_(part_ids),
-                ReadingPart.user_id == current_user.id,
-            )
+    ).scalar_one_or_none()
+    if not book:
+        raise HTTPException(
+            status_code=404,
+            detail={"detail": "Deleted book not found", "code": "NOT_FOUND"},
         )
-
-    session.delete(book)
-    session.commit()
-    return {"status": "deleted"}
+    return BookPurgeOut.model_validate(book)
@@ -2,11 +2,18 @@
 
 from datetime import date
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from studying_light.api.v1.deps import get_current_user
+from studying_light.api.v1.deps import conditional_get, get_current_user
+from studying_light.api.v1.pagination import (
+    NEXT_CURSOR_HEADER,
+    PageParams,
+    page_params,
+    paginate,
+)
+from studying_light.api.v1.responses import cached_response
 from studying_light.api.v1.schemas import (
     AlgorithmReviewItemOut,
     BookProgressOut,
@@ -22,6 +29,7 @@ from studying_light.db.models.reading_part import ReadingPart
 from studying_light.db.models.review_schedule_item import ReviewScheduleItem
 from studying_light.db.models.user import User
 from studying_light.db.session import get_session
+from studying_light.services.book_counters import pages_read_total
 
 router: APIRouter = APIRouter()
 
@@ -32,7 +40,7 @@ def _build_review_item_out(
     book: Book,
 ) -> ReviewItemOut:
     """Build review item response."""
-    return ReviewItemOut(
+    return ReviewItemOut.model_construct(
         id=item.id,
         reading_part_id=item.reading_part_id,
         interval_days=item.interval_days,
@@ -51,7 +59,7 @@ def _build_algorithm_review_item_out(
     group: AlgorithmGroup,
 ) -> AlgorithmReviewItemOut:
     """Build algorithm review item response."""
-    return AlgorithmReviewItemOut(
+    return AlgorithmReviewItemOut.model_construct(
         id=item.id,
         algorithm_id=item.algorithm_id,
         interval_days=item.interval_days,
@@ -63,41 +71,33 @@ def _build_algorithm_review_item_out(
     )
 
 
-@router.get("/today")
+@router.get("/today", dependencies=[Depends(conditional_get)])
+@cached_response("books", "reviews", "algorithms")
 def today(
+    response: Response,
+    overdue_page: PageParams = Depends(page_params),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> TodayResponse:
-    """Return today's reading plan and reviews."""
+    """Return today's reading plan and reviews.
+
+    `limit`/`cursor` page the overdue list, which is the only unbounded part.
+    """
     today_date = date.today()
     active_books = (
         session.execute(
             select(Book)
-            .where(Book.status == "active", Book.user_id == current_user.id)
+            .where(
+                Book.status == "active",
+                Book.user_id == current_user.id,
+                Book.deleted_at.is_(None),
+            )
             .order_by(Book.id)
         )
         .scalars()
         .all()
     )
 
-    book_ids = [book.id for book in active_books]
-    pages_by_book: dict[int, int] = {}
-    if book_ids:
-        pages_rows = session.execute(
-            select(
-                ReadingPart.book_id,
-                func.coalesce(
-                    func.max(ReadingPart.page_end),
-                    func.sum(ReadingPart.pages_read),
-                    0,
-                ),
-            )
-            .where(ReadingPart.book_id.in_(book_ids))
-            .where(ReadingPart.user_id == current_user.id)
-            .group_by(ReadingPart.book_id)
-        ).all()
-        pages_by_book = {book_id: int(total or 0) for book_id, total in pages_rows}
-
     review_rows = session.execute(
         select(ReviewScheduleItem, ReadingPart, Book)
         .join(ReadingPart, ReviewScheduleItem.reading_part_id == ReadingPart.id)
@@ -106,6 +106,7 @@ def today(
             ReviewScheduleItem.due_date == today_date,
             ReviewScheduleItem.status == "planned",
             ReviewScheduleItem.user_id == current_user.id,
+            Book.deleted_at.is_(None),
         )
         .order_by(ReviewScheduleItem.id)
     ).all()
@@ -114,7 +115,8 @@ def today(
         _build_review_item_out(item, part, book) for item, part, book in review_rows
     ]
 
-    overdue_rows = session.execute(
+    overdue_rows, next_cursor = paginate(
+        session,
         select(ReviewScheduleItem, ReadingPart, Book)
         .join(ReadingPart, ReviewScheduleItem.reading_part_id == ReadingPart.id)
         .join(Book, ReadingPart.book_id == Book.id)
@@ -122,13 +124,16 @@ def today(
             ReviewScheduleItem.due_date < today_date,
             ReviewScheduleItem.status == "planned",
             ReviewScheduleItem.user_id == current_user.id,
-        )
-        .order_by(ReviewScheduleItem.due_date, ReviewScheduleItem.id)
-    ).all()
+            Book.deleted_at.is_(None),
+        ),
+        overdue_page,
+        keys=[ReviewScheduleItem.due_date, ReviewScheduleItem.id],
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
 
     overdue_review_items = [
-        _build_review_item_out(item, part, book)
-        for item, part, book in overdue_rows
+        _build_review_item_out(item, part, book) for item, part, book in overdue_rows
     ]
 
     algorithm_review_rows = session.execute(
@@ -168,7 +173,7 @@ def today(
                 author=book.author,
                 status=book.status,
                 pages_total=book.pages_total,
-                pages_read_total=int(pages_by_book.get(book.id, 0)),
+                pages_read_total=pages_read_total(book),
             )
             for book in active_books
         ],
@@ -2,12 +2,19 @@
 
 from datetime import datetime, timezone
 
-from fastapi import Depends, Header, HTTPException
+from fastapi import Depends, Header, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
+from studying_light.api.v1.responses import (
+    NotModifiedError,
+    etag_matches,
+    generation_etag,
+)
 from studying_light.db.models.user import User
 from studying_light.db.session import get_session
 from studying_light.security import TokenValidationError, decode_access_token
+from studying_light.services import data_generation  # noqa: F401 (commit hook)
+from studying_light.services.change_tracker import set_session_user
 
 LAST_SEEN_THROTTLE_SECONDS = 60
 
@@ -55,6 +62,7 @@ def _resolve_user_from_token(session: Session, token: str) -> User:
             status_code=403,
             detail={"detail": "Account is inactive", "code": "ACCOUNT_INACTIVE"},
         )
+    set_session_user(session, user.id)
     return user
 
 
@@ -106,3 +114,20 @@ def get_current_admin_user(
             detail={"detail": "Admin access required", "code": "FORBIDDEN"},
         )
     return current_user
+
+
+def conditional_get(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+) -> str:
+    """Answer 304 while the user's data generation matches the client ETag."""
+    etag = generation_etag(
+        request,
+        user_id=current_user.id,
+        generation=current_user.data_generation,
+    )
+    if etag_matches(request, etag):
+        raise NotModifiedError(etag)
+    response.headers["ETag"] = etag
+    return etag
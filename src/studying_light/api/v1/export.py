@@ -9,14 +9,18 @@ from zipfile import ZIP_DEFLATED, ZipFile
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
 from studying_light.api.v1.deps import get_current_user
 from studying_light.db.models.book import Book
-from studying_light.db.models.reading_part import ReadingPart
+from studying_light.db.models.reading_part import (
+    READING_PART_CONTENT_GROUP,
+    ReadingPart,
+)
 from studying_light.db.models.review_schedule_item import ReviewScheduleItem
 from studying_light.db.models.user import User
 from studying_light.db.session import get_session
+from studying_light.services.review_scheduler import resolve_review_questions
 
 router: APIRouter = APIRouter()
 
@@ -69,7 +73,9 @@ def _collect_rows(session: Session, user: User) -> list[dict[str, object]]:
     rows: list[dict[str, object]] = []
     books = (
         session.execute(
-            select(Book).where(Book.user_id == user.id).order_by(Book.id)
+            select(Book)
+            .where(Book.user_id == user.id, Book.deleted_at.is_(None))
+            .order_by(Book.id)
         )
         .scalars()
         .all()
@@ -91,6 +97,7 @@ def _collect_rows(session: Session, user: User) -> list[dict[str, object]]:
             select(ReadingPart)
             .where(ReadingPart.user_id == user.id)
             .order_by(ReadingPart.id)
+            .options(undefer_group(READING_PART_CONTENT_GROUP))
         )
         .scalars()
         .all()
@@ -122,6 +129,7 @@ def _collect_rows(session: Session, user: User) -> list[dict[str, object]]:
         .scalars()
         .all()
     )
+    parts_by_id = {part.id: part for part in parts}
     for review in reviews:
         rows.append(
             {
@@ -132,7 +140,10 @@ def _collect_rows(session: Session, user: User) -> list[dict[str, object]]:
                 "due_date": review.due_date,
                 "status": review.status,
                 "completed_at": review.completed_at,
-                "questions": review.questions,
+                "questions": resolve_review_questions(
+                    review,
+                    parts_by_id.get(review.reading_part_id),
+                ),
             }
         )
     return rows
@@ -173,7 +184,9 @@ def export_zip(
     """Export data as a ZIP archive with CSV files."""
     books = (
         session.execute(
-            select(Book).where(Book.user_id == current_user.id).order_by(Book.id)
+            select(Book)
+            .where(Book.user_id == current_user.id, Book.deleted_at.is_(None))
+            .order_by(Book.id)
         )
         .scalars()
         .all()
@@ -183,6 +196,7 @@ def export_zip(
             select(ReadingPart)
             .where(ReadingPart.user_id == current_user.id)
             .order_by(ReadingPart.id)
+            .options(undefer_group(READING_PART_CONTENT_GROUP))
         )
         .scalars()
         .all()
@@ -197,6 +211,7 @@ def export_zip(
         .all()
     )
 
+    parts_by_id = {part.id: part for part in parts}
     book_rows = [
         {
             "id": book.id,
@@ -231,7 +246,10 @@ def export_zip(
             "due_date": review.due_date,
             "status": review.status,
             "completed_at": review.completed_at,
-            "questions": review.questions,
+            "questions": resolve_review_questions(
+                review,
+                parts_by_id.get(review.reading_part_id),
+            ),
         }
         for review in reviews
     ]
@@ -0,0 +1,158 @@
+"""Keyset pagination and sparse fieldsets for list endpoints."""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy import Select, and_, or_
+from sqlalchemy.orm import Session
+
+from studying_light.api.v1.responses import ModelListResponse
+
+PAGE_MAX_LIMIT = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass(frozen=True)
+class PageParams:
+    """Requested page size and decoded cursor values."""
+
+    limit: int | None
+    cursor: list[Any] | None
+
+
+def _validation_error(message: str) -> HTTPException:
+    return HTTPException(
+        status_code=422,
+        detail={"detail": message, "code": "VALIDATION_ERROR"},
+    )
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode sort key values of the last returned row as an opaque cursor."""
+    payload = [
+        value.isoformat() if isinstance(value, (date, datetime)) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Decode a cursor produced by encode_cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise _validation_error("Invalid cursor") from exc
+    if not isinstance(values, list) or not values:
+        raise _validation_error("Invalid cursor")
+    return values
+
+
+def page_params(
+    limit: int | None = Query(default=None, ge=1, le=PAGE_MAX_LIMIT),
+    cursor: str | None = None,
+) -> PageParams:
+    """Read `limit`/`cursor` query parameters."""
+    return PageParams(
+        limit=limit,
+        cursor=decode_cursor(cursor) if cursor else None,
+    )
+
+
+def parse_fields(fields: str | None, model: type[BaseModel]) -> set[str] | None:
+    """Validate a comma separated `fields=` projection against a response model."""
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested - set(model.model_fields))
+    if unknown:
+        raise _validation_error(f"Unknown fields: {', '.join(unknown)}")
+    if "id" in model.model_fields:
+        requested.add("id")
+    return requested
+
+
+def _cursor_value(key: Any, raw: Any) -> Any:
+    try:
+        python_type = key.type.python_type
+    except NotImplementedError:
+        return raw
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(raw)
+        if python_type is date:
+            return date.fromisoformat(raw)
+        if python_type is UUID:
+            return UUID(raw)
+        if python_type in (int, str) and not isinstance(raw, python_type):
+            raise TypeError(raw)
+    except (TypeError, ValueError) as exc:
+        raise _validation_error("Invalid cursor") from exc
+    return raw
+
+
+def _after_cursor(keys: Sequence[Any], values: list[Any], descending: bool) -> Any:
+    clauses = []
+    for position, key in enumerate(keys):
+        equal = [keys[index] == values[index] for index in range(position)]
+        beyond = key < values[position] if descending else key > values[position]
+        clauses.append(and_(*equal, beyond))
+    return or_(*clauses)
+
+
+def paginate(
+    session: Session,
+    stmt: Select,
+    page: PageParams,
+    *,
+    keys: Sequence[Any],
+    descending: bool = False,
+) -> tuple[list[tuple[Any, ...]], str | None]:
+    """Run a statement one keyset page at a time.
+
+    The statement is ordered by `keys` (which must end with a unique column),
+    rows after the cursor are fetched and the cursor for the next page is
+    returned when more rows remain. Without a limit every remaining row is
+    returned.
+    """
+    order = [key.desc() if descending else key.asc() for key in keys]
+    stmt = stmt.order_by(None).order_by(*order).add_columns(*keys)
+    if page.cursor is not None:
+        if len(page.cursor) != len(keys):
+            raise _validation_error("Invalid cursor")
+        values = [
+            _cursor_value(key, raw) for key, raw in zip(keys, page.cursor, strict=True)
+        ]
+        stmt = stmt.where(_after_cursor(keys, values, descending))
+    if page.limit is not None:
+        stmt = stmt.limit(page.limit + 1)
+
+    rows = session.execute(stmt).all()
+    next_cursor = None
+    if page.limit is not None and len(rows) > page.limit:
+        rows = rows[: page.limit]
+        next_cursor = encode_cursor(rows[-1][-len(keys) :])
+    return [tuple(row[: -len(keys)]) for row in rows], next_cursor
+
+
+def page_response(
+    items: Sequence[BaseModel],
+    *,
+    next_cursor: str | None,
+    fields: set[str] | None = None,
+    etag: str | None = None,
+) -> ModelListResponse:
+    """Serialize a page, applying the field projection and cursor/ETag headers."""
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    if etag is not None:
+        headers["ETag"] = etag
+    return ModelListResponse(items, fields=fields, headers=headers or None)
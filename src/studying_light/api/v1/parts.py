@@ -1,14 +1,24 @@
 """Reading part endpoints."""
 
 from datetime import date, datetime, timedelta, timezone
+from uuid import UUID
 
 from fastapi import APIRouter, Body, Depends, HTTPException, status
 from pydantic import ValidationError
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Load, Session
 
 from studying_light.api.v1.deps import get_current_user
+from studying_light.api.v1.pagination import (
+    PageParams,
+    page_params,
+    page_response,
+    paginate,
+    parse_fields,
+)
 from studying_light.api.v1.schemas import (
+    ImportGptBatchPayload,
+    ImportGptBatchResponse,
     ImportGptPayload,
     ImportGptResponse,
     ReadingPartCreate,
@@ -16,21 +26,38 @@ from studying_light.api.v1.schemas import (
     ReviewItemOut,
 )
 from studying_light.db.models.book import Book
-from studying_light.db.models.reading_part import ReadingPart
+from studying_light.db.models.reading_part import (
+    READING_PART_CONTENT_GROUP,
+    ReadingPart,
+)
+from studying_light.db.models.review_attempt import ReviewAttempt
 from studying_light.db.models.review_schedule_item import ReviewScheduleItem
 from studying_light.db.models.user import User
-from studying_light.db.models.user_settings import UserSettings
 from studying_light.db.session import get_session
 from studying_light.services.activity_tracker import record_reading_session
+from studying_light.services.book_counters import (
+    allocate_part_index,
+    record_part_created,
+)
+from studying_light.services.book_purge import book_is_visible
 from studying_light.services.gpt_json_parser import (
     GptJsonParseError,
     parse_gpt_json_output,
 )
-from studying_light.services.user_settings import DEFAULT_SETTINGS
+from studying_light.services.review_counters import rebuild_review_counters
+from studying_light.services.review_scheduler import (
+    get_user_intervals,
+    get_user_review_scheduler,
+    questions_for_interval,
+)
+from studying_light.services.user_settings import (
+    UserSettingsSnapshot,
+    get_settings_snapshot,
+)
 
 router: APIRouter = APIRouter()
 
-DEFAULT_INTERVALS: list[int] = DEFAULT_SETTINGS["intervals_days"]
+PART_CONTENT_FIELDS = {"raw_notes", "gpt_summary", "gpt_questions_by_interval"}
 
 
 def _coerce_import_payload(payload: object) -> ImportGptPayload:
@@ -70,17 +97,18 @@ def _coerce_import_payload(payload: object) -> ImportGptPayload:
         ) from exc
 
 
-def _compute_pages_read(
+def _previous_page_end(
     session: Session,
     book_id: int,
+    user_id: UUID,
     part_index: int,
-    page_end: int,
-) -> int:
-    """Compute pages read based on the last saved page."""
-    last_end = session.execute(
+) -> int | None:
+    """Return the last saved page of the parts before the given index."""
+    return session.execute(
         select(ReadingPart.page_end)
         .where(
             ReadingPart.book_id == book_id,
+            ReadingPart.user_id == user_id,
             ReadingPart.page_end.is_not(None),
             ReadingPart.part_index < part_index,
         )
@@ -88,6 +116,9 @@ def _compute_pages_read(
         .limit(1)
     ).scalar_one_or_none()
 
+
+def _compute_pages_read(page_end: int, last_end: int | None) -> int:
+    """Compute pages read based on the last saved page."""
     if last_end is None:
         return page_end
 
@@ -103,13 +134,61 @@ def _compute_pages_read(
     return page_end - last_end
 
 
+def _import_interval_values(settings: UserSettingsSnapshot) -> list[int]:
+    try:
+        return get_user_intervals(settings)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "detail": "Invalid intervals configuration",
+                "code": "IMPORT_PAYLOAD_INVALID",
+            },
+        ) from exc
+
+
+def _ensure_questions_for_intervals(
+    questions_by_interval: dict,
+    interval_values: list[int],
+) -> None:
+    for interval_value in interval_values:
+        if not questions_for_interval(questions_by_interval, interval_value):
+            raise HTTPException(
+                status_code=422,
+                detail={
+                    "detail": f"Missing questions for interval {interval_value} days",
+                    "code": "INVALID_JSON_BUSINESS_RULES",
+                },
+            )
+
+
+def _planned_intervals(
+    settings: UserSettingsSnapshot,
+    interval_values: list[int],
+) -> list[int]:
+    scheduler = get_user_review_scheduler(settings)
+    return [interval_values[step] for step in scheduler.initial_steps(interval_values)]
+
+
+def _is_reusable_schedule(
+    existing_items: list[ReviewScheduleItem],
+    planned_intervals: list[int],
+) -> bool:
+    # Questions are not copied into the items: the review view derives them
+    # from part.gpt_questions_by_interval, so an untouched schedule is reused.
+    return (
+        all(item.status == "planned" for item in existing_items)
+        and [item.interval_days for item in existing_items] == planned_intervals
+    )
+
+
 def _build_review_item_out(
     item: ReviewScheduleItem,
     part: ReadingPart,
     book: Book,
 ) -> ReviewItemOut:
     """Build review item response."""
-    return ReviewItemOut(
+    return ReviewItemOut.model_construct(
         id=item.id,
         reading_part_id=item.reading_part_id,
         interval_days=item.interval_days,
@@ -130,7 +209,11 @@ def create_part(
 ) -> ReadingPartOut:
     """Create a reading part."""
     book = session.execute(
-        select(Book).where(Book.id == payload.book_id, Book.user_id == current_user.id)
+        select(Book).where(
+            Book.id == payload.book_id,
+            Book.user_id == current_user.id,
+            Book.deleted_at.is_(None),
+        )
     ).scalar_one_or_none()
     if not book:
         raise HTTPException(
@@ -138,26 +221,25 @@ def create_part(
             detail={"detail": "Book not found", "code": "NOT_FOUND"},
         )
 
-    part_index = payload.part_index
-    if part_index is None:
-        max_index = session.execute(
-            select(func.max(ReadingPart.part_index)).where(
-                ReadingPart.book_id == payload.book_id,
-                ReadingPart.user_id == current_user.id,
-            )
-        ).scalar()
-        part_index = (max_index or 0) + 1
+    part_index, last_page_end = allocate_part_index(
+        session,
+        book.id,
+        payload.part_index,
+    )
 
     raw_notes = payload.raw_notes.model_dump() if payload.raw_notes else None
     pages_read_value = payload.pages_read
     page_end_value = payload.page_end
     if page_end_value is not None:
-        pages_read_value = _compute_pages_read(
-            session,
-            payload.book_id,
-            part_index,
-            page_end_value,
-        )
+        if payload.part_index is not None:
+            # An explicit index may land between existing parts.
+            last_page_end = _previous_page_end(
+                session,
+                book.id,
+                current_user.id,
+                part_index,
+            )
+        pages_read_value = _compute_pages_read(page_end_value, last_page_end)
 
     part = ReadingPart(
         user_id=current_user.id,
@@ -171,6 +253,7 @@ def create_part(
     )
     session.add(part)
     session.flush()
+    record_part_created(session, part)
     record_reading_session(
         session,
         user_id=current_user.id,
@@ -189,27 +272,44 @@ def create_part(
 @router.get("/parts")
 def list_parts(
     book_id: int | None = None,
+    fields: str | None = None,
+    page: PageParams = Depends(page_params),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> list[ReadingPartOut]:
-    """List reading parts for a book."""
+    """List reading parts for a book one keyset page at a time."""
     if book_id is None:
         raise HTTPException(
             status_code=400,
             detail={"detail": "book_id is required", "code": "BAD_REQUEST"},
         )
 
-    parts = (
-        session.execute(
-            select(ReadingPart)
-            .where(ReadingPart.book_id == book_id)
-            .where(ReadingPart.user_id == current_user.id)
-            .order_by(ReadingPart.part_index)
-        )
-        .scalars()
-        .all()
+    selected_fields = parse_fields(fields, ReadingPartOut)
+    stmt = (
+        select(ReadingPart)
+        .where(ReadingPart.book_id == book_id)
+        .where(ReadingPart.user_id == current_user.id)
+        .where(book_is_visible(ReadingPart.book_id))
+    )
+    if selected_fields is None or selected_fields & PART_CONTENT_FIELDS:
+        stmt = stmt.options(Load(ReadingPart).undefer_group(READING_PART_CONTENT_GROUP))
+    rows, next_cursor = paginate(
+        session,
+        stmt,
+        page,
+        keys=[ReadingPart.part_index, ReadingPart.id],
     )
-    return [ReadingPartOut.model_validate(part) for part in parts]
+    if selected_fields is None:
+        items = [ReadingPartOut.model_validate(part) for (part,) in rows]
+    else:
+        # Skip deferred content columns the projection does not ask for.
+        items = [
+            ReadingPartOut.model_construct(
+                **{name: getattr(part, name) for name in selected_fields}
+            )
+            for (part,) in rows
+        ]
+    return page_response(items, next_cursor=next_cursor, fields=selected_fields)
 
 
 @router.post("/parts/{part_id}/import_gpt")
@@ -224,6 +324,7 @@ def import_gpt(
         select(ReadingPart).where(
             ReadingPart.id == part_id,
             ReadingPart.user_id == current_user.id,
+            book_is_visible(ReadingPart.book_id),
         )
     ).scalar_one_or_none()
     if not part:
@@ -237,76 +338,216 @@ def import_gpt(
     questions_by_interval = import_payload.gpt_questions_by_interval.root
     part.gpt_questions_by_interval = questions_by_interval
 
+    settings = get_settings_snapshot(session, current_user.id)
+    base_date = part.created_at.date() if part.created_at else date.today()
+    book = session.execute(
+        select(Book).where(Book.id == part.book_id, Book.user_id == current_user.id)
+    ).scalar_one_or_none()
+    if not book:
+        raise HTTPException(
+            status_code=404,
+            detail={"detail": "Book not found", "code": "NOT_FOUND"},
+        )
+
+    interval_values = _import_interval_values(settings)
+    _ensure_questions_for_intervals(questions_by_interval, interval_values)
+    planned_intervals = _planned_intervals(settings, interval_values)
     existing_items = (
         session.execute(
-            select(ReviewScheduleItem).where(
+            select(ReviewScheduleItem)
+            .where(
                 ReviewScheduleItem.reading_part_id == part_id,
                 ReviewScheduleItem.user_id == current_user.id,
             )
+            .order_by(ReviewScheduleItem.id)
         )
         .scalars()
         .all()
     )
-    for item in existing_items:
-        session.delete(item)
+    if _is_reusable_schedule(existing_items, planned_intervals):
+        items = list(existing_items)
+        for item in items:
+            item.due_date = base_date + timedelta(days=item.interval_days)
+            item.questions = None
+    else:
+        if existing_items:
+            existing_ids = [item.id for item in existing_items]
+            session.execute(
+                delete(ReviewAttempt).where(
+                    ReviewAttempt.review_item_id.in_(existing_ids),
+                    ReviewAttempt.user_id == current_user.id,
+                )
+            )
+            session.execute(
+                delete(ReviewScheduleItem).where(
+                    ReviewScheduleItem.id.in_(existing_ids),
+                    ReviewScheduleItem.user_id == current_user.id,
+                )
+            )
+        items = [
+            ReviewScheduleItem(
+                user_id=current_user.id,
+                reading_part_id=part.id,
+                interval_days=interval_value,
+                due_date=base_date + timedelta(days=interval_value),
+                status="planned",
+            )
+            for interval_value in planned_intervals
+        ]
+        session.add_all(items)
+    session.flush()
+    if existing_items:
+        # Stale items were deleted in bulk, past the ORM counter hooks.
+        rebuild_review_counters(session, part_ids=[part.id])
+    review_items = [_build_review_item_out(item, part, book) for item in items]
+
+    session.commit()
+    session.refresh(part)
+    return ImportGptResponse(
+        reading_part=ReadingPartOut.model_validate(part),
+        review_items=review_items,
+    )
 
-    settings = session.get(UserSettings, current_user.id)
-    intervals = settings.intervals_days if settings and settings.intervals_days else []
-    if not intervals:
-        intervals = DEFAULT_INTERVALS
 
-    base_date = part.created_at.date() if part.created_at else date.today()
-    review_items: list[ReviewItemOut] = []
-    book = session.execute(
-        select(Book).where(Book.id == part.book_id, Book.user_id == current_user.id)
-    ).scalar_one_or_none()
-    if not book:
+@router.post("/parts/import_gpt_batch")
+def import_gpt_batch(
+    payload: ImportGptBatchPayload,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ImportGptBatchResponse:
+    """Import GPT summaries and questions for many reading parts at once."""
+    part_ids = [item.reading_part_id for item in payload.items]
+    parts_by_id = {
+        part.id: part
+        for part in session.execute(
+            select(ReadingPart)
+            .where(
+                ReadingPart.id.in_(part_ids),
+                ReadingPart.user_id == current_user.id,
+                book_is_visible(ReadingPart.book_id),
+            )
+            .options(Load(ReadingPart).undefer_group(READING_PART_CONTENT_GROUP))
+        ).scalars()
+    }
+    missing_part_ids = [part_id for part_id in part_ids if part_id not in parts_by_id]
+    if missing_part_ids:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "detail": f"Reading parts not found: {missing_part_ids}",
+                "code": "NOT_FOUND",
+            },
+        )
+    books_by_id = {
+        book.id: book
+        for book in session.execute(
+            select(Book).where(
+                Book.id.in_({part.book_id for part in parts_by_id.values()}),
+                Book.user_id == current_user.id,
+            )
+        ).scalars()
+    }
+    if any(part.book_id not in books_by_id for part in parts_by_id.values()):
         raise HTTPException(
             status_code=404,
             detail={"detail": "Book not found", "code": "NOT_FOUND"},
         )
 
-    try:
-        interval_values = [int(value) for value in intervals]
-    except (TypeError, ValueError) as exc:
-        raise HTTPException(
-            status_code=422,
-            detail={
-                "detail": "Invalid intervals configuration",
-                "code": "IMPORT_PAYLOAD_INVALID",
-            },
-        ) from exc
+    settings = get_settings_snapshot(session, current_user.id)
+    interval_values = _import_interval_values(settings)
+    for item in payload.items:
+        _ensure_questions_for_intervals(
+            item.gpt_questions_by_interval.root,
+            interval_values,
+        )
+    planned_intervals = _planned_intervals(settings, interval_values)
 
-    for interval_value in interval_values:
-        questions = questions_by_interval.get(interval_value)
-        if questions is None:
-            questions = questions_by_interval.get(str(interval_value))
-        if not questions:
-            raise HTTPException(
-                status_code=422,
-                detail={
-                    "detail": (
-                        f"Missing questions for interval {interval_value} days"
-                    ),
-                    "code": "INVALID_JSON_BUSINESS_RULES",
-                },
-            )
+    existing_by_part: dict[int, list[ReviewScheduleItem]] = {
+        part_id: [] for part_id in part_ids
+    }
+    for existing_item in session.execute(
+        select(ReviewScheduleItem)
+        .where(
+            ReviewScheduleItem.reading_part_id.in_(part_ids),
+            ReviewScheduleItem.user_id == current_user.id,
+        )
+        .order_by(ReviewScheduleItem.id)
+    ).scalars():
+        existing_by_part[existing_item.reading_part_id].append(existing_item)
+
+    items_by_part: dict[int, list[ReviewScheduleItem]] = {}
+    stale_item_ids: list[int] = []
+    new_rows: list[dict[str, object]] = []
+    for item in payload.items:
+        part = parts_by_id[item.reading_part_id]
+        part.gpt_summary = item.gpt_summary
+        part.gpt_questions_by_interval = item.gpt_questions_by_interval.root
+        base_date = part.created_at.date() if part.created_at else date.today()
+        existing_items = existing_by_part[part.id]
+        if _is_reusable_schedule(existing_items, planned_intervals):
+            for existing_item in existing_items:
+                existing_item.due_date = base_date + timedelta(
+                    days=existing_item.interval_days
+                )
+                existing_item.questions = None
+            items_by_part[part.id] = existing_items
+            continue
+        stale_item_ids.extend(existing_item.id for existing_item in existing_items)
+        items_by_part[part.id] = []
+        new_rows.extend(
+            {
+                "user_id": current_user.id,
+                "reading_part_id": part.id,
+                "interval_days": interval_value,
+                "due_date": base_date + timedelta(days=interval_value),
+                "status": "planned",
+            }
+            for interval_value in planned_intervals
+        )
 
-        item = ReviewScheduleItem(
-            user_id=current_user.id,
-            reading_part_id=part.id,
-            interval_days=interval_value,
-            due_date=base_date + timedelta(days=interval_value),
-            status="planned",
-            questions=questions,
+    if stale_item_ids:
+        session.execute(
+            delete(ReviewAttempt).where(
+                ReviewAttempt.review_item_id.in_(stale_item_ids),
+                ReviewAttempt.user_id == current_user.id,
+            )
+        )
+        session.execute(
+            delete(ReviewScheduleItem).where(
+                ReviewScheduleItem.id.in_(stale_item_ids),
+                ReviewScheduleItem.user_id == current_user.id,
+            )
+        )
+    if new_rows:
+        # RETURNING row order is not guaranteed without sentinel columns, so
+        # the new rows are regrouped by part and ordered by id.
+        inserted_items = session.scalars(
+            insert(ReviewScheduleItem).returning(ReviewScheduleItem),
+            new_rows,
+        ).all()
+        for inserted_item in sorted(inserted_items, key=lambda item: item.id):
+            items_by_part[inserted_item.reading_part_id].append(inserted_item)
+    session.flush()
+    if new_rows:
+        # Replaced schedules are written in bulk, past the ORM counter hooks.
+        rebuild_review_counters(
+            session,
+            part_ids={row["reading_part_id"] for row in new_rows},
         )
-        session.add(item)
-        session.flush()
-        review_items.append(_build_review_item_out(item, part, book))
 
+    results = [
+        ImportGptResponse(
+            reading_part=ReadingPartOut.model_validate(parts_by_id[part_id]),
+            review_items=[
+                _build_review_item_out(
+                    review_item,
+                    parts_by_id[part_id],
+                    books_by_id[parts_by_id[part_id].book_id],
+                )
+                for review_item in items_by_part[part_id]
+            ],
+        )
+        for part_id in part_ids
+    ]
     session.commit()
-    session.refresh(part)
-    return ImportGptResponse(
-        reading_part=ReadingPartOut.model_validate(part),
-        review_items=review_items,
-    )
+    return ImportGptBatchResponse(imported=len(results), results=results)
@@ -0,0 +1,214 @@
+"""Fast JSON responses and ETag helpers."""
+
+import hashlib
+import inspect
+import json
+from collections.abc import Callable, Mapping, Sequence
+from datetime import date
+from functools import lru_cache, wraps
+from typing import Any, get_type_hints
+from uuid import UUID
+
+from fastapi import Request, status
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
+
+from studying_light.services.response_cache import entry_tags, get_response_cache
+
+# Headers that are recomputed per request instead of replayed from the cache.
+_UNCACHED_HEADERS = frozenset({"content-length", "content-type", "etag"})
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+class ModelListResponse(Response):
+    """Serialize response models straight to JSON bytes with pydantic-core.
+
+    Skips FastAPI's response validation and `jsonable_encoder` pass; use it
+    only for items built from trusted rows (e.g. via `model_construct`).
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        items: Sequence[BaseModel],
+        *,
+        fields: set[str] | None = None,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        self.fields = fields
+        super().__init__(content=items, status_code=status_code, headers=headers)
+
+    def render(self, content: Any) -> bytes:
+        """Dump the items in one call to the rust serializer."""
+        if not content:
+            return b"[]"
+        include = {"__all__": self.fields} if self.fields is not None else None
+        return _list_adapter(type(content[0])).dump_json(content, include=include)
+
+
+def body_etag(body: bytes) -> str:
+    """Return a strong ETag derived from the response body."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether If-None-Match already names the given ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    # If-None-Match uses the weak comparison: W/ prefixes are ignored.
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def _request_target(request: Request) -> str:
+    query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+    return f"{request.url.path}?{query}"
+
+
+def generation_etag(request: Request, *, user_id: UUID, generation: int) -> str:
+    """Return a weak ETag for a GET of the user's data at a generation."""
+    # Day-relative views (e.g. /today) change at midnight without a write.
+    key = f"{user_id}:{generation}:{date.today()}:{_request_target(request)}"
+    return f'W/"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+
+class NotModifiedError(Exception):
+    """Raised by conditional GETs when the client copy is still current."""
+
+    def __init__(self, etag: str) -> None:
+        self.etag = etag
+        super().__init__(etag)
+
+
+def not_modified_response(etag: str) -> Response:
+    """Return an empty 304 response carrying the ETag."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag},
+    )
+
+
+def etag_response(
+    request: Request,
+    body: bytes,
+    *,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """Return the JSON body with an ETag, or 304 when the client has it."""
+    etag = body_etag(body)
+    response_headers = {**(headers or {}), "ETag": etag}
+    if etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=response_headers,
+        )
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=response_headers,
+    )
+
+
+def _encode_entry(headers: Mapping[str, str], body: bytes) -> bytes:
+    return json.dumps(dict(headers)).encode() + b"\n" + body
+
+
+def _decode_entry(value: bytes) -> tuple[dict[str, str], bytes]:
+    raw_headers, _, body = value.partition(b"\n")
+    return json.loads(raw_headers), body
+
+
+def cached_response(
+    *domains: str,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Serve a user's GET handler from the response cache.
+
+    Entries are keyed by handler, user, day, path and query, and are tagged
+    with the given domains so writes to them invalidate the entry. The
+    handler must take ``current_user``; ETags set by dependencies are kept
+    per request rather than replayed.
+    """
+
+    def decorate(handler: Callable[..., Any]) -> Callable[..., Any]:
+        hints = get_type_hints(handler)
+        adapter = TypeAdapter(hints["return"])
+        qualname = f"{handler.__module__}.{handler.__qualname__}"
+        names: dict[type, str] = {}
+        signature = inspect.signature(handler)
+        parameters = [
+            param.replace(annotation=hints.get(param.name, param.annotation))
+            for param in signature.parameters.values()
+        ]
+        # FastAPI injects one Request and one Response per endpoint, so reuse
+        # the handler's own parameters and add ours only when they are missing.
+        injected: list[str] = []
+        for annotation in (Request, Response):
+            name = next(
+                (param.name for param in parameters if param.annotation is annotation),
+                None,
+            )
+            if name is None:
+                name = f"cache_{annotation.__name__.lower()}"
+                injected.append(name)
+                parameters.append(
+                    inspect.Parameter(
+                        name,
+                        inspect.Parameter.KEYWORD_ONLY,
+                        annotation=annotation,
+                    )
+                )
+            names[annotation] = name
+
+        @wraps(handler)
+        def wrapper(**kwargs: Any) -> Response:
+            request = kwargs[names[Request]]
+            sub_response = kwargs[names[Response]]
+            for name in injected:
+                del kwargs[name]
+            user_id = kwargs["current_user"].id
+            cache = get_response_cache()
+            key = f"{qualname}:{user_id}:{date.today()}:{_request_target(request)}"
+            cached = cache.get(key)
+            if cached is not None:
+                headers, body = _decode_entry(cached)
+            else:
+                # Versions are read first so a write racing the handler
+                # makes the store below a no-op instead of caching stale data.
+                versions = cache.tag_versions(entry_tags(user_id, domains))
+                result = handler(**kwargs)
+                if isinstance(result, Response):
+                    if result.status_code != status.HTTP_200_OK:
+                        return result
+                    headers, body = dict(result.headers), result.body
+                else:
+                    headers, body = {}, adapter.dump_json(result)
+                headers.update(sub_response.headers)
+                headers = {
+                    header: value
+                    for header, value in headers.items()
+                    if header not in _UNCACHED_HEADERS
+                }
+                cache.set(key, _encode_entry(headers, body), versions)
+            # The sub-response carries per-request headers such as the ETag.
+            headers.update(sub_response.headers)
+            headers.pop("content-length", None)
+            return Response(
+                content=body,
+                media_type="application/json",
+                headers=headers,
+            )
+
+        wrapper.__signature__ = signature.replace(
+            parameters=parameters,
+            return_annotation=hints["return"],
+        )
+        return wrapper
+
+    return decorate
@@ -3,32 +3,67 @@
 import json
 from datetime import date, datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import case, func, select
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.orm import Load, Session
 
 from studying_light.api.v1.deps import get_current_user
+from studying_light.api.v1.pagination import (
+    PageParams,
+    page_params,
+    page_response,
+    paginate,
+    parse_fields,
+)
 from studying_light.api.v1.schemas import (
     ReviewAttemptOut,
+    ReviewBatchCompletePayload,
+    ReviewBatchCompleteResponse,
+    ReviewBatchCompleteResultOut,
     ReviewCompletePayload,
     ReviewDetailOut,
     ReviewFeedbackPayload,
+    ReviewForecastOut,
     ReviewItemOut,
     ReviewPartStatsOut,
     ReviewScheduleItemOut,
     ReviewScheduleUpdatePayload,
+    ReviewSpreadDayOut,
+    ReviewSpreadOut,
+    ReviewSpreadPayload,
 )
 from studying_light.api.v1.structures import GptReviewItem
+from studying_light.db.constants import ACTIVITY_KIND_REVIEW_THEORY
 from studying_light.db.models.book import Book
-from studying_light.db.models.reading_part import ReadingPart
+from studying_light.db.models.reading_part import (
+    READING_PART_CONTENT_GROUP,
+    ReadingPart,
+)
 from studying_light.db.models.review_attempt import ReviewAttempt
 from studying_light.db.models.review_schedule_item import ReviewScheduleItem
 from studying_light.db.models.user import User
 from studying_light.db.session import get_session
 from studying_light.services.activity_tracker import (
+    record_events_bulk,
     record_review_theory,
     upsert_review_theory_feedback,
 )
+from studying_light.services.book_purge import part_is_visible
+from studying_light.services.review_backlog import (
+    load_spread_window,
+    plan_spread,
+    spread_overdue,
+)
+from studying_light.services.review_counters import average_rating
+from studying_light.services.review_forecast import (
+    FORECAST_MAX_DAILY_CAPACITY,
+    FORECAST_MAX_DAYS,
+    get_review_forecast,
+)
+from studying_light.services.review_scheduler import (
+    resolve_review_questions,
+    sync_theory_review_schedule,
+)
 
 router: APIRouter = APIRouter()
 
@@ -58,7 +93,7 @@ def _build_review_item_out(
     gpt_rating_1_to_5: int | None = None,
 ) -> ReviewItemOut:
     """Build review item response."""
-    return ReviewItemOut(
+    return ReviewItemOut.model_construct(
         id=item.id,
         reading_part_id=item.reading_part_id,
         interval_days=item.interval_days,
@@ -74,35 +109,35 @@ def _build_review_item_out(
 
 @router.get("/reviews/today")
 def reviews_today(
+    fields: str | None = None,
+    page: PageParams = Depends(page_params),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> list[ReviewItemOut]:
     """List planned review items, including overdue ones."""
-    latest_rating = (
-        select(ReviewAttempt.gpt_rating_1_to_5)
-        .where(
-            ReviewAttempt.review_item_id == ReviewScheduleItem.id,
-            ReviewAttempt.user_id == current_user.id,
-        )
-        .order_by(ReviewAttempt.created_at.desc())
-        .limit(1)
-        .scalar_subquery()
-    )
-    rows = session.execute(
-        select(ReviewScheduleItem, ReadingPart, Book, latest_rating)
+    selected_fields = parse_fields(fields, ReviewItemOut)
+    rows, next_cursor = paginate(
+        session,
+        select(ReviewScheduleItem, ReadingPart, Book)
         .join(ReadingPart, ReviewScheduleItem.reading_part_id == ReadingPart.id)
         .join(Book, ReadingPart.book_id == Book.id)
         .where(
             ReviewScheduleItem.status == "planned",
             ReviewScheduleItem.user_id == current_user.id,
-        )
-        .order_by(ReviewScheduleItem.due_date, ReviewScheduleItem.id)
-    ).all()
+            Book.deleted_at.is_(None),
+        ),
+        page,
+        keys=[ReviewScheduleItem.due_date, ReviewScheduleItem.id],
+    )
 
-    return [
-        _build_review_item_out(item, part, book, rating)
-        for item, part, book, rating in rows
-    ]
+    return page_response(
+        [
+            _build_review_item_out(item, part, book, item.last_rating)
+            for item, part, book in rows
+        ],
+        next_cursor=next_cursor,
+        fields=selected_fields,
+    )
 
 
 @router.get("/reviews/schedule")
@@ -127,6 +162,7 @@ def review_schedule(
                 ReviewScheduleItem.status == "planned",
                 ReviewScheduleItem.due_date >= today,
                 ReviewScheduleItem.user_id == current_user.id,
+                part_is_visible(ReviewScheduleItem.reading_part_id),
             )
             .order_by(ReviewScheduleItem.due_date)
         )
@@ -158,6 +194,7 @@ def update_review_schedule(
         select(ReviewScheduleItem).where(
             ReviewScheduleItem.id == review_id,
             ReviewScheduleItem.user_id == current_user.id,
+            part_is_visible(ReviewScheduleItem.reading_part_id),
         )
     ).scalar_one_or_none()
     if not review_item:
@@ -194,6 +231,87 @@ def update_review_schedule(
     )
 
 
+@router.post("/reviews/spread-overdue")
+def spread_overdue_reviews(
+    payload: ReviewSpreadPayload,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ReviewSpreadOut:
+    """Spread overdue review items across the next days under a daily cap."""
+    today_date = date.today()
+    overdue_ids, due_by_day = load_spread_window(
+        session,
+        ReviewScheduleItem,
+        current_user.id,
+        today=today_date,
+        days=payload.days,
+        lock=not payload.dry_run,
+    )
+    overdue_count = len(overdue_ids)
+    try:
+        plan = plan_spread(
+            overdue_count,
+            start_date=today_date,
+            days=payload.days,
+            daily_cap=payload.daily_cap,
+            due_by_day=due_by_day,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=422,
+            detail={"detail": str(exc), "code": "VALIDATION_ERROR"},
+        ) from exc
+
+    updated_count = 0
+    if not payload.dry_run:
+        updated_count = spread_overdue(
+            session,
+            ReviewScheduleItem,
+            current_user.id,
+            overdue_ids=overdue_ids,
+            plan=plan,
+        )
+        session.commit()
+
+    return ReviewSpreadOut(
+        dry_run=payload.dry_run,
+        overdue_count=overdue_count,
+        updated_count=updated_count,
+        days=[
+            ReviewSpreadDayOut(due_date=due_date, count=count)
+            for due_date, count in plan
+        ],
+    )
+
+
+@router.get("/reviews/forecast")
+def review_forecast(
+    days: int = Query(default=30, ge=1, le=FORECAST_MAX_DAYS),
+    daily_capacity: int | None = Query(
+        default=None,
+        ge=1,
+        le=FORECAST_MAX_DAILY_CAPACITY,
+    ),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ReviewForecastOut:
+    """Forecast theory and algorithm review load for the coming days."""
+    try:
+        forecast = get_review_forecast(
+            session,
+            user_id=current_user.id,
+            today=date.today(),
+            days=days,
+            daily_capacity=daily_capacity,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=422,
+            detail={"detail": str(exc), "code": "VALIDATION_ERROR"},
+        ) from exc
+    return ReviewForecastOut(**forecast)
+
+
 @router.get("/reviews/stats")
 def review_stats(
     session: Session = Depends(get_session),
@@ -206,64 +324,22 @@ def review_stats(
             ReadingPart.part_index,
             ReadingPart.label,
             ReadingPart.gpt_summary,
+            ReadingPart.total_reviews,
+            ReadingPart.completed_reviews,
+            ReadingPart.gpt_attempts_total,
+            ReadingPart.gpt_rating_sum,
             Book.id,
             Book.title,
-            func.count(ReviewScheduleItem.id),
-            func.coalesce(
-                func.sum(case((ReviewScheduleItem.status == "done", 1), else_=0)),
-                0,
-            ),
         )
         .join(Book, ReadingPart.book_id == Book.id)
-        .outerjoin(
-            ReviewScheduleItem,
-            ReviewScheduleItem.reading_part_id == ReadingPart.id,
-        )
         .where(
             ReadingPart.user_id == current_user.id,
             Book.user_id == current_user.id,
-        )
-        .group_by(
-            ReadingPart.id,
-            ReadingPart.part_index,
-            ReadingPart.label,
-            ReadingPart.gpt_summary,
-            Book.id,
-            Book.title,
+            Book.deleted_at.is_(None),
         )
         .order_by(Book.id, ReadingPart.part_index)
     ).all()
 
-    gpt_rows = session.execute(
-        select(
-            ReadingPart.id,
-            func.count(ReviewAttempt.id),
-            func.avg(ReviewAttempt.gpt_rating_1_to_5),
-        )
-        .join(Book, ReadingPart.book_id == Book.id)
-        .join(
-            ReviewScheduleItem,
-            ReviewScheduleItem.reading_part_id == ReadingPart.id,
-        )
-        .join(
-            ReviewAttempt,
-            ReviewAttempt.review_item_id == ReviewScheduleItem.id,
-        )
-        .where(ReviewAttempt.gpt_rating_1_to_5.is_not(None))
-        .where(
-            ReadingPart.user_id == current_user.id,
-            ReviewScheduleItem.user_id == current_user.id,
-            ReviewAttempt.user_id == current_user.id,
-        )
-        .group_by(ReadingPart.id)
-    ).all()
-    gpt_stats: dict[int, tuple[int, float | None]] = {}
-    for part_id, attempts_total, average_rating in gpt_rows:
-        average_value = float(average_rating) if average_rating is not None else None
-        if average_value is not None:
-            average_value = round(average_value, 2)
-        gpt_stats[int(part_id)] = (int(attempts_total or 0), average_value)
-
     return [
         ReviewPartStatsOut(
             reading_part_id=part_id,
@@ -272,20 +348,22 @@ def review_stats(
             part_index=part_index,
             label=label,
             summary=summary,
-            total_reviews=int(total_reviews or 0),
-            completed_reviews=int(completed_reviews or 0),
-            gpt_attempts_total=gpt_stats.get(int(part_id), (0, None))[0],
-            gpt_average_rating=gpt_stats.get(int(part_id), (0, None))[1],
+            total_reviews=total_reviews,
+            completed_reviews=completed_reviews,
+            gpt_attempts_total=gpt_attempts_total,
+            gpt_average_rating=average_rating(gpt_rating_sum, gpt_attempts_total),
         )
         for (
             part_id,
             part_index,
             label,
             summary,
-            book_id,
-            book_title,
             total_reviews,
             completed_reviews,
+            gpt_attempts_total,
+            gpt_rating_sum,
+            book_id,
+            book_title,
         ) in rows
     ]
 
@@ -301,6 +379,7 @@ def review_detail(
         select(ReviewScheduleItem).where(
             ReviewScheduleItem.id == review_id,
             ReviewScheduleItem.user_id == current_user.id,
+            part_is_visible(ReviewScheduleItem.reading_part_id),
         )
     ).scalar_one_or_none()
     if not review_item:
@@ -310,10 +389,12 @@ def review_detail(
         )
 
     part = session.execute(
-        select(ReadingPart).where(
+        select(ReadingPart)
+        .where(
             ReadingPart.id == review_item.reading_part_id,
             ReadingPart.user_id == current_user.id,
         )
+        .options(Load(ReadingPart).undefer_group(READING_PART_CONTENT_GROUP))
     ).scalar_one_or_none()
     book = (
         session.execute(
@@ -328,7 +409,7 @@ def review_detail(
             detail={"detail": "Related book or part not found", "code": "NOT_FOUND"},
         )
 
-    questions = review_item.questions or []
+    questions = resolve_review_questions(review_item, part) or []
     if not isinstance(questions, list) or any(
         not isinstance(item, str) for item in questions
     ):
@@ -340,15 +421,11 @@ def review_detail(
             },
         )
 
-    attempt = session.execute(
-        select(ReviewAttempt)
-        .where(
-            ReviewAttempt.review_item_id == review_item.id,
-            ReviewAttempt.user_id == current_user.id,
-        )
-        .order_by(ReviewAttempt.created_at.desc())
-        .limit(1)
-    ).scalar_one_or_none()
+    attempt = (
+        session.get(ReviewAttempt, review_item.last_attempt_id)
+        if review_item.last_attempt_id is not None
+        else None
+    )
 
     gpt_feedback = None
     if attempt and attempt.gpt_check_payload:
@@ -383,6 +460,7 @@ def complete_review(
         select(ReviewScheduleItem).where(
             ReviewScheduleItem.id == review_id,
             ReviewScheduleItem.user_id == current_user.id,
+            part_is_visible(ReviewScheduleItem.reading_part_id),
         )
     ).scalar_one_or_none()
     if not review_item:
@@ -401,6 +479,8 @@ def complete_review(
     )
     session.add(attempt)
     session.flush()
+    review_item.last_attempt_id = attempt.id
+    review_item.last_rating = None
     record_review_theory(
         session,
         user_id=current_user.id,
@@ -410,6 +490,11 @@ def complete_review(
         started_at=attempt.created_at,
         ended_at=review_item.completed_at,
     )
+    sync_theory_review_schedule(
+        session,
+        user_id=current_user.id,
+        reading_part_id=review_item.reading_part_id,
+    )
     session.commit()
 
     part = session.execute(
@@ -434,6 +519,103 @@ def complete_review(
     return _build_review_item_out(review_item, part, book)
 
 
+@router.post("/reviews/complete-batch")
+def complete_reviews_batch(
+    payload: ReviewBatchCompletePayload,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ReviewBatchCompleteResponse:
+    """Complete many review items in a single transaction."""
+    review_ids = [entry.review_id for entry in payload.items]
+    rows = session.execute(
+        select(ReviewScheduleItem, ReadingPart, Book)
+        .join(ReadingPart, ReviewScheduleItem.reading_part_id == ReadingPart.id)
+        .join(Book, ReadingPart.book_id == Book.id)
+        .where(
+            ReviewScheduleItem.id.in_(review_ids),
+            ReviewScheduleItem.user_id == current_user.id,
+            ReadingPart.user_id == current_user.id,
+            Book.user_id == current_user.id,
+            Book.deleted_at.is_(None),
+        )
+    ).all()
+    rows_by_id = {item.id: (item, part, book) for item, part, book in rows}
+
+    completed_at = datetime.now(timezone.utc)
+    attempts: list[tuple[ReviewScheduleItem, ReviewAttempt]] = []
+    for entry in payload.items:
+        row = rows_by_id.get(entry.review_id)
+        if row is None:
+            continue
+        review_item = row[0]
+        review_item.status = "done"
+        review_item.completed_at = completed_at
+        attempts.append(
+            (
+                review_item,
+                ReviewAttempt(
+                    user_id=current_user.id,
+                    review_item_id=review_item.id,
+                    answers=entry.answers,
+                    created_at=completed_at,
+                ),
+            )
+        )
+
+    if attempts:
+        session.add_all([attempt for _, attempt in attempts])
+        session.flush()
+        for review_item, attempt in attempts:
+            review_item.last_attempt_id = attempt.id
+            review_item.last_rating = None
+        record_events_bulk(
+            session,
+            [
+                {
+                    "user_id": current_user.id,
+                    "activity_kind": ACTIVITY_KIND_REVIEW_THEORY,
+                    "review_item_id": review_item.id,
+                    "reading_part_id": review_item.reading_part_id,
+                    "review_attempt_id": attempt.id,
+                    "started_at": completed_at,
+                    "ended_at": completed_at,
+                }
+                for review_item, attempt in attempts
+            ],
+        )
+
+        for reading_part_id in dict.fromkeys(
+            review_item.reading_part_id for review_item, _ in attempts
+        ):
+            sync_theory_review_schedule(
+                session,
+                user_id=current_user.id,
+                reading_part_id=reading_part_id,
+            )
+
+    results: list[ReviewBatchCompleteResultOut] = []
+    for entry in payload.items:
+        row = rows_by_id.get(entry.review_id)
+        if row is None:
+            results.append(
+                ReviewBatchCompleteResultOut(
+                    review_id=entry.review_id,
+                    status="not_found",
+                )
+            )
+            continue
+        results.append(
+            ReviewBatchCompleteResultOut(
+                review_id=entry.review_id,
+                status="completed",
+                review_item=_build_review_item_out(*row),
+            )
+        )
+    session.commit()
+
+    return ReviewBatchCompleteResponse(completed=len(attempts), results=results)
+
+
 @router.post("/reviews/{review_id}/save_gpt_feedback")
 def save_gpt_feedback(
     review_id: int,
@@ -446,6 +628,7 @@ def save_gpt_feedback(
         select(ReviewScheduleItem).where(
             ReviewScheduleItem.id == review_id,
             ReviewScheduleItem.user_id == current_user.id,
+            part_is_visible(ReviewScheduleItem.reading_part_id),
         )
     ).scalar_one_or_none()
     if not review_item:
@@ -454,15 +637,11 @@ def save_gpt_feedback(
             detail={"detail": "Review item not found", "code": "NOT_FOUND"},
         )
 
-    attempt = session.execute(
-        select(ReviewAttempt)
-        .where(
-            ReviewAttempt.review_item_id == review_id,
-            ReviewAttempt.user_id == current_user.id,
-        )
-        .order_by(ReviewAttempt.created_at.desc())
-        .limit(1)
-    ).scalar_one_or_none()
+    attempt = (
+        session.get(ReviewAttempt, review_item.last_attempt_id)
+        if review_item.last_attempt_id is not None
+        else None
+    )
 
     if attempt is None:
         attempt = ReviewAttempt(
@@ -480,6 +659,8 @@ def save_gpt_feedback(
     attempt.gpt_rating_1_to_5 = rating
     attempt.gpt_score_0_to_100 = score
     attempt.gpt_verdict = verdict
+    review_item.last_attempt_id = attempt.id
+    review_item.last_rating = rating
     upsert_review_theory_feedback(
         session,
         user_id=current_user.id,
@@ -493,6 +674,11 @@ def save_gpt_feedback(
         result_label=verdict,
         meta_json={"feedback_saved": True},
     )
+    sync_theory_review_schedule(
+        session,
+        user_id=current_user.id,
+        reading_part_id=review_item.reading_part_id,
+    )
     session.commit()
     session.refresh(attempt)
 
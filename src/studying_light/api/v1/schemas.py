@@ -13,6 +13,20 @@ from studying_light.api.v1.structures import (
     GptReviewResult,
     RawNotes,
 )
+from studying_light.db.constants import REVIEW_SCHEDULERS
+
+BATCH_COMPLETE_MAX_ITEMS: int = 200
+BATCH_IMPORT_GPT_MAX_ITEMS: int = 200
+
+
+def _validate_batch_review_ids(review_ids: list[int]) -> None:
+    """Ensure a batch completion payload has a bounded set of unique ids."""
+    if not review_ids:
+        raise ValueError("items cannot be empty")
+    if len(review_ids) > BATCH_COMPLETE_MAX_ITEMS:
+        raise ValueError(f"items cannot contain more than {BATCH_COMPLETE_MAX_ITEMS}")
+    if len(set(review_ids)) != len(review_ids):
+        raise ValueError("items must reference unique review_id values")
 
 
 class BookCreate(BaseModel):
@@ -78,6 +92,17 @@ class BookStatsOut(BaseModel):
     reading_seconds_total: int
 
 
+class BookPurgeOut(BaseModel):
+    """Purge progress of a deleted book."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    deleted_at: datetime
+    purge_status: str
+    purged_rows: int
+
+
 class ReadingPartCreate(BaseModel):
     """Reading part creation payload."""
 
@@ -471,6 +496,36 @@ class ImportGptPayload(BaseModel):
         return value
 
 
+class ImportGptBatchItem(ImportGptPayload):
+    """Single reading part entry of a batch GPT import."""
+
+    reading_part_id: int
+
+
+class ImportGptBatchPayload(BaseModel):
+    """Batch GPT import payload."""
+
+    items: list[ImportGptBatchItem]
+
+    @field_validator("items")
+    @classmethod
+    def validate_items(
+        cls,
+        value: list[ImportGptBatchItem],
+    ) -> list[ImportGptBatchItem]:
+        """Ensure items are present, bounded, and unique per part."""
+        if not value:
+            raise ValueError("items cannot be empty")
+        if len(value) > BATCH_IMPORT_GPT_MAX_ITEMS:
+            raise ValueError(
+                f"items cannot contain more than {BATCH_IMPORT_GPT_MAX_ITEMS}"
+            )
+        part_ids = [item.reading_part_id for item in value]
+        if len(set(part_ids)) != len(part_ids):
+            raise ValueError("items must reference unique reading_part_id values")
+        return value
+
+
 class ReviewItemOut(BaseModel):
     """Review item response."""
 
@@ -520,6 +575,55 @@ class ReviewScheduleUpdatePayload(BaseModel):
     due_date: date
 
 
+class ReviewSpreadPayload(BaseModel):
+    """Overdue backlog redistribution payload."""
+
+    days: int
+    daily_cap: int
+    dry_run: bool = False
+
+
+class ReviewSpreadDayOut(BaseModel):
+    """Number of overdue items assigned to a single day."""
+
+    due_date: date
+    count: int
+
+
+class ReviewSpreadOut(BaseModel):
+    """Overdue backlog redistribution result."""
+
+    dry_run: bool
+    overdue_count: int
+    updated_count: int
+    days: list[ReviewSpreadDayOut]
+
+
+class ReviewForecastDayOut(BaseModel):
+    """Forecast review load for a single day."""
+
+    date: date
+    theory_due: int
+    algorithm_due: int
+    due: int
+    reviewed: int
+    backlog: int
+    expected_retention: float | None = None
+
+
+class ReviewForecastOut(BaseModel):
+    """Review workload forecast."""
+
+    start_date: date
+    days: int
+    daily_capacity: int | None = None
+    overdue_count: int
+    total_due: int
+    expected_retention: float | None = None
+    backlog_end: int
+    forecast: list[ReviewForecastDayOut]
+
+
 class ReviewPartStatsOut(BaseModel):
     """Review statistics per reading part."""
 
@@ -575,6 +679,44 @@ class ReviewCompletePayload(BaseModel):
     answers: dict
 
 
+class ReviewBatchCompleteItem(BaseModel):
+    """Single entry of a batch review completion payload."""
+
+    review_id: int
+    answers: dict
+
+
+class ReviewBatchCompletePayload(BaseModel):
+    """Batch review completion payload."""
+
+    items: list[ReviewBatchCompleteItem]
+
+    @field_validator("items")
+    @classmethod
+    def validate_items(
+        cls,
+        value: list[ReviewBatchCompleteItem],
+    ) -> list[ReviewBatchCompleteItem]:
+        """Ensure items are present, bounded, and unique."""
+        _validate_batch_review_ids([item.review_id for item in value])
+        return value
+
+
+class ReviewBatchCompleteResultOut(BaseModel):
+    """Per-item result of a batch review completion."""
+
+    review_id: int
+    status: str
+    review_item: ReviewItemOut | None = None
+
+
+class ReviewBatchCompleteResponse(BaseModel):
+    """Batch review completion response."""
+
+    completed: int
+    results: list[ReviewBatchCompleteResultOut]
+
+
 class ReviewFeedbackPayload(BaseModel):
     """Review feedback payload."""
 
@@ -600,6 +742,29 @@ class AlgorithmReviewCompletePayload(BaseModel):
     answers: dict
 
 
+class AlgorithmReviewBatchCompleteItem(BaseModel):
+    """Single entry of a batch algorithm review completion payload."""
+
+    review_id: int
+    answers: dict
+
+
+class AlgorithmReviewBatchCompletePayload(BaseModel):
+    """Batch algorithm review completion payload."""
+
+    items: list[AlgorithmReviewBatchCompleteItem]
+
+    @field_validator("items")
+    @classmethod
+    def validate_items(
+        cls,
+        value: list[AlgorithmReviewBatchCompleteItem],
+    ) -> list[AlgorithmReviewBatchCompleteItem]:
+        """Ensure items are present, bounded, and unique."""
+        _validate_batch_review_ids([item.review_id for item in value])
+        return value
+
+
 class AlgorithmReviewFeedbackPayload(BaseModel):
     """Algorithm review feedback payload."""
 
@@ -623,6 +788,13 @@ class ImportGptResponse(BaseModel):
     review_items: list[ReviewItemOut]
 
 
+class ImportGptBatchResponse(BaseModel):
+    """Batch GPT import response."""
+
+    imported: int
+    results: list[ImportGptResponse]
+
+
 class AlgorithmImportPayload(BaseModel):
     """Algorithm import payload."""
 
@@ -868,6 +1040,21 @@ class AlgorithmReviewItemOut(BaseModel):
     gpt_rating_1_to_5: int | None = None
 
 
+class AlgorithmReviewBatchCompleteResultOut(BaseModel):
+    """Per-item result of a batch algorithm review completion."""
+
+    review_id: int
+    status: str
+    review_item: AlgorithmReviewItemOut | None = None
+
+
+class AlgorithmReviewBatchCompleteResponse(BaseModel):
+    """Batch algorithm review completion response."""
+
+    completed: int
+    results: list[AlgorithmReviewBatchCompleteResultOut]
+
+
 class AlgorithmReviewDetailOut(BaseModel):
     """Algorithm review detail response."""
 
@@ -924,6 +1111,7 @@ class SettingsOut(BaseModel):
     daily_goal_weekday_min: int | None = None
     daily_goal_weekend_min: int | None = None
     intervals_days: list | None = None
+    review_scheduler: str | None = None
 
 
 class SettingsUpdate(BaseModel):
@@ -935,6 +1123,7 @@ class SettingsUpdate(BaseModel):
     daily_goal_weekday_min: int | None = None
     daily_goal_weekend_min: int | None = None
     intervals_days: list[int] | None = None
+    review_scheduler: str | None = None
 
     @field_validator("pomodoro_work_min", "pomodoro_break_min")
     @classmethod
@@ -967,3 +1156,14 @@ class SettingsUpdate(BaseModel):
         if any(interval <= 0 for interval in value):
             raise ValueError("intervals_days must be positive")
         return value
+
+    @field_validator("review_scheduler")
+    @classmethod
+    def validate_review_scheduler(cls, value: str | None) -> str | None:
+        """Ensure the review scheduler is a known one when provided."""
+        if value is None:
+            return value
+        if value not in REVIEW_SCHEDULERS:
+            allowed = ", ".join(REVIEW_SCHEDULERS)
+            raise ValueError(f"review_scheduler must be one of: {allowed}")
+        return value
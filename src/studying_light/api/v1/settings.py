@@ -3,34 +3,37 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from studying_light.api.v1.deps import get_current_user
+from studying_light.api.v1.deps import conditional_get, get_current_user
 from studying_light.api.v1.schemas import SettingsOut, SettingsUpdate
 from studying_light.db.models.user import User
 from studying_light.db.models.user_settings import UserSettings
 from studying_light.db.session import get_session
-from studying_light.services.user_settings import build_default_settings
+from studying_light.services.user_settings import (
+    build_default_settings,
+    get_settings_snapshot,
+)
 
 router: APIRouter = APIRouter()
 
+
 def _get_or_create_settings(session: Session, user: User) -> UserSettings:
     settings = session.get(UserSettings, user.id)
     if settings:
         return settings
 
+    # Created on the first update; reads serve the defaults without a row.
     settings = build_default_settings(user.id)
     session.add(settings)
-    session.commit()
-    session.refresh(settings)
     return settings
 
 
-@router.get("/settings")
+@router.get("/settings", dependencies=[Depends(conditional_get)])
 def get_settings(
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> SettingsOut:
     """Return application settings."""
-    settings = _get_or_create_settings(session, current_user)
+    settings = get_settings_snapshot(session, current_user.id)
     return SettingsOut.model_validate(settings)
 
 
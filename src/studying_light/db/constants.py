@@ -34,3 +34,10 @@ USER_ACTIVITY_SOURCES: tuple[str, ...] = (
     ACTIVITY_SOURCE_BACKFILL,
 )
 
+REVIEW_SCHEDULER_FIXED = "fixed"
+REVIEW_SCHEDULER_SM2 = "sm2"
+
+REVIEW_SCHEDULERS: tuple[str, ...] = (
+    REVIEW_SCHEDULER_FIXED,
+    REVIEW_SCHEDULER_SM2,
+)
@@ -8,6 +8,7 @@ from studying_light.db.models.algorithm_review_item import AlgorithmReviewItem
 from studying_light.db.models.algorithm_training_attempt import AlgorithmTrainingAttempt
 from studying_light.db.models.audit_log import AuditLog
 from studying_light.db.models.book import Book
+from studying_light.db.models.cache_invalidation import CacheInvalidation
 from studying_light.db.models.password_reset_request import PasswordResetRequest
 from studying_light.db.models.reading_part import ReadingPart
 from studying_light.db.models.review_attempt import ReviewAttempt
@@ -25,6 +26,7 @@ __all__ = [
     "AlgorithmTrainingAttempt",
     "AuditLog",
     "Book",
+    "CacheInvalidation",
     "PasswordResetRequest",
     "ReadingPart",
     "ReviewAttempt",
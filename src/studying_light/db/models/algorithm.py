@@ -3,11 +3,14 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, ForeignKey, String, Text, Uuid, func
+from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from studying_light.db.base import Base
 
+# Large text/JSON columns; list views only need title, summary and complexity.
+ALGORITHM_CONTENT_GROUP = "algorithm_content"
+
 
 class Algorithm(Base):
     """Algorithm entity."""
@@ -31,11 +34,33 @@ class Algorithm(Base):
     )
     title: Mapped[str] = mapped_column(String(255))
     summary: Mapped[str] = mapped_column(Text)
-    when_to_use: Mapped[str] = mapped_column(Text)
+    when_to_use: Mapped[str] = mapped_column(
+        Text,
+        deferred=True,
+        deferred_group=ALGORITHM_CONTENT_GROUP,
+    )
     complexity: Mapped[str] = mapped_column(String(64))
-    invariants: Mapped[list] = mapped_column(JSON)
-    steps: Mapped[list] = mapped_column(JSON)
-    corner_cases: Mapped[list] = mapped_column(JSON)
+    invariants: Mapped[list] = mapped_column(
+        JSON,
+        deferred=True,
+        deferred_group=ALGORITHM_CONTENT_GROUP,
+    )
+    steps: Mapped[list] = mapped_column(
+        JSON,
+        deferred=True,
+        deferred_group=ALGORITHM_CONTENT_GROUP,
+    )
+    corner_cases: Mapped[list] = mapped_column(
+        JSON,
+        deferred=True,
+        deferred_group=ALGORITHM_CONTENT_GROUP,
+    )
+    review_questions_by_interval: Mapped[dict | None] = mapped_column(
+        JSON,
+        nullable=True,
+        deferred=True,
+        deferred_group=ALGORITHM_CONTENT_GROUP,
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -46,6 +71,24 @@ class Algorithm(Base):
         onupdate=func.now(),
     )
 
+    # Review counters maintained by services.review_counters on review writes.
+    total_reviews: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    completed_reviews: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+    )
+    gpt_attempts_total: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+    )
+    gpt_rating_sum: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+    )
+
     group: Mapped["AlgorithmGroup"] = relationship(back_populates="algorithms")
     source_part: Mapped["ReadingPart"] = relationship()
     code_snippets: Mapped[list["AlgorithmCodeSnippet"]] = relationship(
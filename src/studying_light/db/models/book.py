@@ -1,8 +1,9 @@
 """Book model."""
 
 import uuid
+from datetime import datetime
 
-from sqlalchemy import ForeignKey, Integer, String, Uuid
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from studying_light.db.base import Base
@@ -24,6 +25,39 @@ class Book(Base):
     status: Mapped[str] = mapped_column(String(20), default="active")
     pages_total: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
+    # Reading counters maintained by services.book_counters on part writes.
+    parts_total: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    sessions_total: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+    )
+    reading_seconds_total: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+    )
+    pages_read_sum: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+    )
+    last_page_end: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    next_part_index: Mapped[int] = mapped_column(
+        Integer,
+        default=1,
+        server_default="1",
+    )
+
+    # Soft delete: the book is hidden at once and services.book_purge removes
+    # its rows in chunks, tracking progress in purge_status/purged_rows.
+    deleted_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    purge_status: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    purged_rows: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
     reading_parts: Mapped[list["ReadingPart"]] = relationship(
         back_populates="book",
         cascade="all, delete-orphan",
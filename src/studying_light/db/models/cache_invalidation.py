@@ -0,0 +1,25 @@
+"""Cache invalidation message model."""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Integer, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from studying_light.db.base import Base
+
+
+class CacheInvalidation(Base):
+    """Invalidation message polled by workers when LISTEN/NOTIFY is unavailable."""
+
+    __tablename__ = "cache_invalidations"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    origin: Mapped[str] = mapped_column(String(64), nullable=False)
+    channel: Mapped[str] = mapped_column(String(64), nullable=False)
+    keys: Mapped[list[str]] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+        server_default=text("CURRENT_TIMESTAMP"),
+    )
@@ -3,16 +3,36 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text, Uuid, func
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    Uuid,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from studying_light.db.base import Base
 
+# Large text/JSON columns; loaded only by views that render part content.
+READING_PART_CONTENT_GROUP = "reading_part_content"
+
 
 class ReadingPart(Base):
     """Reading part entity."""
 
     __tablename__ = "reading_parts"
+    __table_args__ = (
+        Index(
+            "ix_reading_parts_book_part_index",
+            "book_id",
+            "part_index",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[uuid.UUID] = mapped_column(
@@ -20,20 +40,53 @@ class ReadingPart(Base):
         ForeignKey("users.id"),
         index=True,
     )
-    book_id: Mapped[int] = mapped_column(ForeignKey("books.id"), index=True)
+    book_id: Mapped[int] = mapped_column(ForeignKey("books.id"))
     part_index: Mapped[int] = mapped_column(Integer)
     label: Mapped[str | None] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
     )
-    raw_notes: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-    gpt_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
-    gpt_questions_by_interval: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    raw_notes: Mapped[dict | None] = mapped_column(
+        JSON,
+        nullable=True,
+        deferred=True,
+        deferred_group=READING_PART_CONTENT_GROUP,
+    )
+    gpt_summary: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        deferred=True,
+        deferred_group=READING_PART_CONTENT_GROUP,
+    )
+    gpt_questions_by_interval: Mapped[dict | None] = mapped_column(
+        JSON,
+        nullable=True,
+        deferred=True,
+        deferred_group=READING_PART_CONTENT_GROUP,
+    )
     pages_read: Mapped[int | None] = mapped_column(Integer, nullable=True)
     session_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
     page_end: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
+    # Review counters maintained by services.review_counters on review writes.
+    total_reviews: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    completed_reviews: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+    )
+    gpt_attempts_total: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+    )
+    gpt_rating_sum: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+    )
+
     book: Mapped["Book"] = relationship(back_populates="reading_parts")
     review_items: Mapped[list["ReviewScheduleItem"]] = relationship(
         back_populates="reading_part",
@@ -3,7 +3,16 @@
 import uuid
 from datetime import date, datetime
 
-from sqlalchemy import JSON, Date, DateTime, ForeignKey, Integer, String, Uuid
+from sqlalchemy import (
+    JSON,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Uuid,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from studying_light.db.base import Base
@@ -13,6 +22,14 @@ class ReviewScheduleItem(Base):
     """Scheduled review item."""
 
     __tablename__ = "review_schedule_items"
+    __table_args__ = (
+        Index(
+            "ix_review_schedule_items_user_status_due",
+            "user_id",
+            "status",
+            "due_date",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[uuid.UUID] = mapped_column(
@@ -32,6 +49,10 @@ class ReviewScheduleItem(Base):
         nullable=True,
     )
     questions: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    # Denormalized pointer to the newest attempt, kept in sync on completion
+    # and feedback so list endpoints avoid a per-row attempts subquery.
+    last_attempt_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    last_rating: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     reading_part: Mapped["ReadingPart"] = relationship(back_populates="review_items")
     attempts: Mapped[list["ReviewAttempt"]] = relationship(
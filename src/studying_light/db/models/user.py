@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String, Uuid, text
+from sqlalchemy import Boolean, DateTime, Integer, String, Uuid, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from studying_light.db.base import Base
@@ -58,6 +58,14 @@ class User(Base):
         DateTime(timezone=True),
         nullable=True,
     )
+    # Bumped by services.data_generation on every commit that changes the
+    # user's rows; conditional GETs derive their ETag from it.
+    data_generation: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
 
     settings: Mapped["UserSettings"] = relationship(
         back_populates="user",
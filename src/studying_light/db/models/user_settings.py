@@ -24,5 +24,6 @@ class UserSettings(Base):
     daily_goal_weekday_min: Mapped[int | None] = mapped_column(Integer, nullable=True)
     daily_goal_weekend_min: Mapped[int | None] = mapped_column(Integer, nullable=True)
     intervals_days: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    review_scheduler: Mapped[str | None] = mapped_column(String(16), nullable=True)
 
     user: Mapped["User"] = relationship(back_populates="settings")
@@ -1,39 +1,78 @@
 """Application entrypoint for Studying Light."""
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
-from starlette.responses import FileResponse
+from fastapi.responses import JSONResponse, Response
 
+from studying_light.api.compression import CompressionMiddleware
 from studying_light.api.prompts import router as prompts_router
+from studying_light.api.static import (
+    REVALIDATE_CACHE_CONTROL,
+    PrecompressedStaticFiles,
+    load_spa_index,
+)
+from studying_light.api.v1.responses import NotModifiedError, not_modified_response
 from studying_light.api.v1.router import router as api_v1_router
+from studying_light.db.session import engine
+from studying_light.services.invalidation_bus import (
+    start_invalidation_bus_from_env,
+    stop_invalidation_bus,
+)
 
 logger = logging.getLogger(__name__)
 
-app: FastAPI = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Keep in-process caches of several workers in sync while serving."""
+    start_invalidation_bus_from_env(engine)
+    try:
+        yield
+    finally:
+        stop_invalidation_bus()
+
+
+app: FastAPI = FastAPI(lifespan=lifespan)
+app.add_middleware(CompressionMiddleware)
 
 STATIC_DIR: Path = Path("/app/static")
 
 app.mount(
     "/assets",
-    StaticFiles(directory=STATIC_DIR / "assets", check_dir=False),
+    PrecompressedStaticFiles(
+        directory=STATIC_DIR / "assets",
+        check_dir=False,
+        immutable_hashed_assets=True,
+    ),
     name="assets",
 )
 app.mount(
     "/landing",
-    StaticFiles(directory=STATIC_DIR / "landing", check_dir=False),
+    PrecompressedStaticFiles(directory=STATIC_DIR / "landing", check_dir=False),
     name="landing",
 )
 
 
+def _spa_index_response(request: Request) -> Response:
+    """Serve index.html from memory; it must revalidate on every load."""
+    spa_index = load_spa_index(STATIC_DIR)
+    if spa_index is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"detail": "Not Found", "code": "NOT_FOUND"},
+        )
+    return spa_index.response(request, cache_control=REVALIDATE_CACHE_CONTROL)
+
+
 @app.get("/", include_in_schema=False)
-def index() -> FileResponse:
+def index(request: Request) -> Response:
     """Serve the SPA entrypoint."""
-    return FileResponse(STATIC_DIR / "index.html")
+    return _spa_index_response(request)
 
 
 def _error_payload(
@@ -122,6 +161,12 @@ def handle_http_exception(request: Request, exc: HTTPException) -> JSONResponse:
     )
 
 
+@app.exception_handler(NotModifiedError)
+def handle_not_modified(request: Request, exc: NotModifiedError) -> Response:
+    """Return an empty 304 for conditional GETs the client already has."""
+    return not_modified_response(exc.etag)
+
+
 @app.exception_handler(Exception)
 def handle_unexpected_error(request: Request, exc: Exception) -> JSONResponse:
     """Return a generic error for unexpected failures."""
@@ -146,7 +191,7 @@ app.include_router(prompts_router)
 
 
 @app.get("/{full_path:path}", include_in_schema=False)
-def spa_fallback(full_path: str) -> FileResponse:
+def spa_fallback(full_path: str, request: Request) -> Response:
     """Serve the SPA for non-API routes."""
     if (
         full_path == "api"
@@ -158,4 +203,4 @@ def spa_fallback(full_path: str) -> FileResponse:
             status_code=404,
             detail={"detail": "Not Found", "code": "NOT_FOUND"},
         )
-    return FileResponse(STATIC_DIR / "index.html")
+    return _spa_index_response(request)
@@ -0,0 +1,88 @@
+"""Microbenchmark for GPT JSON extraction on adversarial inputs."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+from collections.abc import Callable
+
+from studying_light.services.gpt_json_parser import (
+    GptJsonParseError,
+    parse_gpt_json_output,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare the old per-bracket decoder with the span scanner."
+    )
+    parser.add_argument(
+        "--size-kb",
+        type=int,
+        default=100,
+        help="Approximate size of each adversarial input in KB (default: 100).",
+    )
+    return parser.parse_args()
+
+
+def legacy_parse(raw_output: str) -> object:
+    """Previous extraction: raw_decode on a fresh slice at every bracket."""
+    text = raw_output.strip()
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    decoder = json.JSONDecoder()
+    for start_index, char in enumerate(text):
+        if char not in "{[":
+            continue
+        try:
+            value, _ = decoder.raw_decode(text[start_index:])
+        except json.JSONDecodeError:
+            continue
+        return value
+    raise GptJsonParseError("Invalid JSON syntax")
+
+
+def _inputs(size: int) -> dict[str, str]:
+    payload = json.dumps({"gpt_summary": "ok", "gpt_questions_by_interval": {}})
+    return {
+        "nested braces": "{" * (size // 2) + "}" * (size // 2),
+        "unclosed objects": '{"a": ' * (size // 6),
+        "braces in prose": "{x} " * (size // 4) + payload,
+    }
+
+
+def _timed(parse: Callable[[str], object], text: str) -> str:
+    started = time.perf_counter()
+    try:
+        parse(text)
+        outcome = "parsed"
+    except GptJsonParseError:
+        outcome = "rejected"
+    except RecursionError:
+        outcome = "RecursionError"
+    return f"{(time.perf_counter() - started) * 1000:9.1f} ms ({outcome})"
+
+
+def main() -> int:
+    """Run both parsers on each adversarial input and log timings."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = _parse_args()
+    if args.size_kb <= 0:
+        logger.error("Invalid --size-kb: must be positive")
+        return 1
+
+    for name, text in _inputs(args.size_kb * 1024).items():
+        logger.info("%s (%s chars)", name, len(text))
+        logger.info("  legacy: %s", _timed(legacy_parse, text))
+        logger.info("  scanner: %s", _timed(parse_gpt_json_output, text))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+"""Microbenchmark for list response encoding paths."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import timeit
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from studying_light.api.v1.responses import ModelListResponse
+from studying_light.api.v1.schemas import ReviewItemOut
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare default and fast JSON encoding for review lists."
+    )
+    parser.add_argument(
+        "--items",
+        type=int,
+        default=5000,
+        help="Number of review items per response (default: 5000).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=20,
+        help="Timed runs per encoding path (default: 20).",
+    )
+    return parser.parse_args()
+
+
+def _rows(count: int) -> list[SimpleNamespace]:
+    today = date.today()
+    return [
+        SimpleNamespace(
+            id=index,
+            reading_part_id=index // 5,
+            interval_days=(1, 7, 16, 35, 90)[index % 5],
+            due_date=today + timedelta(days=index % 120),
+            status="planned",
+            book_id=index // 50,
+            book_title=f"Book {index // 50}",
+            part_index=index // 5,
+            label=f"Part {index // 5}",
+            gpt_rating_1_to_5=index % 5 + 1,
+        )
+        for index in range(count)
+    ]
+
+
+def default_path(rows: list[SimpleNamespace]) -> bytes:
+    """Validate models, then encode through FastAPI's default response path."""
+    items = [ReviewItemOut(**vars(row)) for row in rows]
+    validated = TypeAdapter(list[ReviewItemOut]).validate_python(items)
+    return JSONResponse(content=jsonable_encoder(validated)).body
+
+
+def fast_path(rows: list[SimpleNamespace]) -> bytes:
+    """Construct trusted models and dump them with pydantic-core."""
+    items = [ReviewItemOut.model_construct(**vars(row)) for row in rows]
+    return ModelListResponse(items).body
+
+
+def main() -> int:
+    """Run both encoding paths and log timings."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = _parse_args()
+    if args.items <= 0 or args.repeat <= 0:
+        logger.error("Invalid --items/--repeat: must be positive")
+        return 1
+
+    rows = _rows(args.items)
+    default_body = default_path(rows)
+    fast_body = fast_path(rows)
+    if default_body != fast_body:
+        logger.error("Encoding paths produced different JSON")
+        return 1
+    logger.info("items: %s, response bytes: %s", args.items, len(fast_body))
+    for name, func in (("default", default_path), ("fast", fast_path)):
+        best = min(
+            timeit.repeat(lambda func=func: func(rows), number=1, repeat=args.repeat)
+        )
+        logger.info("%8s: %.2f ms", name, best * 1000)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
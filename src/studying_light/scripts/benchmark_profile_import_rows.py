@@ -0,0 +1,85 @@
+"""Microbenchmark for profile import row validation."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import timeit
+
+from studying_light.services.profile_import import (
+    ReviewAttemptIn,
+    _load_rows,
+    _load_rows_with_errors,
+)
+
+logger = logging.getLogger(__name__)
+
+FILE_NAME = "data/review_attempts.json"
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare per-row and bulk validation of review_attempts.json."
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=200_000,
+        help="Number of review attempt rows (default: 200000).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timed runs per validation path (default: 3).",
+    )
+    return parser.parse_args()
+
+
+def _review_attempts_json(count: int) -> bytes:
+    rows = [
+        {
+            "legacy_id": index,
+            "review_item_legacy_id": index // 2,
+            "answers": {"Question?": f"Answer {index}"},
+            "created_at": "2026-01-08T10:00:00+00:00",
+            "gpt_check_result": None,
+            "gpt_check_payload": None,
+            "gpt_rating_1_to_5": index % 5 + 1,
+            "gpt_score_0_to_100": index % 101,
+            "gpt_verdict": "PASS",
+        }
+        for index in range(count)
+    ]
+    return json.dumps(rows).encode("utf-8")
+
+
+def main() -> int:
+    """Validate the same file with both paths and log timings."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = _parse_args()
+    if args.rows <= 0 or args.repeat <= 0:
+        logger.error("Invalid --rows/--repeat: must be positive")
+        return 1
+
+    raw = _review_attempts_json(args.rows)
+    paths = (
+        ("per-row", _load_rows_with_errors),
+        ("bulk", _load_rows),
+    )
+    logger.info("rows: %s, file bytes: %s", args.rows, len(raw))
+    for name, load in paths:
+        best = min(
+            timeit.repeat(
+                lambda load=load: load(raw, ReviewAttemptIn, FILE_NAME),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        logger.info("%8s: %.0f ms", name, best * 1000)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
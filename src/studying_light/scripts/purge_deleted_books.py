@@ -0,0 +1,30 @@
+"""CLI for finishing purges of soft-deleted books."""
+
+from __future__ import annotations
+
+import logging
+
+from studying_light.db.session import SessionLocal
+from studying_light.services.book_purge import purge_unfinished_books
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    session = SessionLocal()
+    try:
+        book_ids = purge_unfinished_books(session)
+        logger.info("Purged %s deleted books.", len(book_ids))
+        return 0
+    except Exception as exc:
+        logger.error("Purge failed: %s", exc)
+        session.rollback()
+        return 1
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
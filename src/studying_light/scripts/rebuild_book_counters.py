@@ -0,0 +1,47 @@
+"""CLI for rebuilding denormalized book reading counters."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import uuid
+
+from studying_light.db.session import SessionLocal
+from studying_light.services.book_counters import rebuild_book_counters
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Recompute book counters from reading_parts."
+    )
+    parser.add_argument(
+        "--user-id",
+        type=uuid.UUID,
+        default=None,
+        help="Only rebuild books owned by this user (default: all users).",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = _parse_args()
+
+    session = SessionLocal()
+    try:
+        updated = rebuild_book_counters(session, user_id=args.user_id)
+        session.commit()
+        logger.info("Rebuilt counters for %s books.", updated)
+        return 0
+    except Exception as exc:
+        logger.error("Rebuild failed: %s", exc)
+        session.rollback()
+        return 1
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,65 @@
+"""CLI for checking and rebuilding denormalized review counters."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import uuid
+
+from studying_light.db.session import SessionLocal
+from studying_light.services.review_counters import (
+    find_review_counter_drift,
+    rebuild_review_counters,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Check or recompute part and algorithm review counters."
+    )
+    parser.add_argument(
+        "--user-id",
+        type=uuid.UUID,
+        default=None,
+        help="Only process rows owned by this user (default: all users).",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report counters that drifted; exit with 1 if any did.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = _parse_args()
+
+    session = SessionLocal()
+    try:
+        drift = find_review_counter_drift(session, user_id=args.user_id)
+        for track, parent_id in drift:
+            logger.info("Counter drift: %s %s", track, parent_id)
+        if args.check:
+            logger.info("Found %s parents with drifted counters.", len(drift))
+            return 1 if drift else 0
+        updated = rebuild_review_counters(session, user_id=args.user_id)
+        session.commit()
+        logger.info(
+            "Rebuilt counters for %s parents (%s had drifted).",
+            updated,
+            len(drift),
+        )
+        return 0
+    except Exception as exc:
+        logger.error("Rebuild failed: %s", exc)
+        session.rollback()
+        return 1
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy import select
@@ -20,6 +22,13 @@ from studying_light.db.constants import (
 )
 from studying_light.db.models.user_activity_event import UserActivityEvent
 
+NATURAL_REF_COLUMNS: tuple[str, ...] = (
+    "reading_part_id",
+    "review_attempt_id",
+    "algorithm_review_attempt_id",
+    "algorithm_training_attempt_id",
+)
+
 TRAINING_MODE_TO_ACTIVITY_KIND: dict[str, str] = {
     "typing": ACTIVITY_KIND_ALGORITHM_TRAINING_TYPING,
     "memory": ACTIVITY_KIND_ALGORITHM_TRAINING_MEMORY,
@@ -147,6 +156,98 @@ def record_event(
     return event
 
 
+def _natural_ref(values: dict[str, Any]) -> tuple[str, int] | None:
+    for column_name in NATURAL_REF_COLUMNS:
+        value = values.get(column_name)
+        if value is not None:
+            return column_name, value
+    return None
+
+
+def _find_existing_events_by_natural_refs(
+    session: Session,
+    refs: set[tuple[str, str, int]],
+) -> dict[tuple[str, str, int], UserActivityEvent]:
+    values_by_group: dict[tuple[str, str], set[int]] = {}
+    for activity_kind, column_name, value in refs:
+        values_by_group.setdefault((activity_kind, column_name), set()).add(value)
+
+    existing: dict[tuple[str, str, int], UserActivityEvent] = {}
+    for (activity_kind, column_name), values in values_by_group.items():
+        column = getattr(UserActivityEvent, column_name)
+        events = session.execute(
+            select(UserActivityEvent)
+            .where(
+                UserActivityEvent.activity_kind == activity_kind,
+                column.in_(values),
+            )
+            .order_by(UserActivityEvent.id.desc())
+        ).scalars()
+        for event in events:
+            existing.setdefault(
+                (activity_kind, column_name, getattr(event, column_name)),
+                event,
+            )
+    return existing
+
+
+def record_events_bulk(
+    session: Session,
+    events: Sequence[dict[str, Any]],
+) -> list[UserActivityEvent]:
+    """Add many activity events to the current DB transaction at once.
+
+    Each entry holds the keyword arguments accepted by ``record_event``. Events
+    whose natural ref already exists (or repeats inside the batch) reuse the
+    existing row, the rest are flushed under a single savepoint.
+    """
+    if not events:
+        return []
+    for values in events:
+        duration_sec = values.get("duration_sec")
+        if duration_sec is not None and duration_sec < 0:
+            raise ValueError("duration_sec must be non-negative")
+
+    refs: list[tuple[str, str, int] | None] = []
+    for values in events:
+        natural_ref = _natural_ref(values)
+        refs.append(
+            (values["activity_kind"], *natural_ref) if natural_ref else None
+        )
+    resolved = _find_existing_events_by_natural_refs(
+        session,
+        {ref for ref in refs if ref is not None},
+    )
+
+    results: list[UserActivityEvent] = []
+    new_events: list[UserActivityEvent] = []
+    for values, ref in zip(events, refs, strict=True):
+        event = resolved.get(ref) if ref is not None else None
+        if event is None:
+            event = UserActivityEvent(
+                **{
+                    "status": ACTIVITY_STATUS_COMPLETED,
+                    "source": ACTIVITY_SOURCE_LIVE,
+                    **values,
+                }
+            )
+            new_events.append(event)
+            if ref is not None:
+                resolved[ref] = event
+        results.append(event)
+
+    if not new_events:
+        return results
+    try:
+        with session.begin_nested():
+            session.add_all(new_events)
+            session.flush()
+    except IntegrityError:
+        return [record_event(session, **values) for values in events]
+
+    return results
+
+
 def record_reading_session(
     session: Session,
     *,
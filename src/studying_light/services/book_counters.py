@@ -0,0 +1,108 @@
+"""Maintain denormalized reading counters on books."""
+
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import ColumnElement, ScalarSelect, case, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from studying_light.db.models.book import Book
+from studying_light.db.models.reading_part import ReadingPart
+
+
+def pages_read_total(book: Book) -> int:
+    """Return pages read: the furthest saved page or the sum of pages read."""
+    if book.last_page_end is not None:
+        return book.last_page_end
+    return book.pages_read_sum
+
+
+def allocate_part_index(
+    session: Session,
+    book_id: int,
+    part_index: int | None = None,
+) -> tuple[int, int | None]:
+    """Reserve a part index on the book row and return it with the last page.
+
+    The ``UPDATE ... RETURNING`` locks the book row until commit, so concurrent
+    creations get distinct indexes and see each other's ``last_page_end``.
+    """
+    if part_index is None:
+        next_part_index = Book.next_part_index + 1
+    else:
+        next_part_index = case(
+            (Book.next_part_index > part_index, Book.next_part_index),
+            else_=part_index + 1,
+        )
+    allocated, last_page_end = session.execute(
+        update(Book)
+        .where(Book.id == book_id)
+        .values(next_part_index=next_part_index)
+        .returning(Book.next_part_index, Book.last_page_end)
+        .execution_options(synchronize_session=False)
+    ).one()
+    if part_index is None:
+        part_index = allocated - 1
+    return part_index, last_page_end
+
+
+def record_part_created(session: Session, part: ReadingPart) -> None:
+    """Add a newly inserted reading part to its book counters."""
+    values = {
+        "parts_total": Book.parts_total + 1,
+        "sessions_total": Book.sessions_total
+        + (0 if part.session_seconds is None else 1),
+        "reading_seconds_total": Book.reading_seconds_total
+        + (part.session_seconds or 0),
+        "pages_read_sum": Book.pages_read_sum + (part.pages_read or 0),
+    }
+    if part.page_end is not None:
+        values["last_page_end"] = case(
+            (
+                or_(Book.last_page_end.is_(None), Book.last_page_end < part.page_end),
+                part.page_end,
+            ),
+            else_=Book.last_page_end,
+        )
+    session.execute(
+        update(Book)
+        .where(Book.id == part.book_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _part_aggregate(expression: ColumnElement[int]) -> ScalarSelect[int]:
+    return (
+        select(expression)
+        .where(ReadingPart.book_id == Book.id)
+        .correlate(Book)
+        .scalar_subquery()
+    )
+
+
+def rebuild_book_counters(
+    session: Session,
+    *,
+    user_id: uuid.UUID | None = None,
+) -> int:
+    """Recompute book counters from reading parts and return updated books."""
+    stmt = update(Book).values(
+        parts_total=_part_aggregate(func.count(ReadingPart.id)),
+        sessions_total=_part_aggregate(func.count(ReadingPart.session_seconds)),
+        reading_seconds_total=_part_aggregate(
+            func.coalesce(func.sum(ReadingPart.session_seconds), 0)
+        ),
+        pages_read_sum=_part_aggregate(
+            func.coalesce(func.sum(ReadingPart.pages_read), 0)
+        ),
+        last_page_end=_part_aggregate(func.max(ReadingPart.page_end)),
+        next_part_index=_part_aggregate(
+            func.coalesce(func.max(ReadingPart.part_index), 0) + 1
+        ),
+    )
+    if user_id is not None:
+        stmt = stmt.where(Book.user_id == user_id)
+    result = session.execute(stmt.execution_options(synchronize_session=False))
+    return int(result.rowcount or 0)
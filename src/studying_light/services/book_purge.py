@@ -0,0 +1,169 @@
+"""Soft deletion of books and chunked purge of their dependent rows."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy import ColumnElement, Engine, delete, exists, select, update
+from sqlalchemy.orm import Session, aliased
+
+from studying_light.db.models.algorithm import Algorithm
+from studying_light.db.models.book import Book
+from studying_light.db.models.reading_part import ReadingPart
+from studying_light.db.models.review_attempt import ReviewAttempt
+from studying_light.db.models.review_schedule_item import ReviewScheduleItem
+
+logger = logging.getLogger(__name__)
+
+PURGE_PENDING = "pending"
+PURGE_RUNNING = "running"
+PURGE_FAILED = "failed"
+PURGE_DONE = "done"
+PURGE_UNFINISHED_STATUSES = (PURGE_PENDING, PURGE_RUNNING, PURGE_FAILED)
+
+# Reading parts per purge transaction; attempts and review items follow them.
+PURGE_CHUNK_SIZE = 200
+
+
+def book_is_visible(book_id: ColumnElement[int]) -> ColumnElement[bool]:
+    """Match rows whose book has not been soft-deleted."""
+    book = aliased(Book)
+    return exists().where(book.id == book_id, book.deleted_at.is_(None))
+
+
+def part_is_visible(part_id: ColumnElement[int]) -> ColumnElement[bool]:
+    """Match rows whose reading part belongs to a book that is not deleted."""
+    part = aliased(ReadingPart)
+    return exists().where(part.id == part_id, book_is_visible(part.book_id))
+
+
+def review_item_is_visible(item_id: ColumnElement[int]) -> ColumnElement[bool]:
+    """Match rows whose review item belongs to a book that is not deleted."""
+    item = aliased(ReviewScheduleItem)
+    return exists().where(item.id == item_id, part_is_visible(item.reading_part_id))
+
+
+def soft_delete_book(book: Book) -> None:
+    """Hide a book immediately and queue its rows for purging."""
+    book.deleted_at = datetime.now(timezone.utc)
+    book.purge_status = PURGE_PENDING
+    book.purged_rows = 0
+
+
+def _purge_part_chunk(session: Session, part_ids: list[int]) -> int:
+    """Delete review data of the given parts, then the parts themselves."""
+    item_ids = select(ReviewScheduleItem.id).where(
+        ReviewScheduleItem.reading_part_id.in_(part_ids)
+    )
+    results = [
+        session.execute(
+            delete(ReviewAttempt).where(ReviewAttempt.review_item_id.in_(item_ids))
+        ),
+        session.execute(
+            delete(ReviewScheduleItem).where(
+                ReviewScheduleItem.reading_part_id.in_(part_ids)
+            )
+        ),
+    ]
+    # Algorithms outlive the book they were extracted from.
+    session.execute(
+        update(Algorithm)
+        .where(Algorithm.source_part_id.in_(part_ids))
+        .values(source_part_id=None)
+        .execution_options(synchronize_session=False)
+    )
+    results.append(
+        session.execute(delete(ReadingPart).where(ReadingPart.id.in_(part_ids)))
+    )
+    return sum(int(result.rowcount or 0) for result in results)
+
+
+def purge_book(
+    session: Session,
+    book_id: int,
+    *,
+    chunk_size: int = PURGE_CHUNK_SIZE,
+) -> int:
+    """Delete a soft-deleted book's rows in id-ordered chunks, one per commit."""
+    book = session.get(Book, book_id)
+    if book is None or book.deleted_at is None or book.purge_status == PURGE_DONE:
+        return 0
+    book.purge_status = PURGE_RUNNING
+    session.commit()
+
+    purged = 0
+    last_part_id = 0
+    while True:
+        part_ids = list(
+            session.scalars(
+                select(ReadingPart.id)
+                .where(ReadingPart.book_id == book_id, ReadingPart.id > last_part_id)
+                .order_by(ReadingPart.id)
+                .limit(chunk_size)
+            )
+        )
+        if not part_ids:
+            break
+        chunk_rows = _purge_part_chunk(session, part_ids)
+        session.execute(
+            update(Book)
+            .where(Book.id == book_id)
+            .values(purged_rows=Book.purged_rows + chunk_rows)
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        purged += chunk_rows
+        last_part_id = part_ids[-1]
+
+    session.execute(
+        update(Book)
+        .where(Book.id == book_id)
+        .values(
+            purge_status=PURGE_DONE,
+            parts_total=0,
+            sessions_total=0,
+            reading_seconds_total=0,
+            pages_read_sum=0,
+            last_page_end=None,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    session.commit()
+    return purged
+
+
+def purge_book_in_background(bind: Engine, book_id: int) -> None:
+    """Run a purge in its own session and record failures on the book."""
+    with Session(bind=bind, autoflush=False) as session:
+        try:
+            purged = purge_book(session, book_id)
+        except Exception:
+            logger.exception("Book purge failed", extra={"book_id": book_id})
+            session.rollback()
+            session.execute(
+                update(Book)
+                .where(Book.id == book_id)
+                .values(purge_status=PURGE_FAILED)
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+            return
+    logger.info("Purged book", extra={"book_id": book_id, "purged_rows": purged})
+
+
+def purge_unfinished_books(session: Session) -> list[int]:
+    """Resume purges that were interrupted or failed and return their book ids."""
+    book_ids = list(
+        session.scalars(
+            select(Book.id)
+            .where(
+                Book.deleted_at.is_not(None),
+                Book.purge_status.in_(PURGE_UNFINISHED_STATUSES),
+            )
+            .order_by(Book.id)
+        )
+    )
+    for book_id in book_ids:
+        purge_book(session, book_id)
+    return book_ids
@@ -0,0 +1,119 @@
+"""Per-transaction tracking of changed (table, user) pairs for caches.
+
+One set of session listeners records which users' rows each transaction
+touched and hands the result to registered callbacks, so caches and
+generation counters share one set of tracking rules instead of each adding
+its own listeners.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+# Table name -> ids of users whose rows changed; None stands for every user.
+Changes = dict[str, set[uuid.UUID | None]]
+BeforeCommitCallback = Callable[[Session, Changes], None]
+AfterCommitCallback = Callable[[Changes], None]
+TransactionEndCallback = Callable[[Session], None]
+
+_SESSION_USER_KEY = "change_tracker_session_user"
+_CHANGES_KEY = "change_tracker_changes"
+
+_before_commit_callbacks: list[BeforeCommitCallback] = []
+_after_commit_callbacks: list[AfterCommitCallback] = []
+_transaction_end_callbacks: list[TransactionEndCallback] = []
+
+
+def set_session_user(session: Session, user_id: uuid.UUID) -> None:
+    """Remember whose request the session serves, for bulk statements."""
+    session.info[_SESSION_USER_KEY] = user_id
+
+
+def get_session_user(session: Session) -> uuid.UUID | None:
+    """Return the user whose request the session serves, if known."""
+    return session.info.get(_SESSION_USER_KEY)
+
+
+def on_before_commit(callback: BeforeCommitCallback) -> BeforeCommitCallback:
+    """Call ``callback`` inside the transaction with its flushed changes."""
+    _before_commit_callbacks.append(callback)
+    return callback
+
+
+def on_after_commit(callback: AfterCommitCallback) -> AfterCommitCallback:
+    """Call ``callback`` with the changes of each committed transaction."""
+    _after_commit_callbacks.append(callback)
+    return callback
+
+
+def on_transaction_end(callback: TransactionEndCallback) -> TransactionEndCallback:
+    """Call ``callback`` after every commit or rollback of a session."""
+    _transaction_end_callbacks.append(callback)
+    return callback
+
+
+def _record(session: Session, table_name: str, user_id: uuid.UUID | None) -> None:
+    changes = session.info.setdefault(_CHANGES_KEY, {})
+    changes.setdefault(table_name, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_rows(session: Session, flush_context: Any) -> None:
+    # Pending changes are still listed here; a rolled back transaction drops
+    # them in _forget_after_rollback.
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        user_id = getattr(instance, "user_id", None)
+        if user_id is None:
+            continue
+        if instance in session.dirty and not session.is_modified(instance):
+            continue
+        _record(session, instance.__table__.name, user_id)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_statements(orm_execute_state: ORMExecuteState) -> None:
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    table = orm_execute_state.statement.table
+    if "user_id" not in table.c:
+        return
+    session = orm_execute_state.session
+    # Bulk statements do not expose affected users; charge the request's user,
+    # or every user outside a request.
+    _record(session, table.name, get_session_user(session))
+
+
+@event.listens_for(Session, "before_commit")
+def _before_commit(session: Session) -> None:
+    # Flush first so callbacks see, and write within, the whole transaction.
+    session.flush()
+    changes = session.info.get(_CHANGES_KEY)
+    if changes:
+        for callback in _before_commit_callbacks:
+            callback(session, changes)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    changes = session.info.pop(_CHANGES_KEY, None)
+    if changes:
+        for callback in _after_commit_callbacks:
+            callback(changes)
+    for callback in _transaction_end_callbacks:
+        callback(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_after_rollback(session: Session) -> None:
+    session.info.pop(_CHANGES_KEY, None)
+    for callback in _transaction_end_callbacks:
+        callback(session)
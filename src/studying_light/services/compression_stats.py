@@ -0,0 +1,43 @@
+"""Counters of gzip-compressed responses."""
+
+from collections import Counter
+from threading import Lock
+
+
+class CompressionStats:
+    """Process-wide counters of compressed responses and bytes."""
+
+    def __init__(self) -> None:
+        self._counters: Counter[str] = Counter()
+        self._lock = Lock()
+
+    def record(self, bytes_in: int, bytes_out: int, *, streamed: bool) -> None:
+        """Count one compressed response and its size before and after."""
+        with self._lock:
+            self._counters["responses"] += 1
+            self._counters["bytes_in"] += bytes_in
+            self._counters["bytes_out"] += bytes_out
+            if streamed:
+                self._counters["streamed"] += 1
+
+    def reset(self) -> None:
+        """Drop all counters."""
+        with self._lock:
+            self._counters.clear()
+
+    def snapshot(self) -> dict[str, float]:
+        """Return the counters and the compressed-to-original size ratio."""
+        with self._lock:
+            counters = dict(self._counters)
+        bytes_in = counters.get("bytes_in", 0)
+        bytes_out = counters.get("bytes_out", 0)
+        return {
+            "responses": counters.get("responses", 0),
+            "streamed": counters.get("streamed", 0),
+            "bytes_in": bytes_in,
+            "bytes_out": bytes_out,
+            "ratio": round(bytes_out / bytes_in, 4) if bytes_in else 1.0,
+        }
+
+
+compression_stats = CompressionStats()
@@ -0,0 +1,30 @@
+"""Per-user data generation numbers behind conditional GET responses."""
+
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from studying_light.db.models.user import User
+from studying_light.services.change_tracker import Changes, on_before_commit
+
+
+def bump_data_generation(session: Session, user_ids: set[uuid.UUID]) -> None:
+    """Advance the data generation of the given users."""
+    session.execute(
+        update(User)
+        .where(User.id.in_(user_ids))
+        .values(data_generation=User.data_generation + 1)
+    )
+
+
+@on_before_commit
+def _bump_changed_users(session: Session, changes: Changes) -> None:
+    # Inside the transaction, so the bump commits together with the changes.
+    user_ids = {user_id for users in changes.values() for user_id in users}
+    # Bulk statements outside a request cannot name their users.
+    user_ids.discard(None)
+    if user_ids:
+        bump_data_generation(session, user_ids)
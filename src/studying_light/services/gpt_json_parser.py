@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import json
 import re
-from collections.abc import Iterable
 
 CODE_FENCE_PATTERN = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```", re.IGNORECASE)
 SMART_QUOTES_TRANSLATION = str.maketrans(
@@ -23,6 +22,17 @@ SMART_QUOTES_TRANSLATION = str.maketrans(
 )
 
 
+# GPT answers are a few KB; anything this large is not worth scanning.
+MAX_INPUT_CHARS = 512 * 1024
+# Real payloads nest a handful of levels; deeper spans are not tried.
+MAX_CANDIDATE_DEPTH = 64
+BRACKET_PAIRS = {"{": "}", "[": "]"}
+STRUCTURAL_CHARS_PATTERN = re.compile(r'[{}\[\]"\\\n]')
+_OPENING_QUOTES = '"“”„‟«»'
+OBJECT_BODY_STARTS = set(_OPENING_QUOTES + "}")
+ARRAY_BODY_STARTS = set(_OPENING_QUOTES + "]{[-0123456789tfn")
+
+
 class GptJsonParseError(ValueError):
     """Raised when GPT output cannot be parsed as JSON."""
 
@@ -30,7 +40,7 @@ class GptJsonParseError(ValueError):
 def _parse_json_candidate(candidate: str) -> object | None:
     try:
         return json.loads(candidate)
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, RecursionError):
         return None
 
 
@@ -49,20 +59,66 @@ def _parse_with_fallback_normalization(candidate: str) -> object | None:
     return _parse_json_candidate(normalized)
 
 
-def _iter_decoder_candidates(raw_text: str) -> Iterable[str]:
-    decoder = json.JSONDecoder()
-    for start_index, char in enumerate(raw_text):
-        if char not in "{[":
-            continue
-        try:
-            _, end_index = decoder.raw_decode(raw_text[start_index:])
-        except json.JSONDecodeError:
+def _could_start_json(raw_text: str, open_index: int) -> bool:
+    next_char = raw_text[open_index + 1 : open_index + 2]
+    if next_char.isspace():
+        stripped = raw_text[open_index + 1 : open_index + 64].lstrip()
+        next_char = stripped[:1]
+    allowed = OBJECT_BODY_STARTS if raw_text[open_index] == "{" else ARRAY_BODY_STARTS
+    return not next_char or next_char in allowed
+
+
+def _balanced_spans(raw_text: str) -> list[tuple[int, int]]:
+    """Find balanced bracket spans in one string-aware pass, by start index.
+
+    Only brackets, quotes, backslashes and newlines are visited. Spans nesting
+    deeper than MAX_CANDIDATE_DEPTH or opening with a character no JSON value
+    can start with are skipped, so each character is tried a bounded number
+    of times.
+    """
+    spans: list[tuple[int, int]] = []
+    # Each open bracket: [start index, bracket char, deepest nesting inside].
+    stack: list[list] = []
+    in_string = False
+    escaped_index = -1
+    for match in STRUCTURAL_CHARS_PATTERN.finditer(raw_text):
+        index = match.start()
+        char = match.group()
+        if in_string:
+            if index == escaped_index:
+                continue
+            if char == "\\":
+                escaped_index = index + 1
+            elif char == '"':
+                in_string = False
+            elif char == "\n":
+                # JSON strings cannot span lines; drop the broken candidates.
+                stack.clear()
+                in_string = False
             continue
-        yield raw_text[start_index : start_index + end_index]
+        if char in "{[":
+            stack.append([index, char, 0])
+        elif char in "}]":
+            if not stack or BRACKET_PAIRS[stack[-1][1]] != char:
+                stack.clear()
+                continue
+            start, _, depth = stack.pop()
+            if depth < MAX_CANDIDATE_DEPTH and _could_start_json(raw_text, start):
+                spans.append((start, index + 1))
+            if stack:
+                stack[-1][2] = max(stack[-1][2], depth + 1)
+        elif char == '"' and stack:
+            in_string = True
+    spans.sort()
+    return spans
 
 
 def parse_gpt_json_output(raw_output: str) -> object:
     """Extract and parse JSON from GPT output text."""
+    if len(raw_output) > MAX_INPUT_CHARS:
+        raise GptJsonParseError(
+            f"JSON payload is too large (max {MAX_INPUT_CHARS} characters)"
+        )
     text = raw_output.lstrip("\ufeff").strip()
     if not text:
         raise GptJsonParseError("JSON payload is empty")
@@ -79,8 +135,8 @@ def parse_gpt_json_output(raw_output: str) -> object:
         if fenced_value is not None:
             return fenced_value
 
-    for candidate in _iter_decoder_candidates(text):
-        parsed = _parse_with_fallback_normalization(candidate)
+    for start_index, end_index in _balanced_spans(text):
+        parsed = _parse_with_fallback_normalization(text[start_index:end_index])
         if parsed is not None:
             return parsed
 
@@ -0,0 +1,274 @@
+"""Cross-worker cache invalidation over LISTEN/NOTIFY or a polled table."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import uuid
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta, timezone
+from typing import Any, Protocol
+
+from sqlalchemy import Engine, delete, func, insert, select, text
+
+from studying_light.db.models.cache_invalidation import CacheInvalidation
+
+logger = logging.getLogger(__name__)
+
+CACHE_INVALIDATION_BUS_ENV = "CACHE_INVALIDATION_BUS"
+CACHE_INVALIDATION_POLL_ENV = "CACHE_INVALIDATION_POLL_SECONDS"
+WEB_CONCURRENCY_ENV = "WEB_CONCURRENCY"
+NOTIFY_CHANNEL = "studying_light_invalidation"
+DEFAULT_POLL_SECONDS = 1.0
+# Polled messages are only needed until every worker has read them.
+POLLED_RETENTION = timedelta(minutes=10)
+# NOTIFY payloads are limited to 8000 bytes; keep a margin for the envelope.
+NOTIFY_MAX_KEYS_BYTES = 7000
+
+# One id per process, so a worker skips the messages it published itself.
+WORKER_ID = uuid.uuid4().hex
+
+Subscriber = Callable[[list[str]], None]
+
+_subscribers: dict[str, list[Subscriber]] = {}
+_subscribers_lock = threading.Lock()
+
+
+def subscribe_invalidations(channel: str, callback: Subscriber) -> None:
+    """Call ``callback`` with the keys other workers invalidate on a channel."""
+    with _subscribers_lock:
+        _subscribers.setdefault(channel, []).append(callback)
+
+
+def deliver_invalidation(channel: str, keys: list[str]) -> None:
+    """Evict keys received from another worker in this process."""
+    with _subscribers_lock:
+        callbacks = list(_subscribers.get(channel, ()))
+    for callback in callbacks:
+        try:
+            callback(keys)
+        except Exception:
+            logger.exception("Cache invalidation subscriber failed on %s", channel)
+
+
+class InvalidationTransport(Protocol):
+    """Carries invalidation messages between worker processes."""
+
+    def publish(self, channel: str, keys: list[str]) -> None: ...
+
+    def listen(self, stop: threading.Event) -> None: ...
+
+
+class PostgresInvalidationTransport:
+    """Send messages with NOTIFY and receive them on a LISTEN connection."""
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+
+    def publish(self, channel: str, keys: list[str]) -> None:
+        """Notify every listening worker, splitting oversized key lists."""
+        with self.engine.begin() as connection:
+            for chunk in _chunk_keys(keys, NOTIFY_MAX_KEYS_BYTES):
+                payload = json.dumps(
+                    {"origin": WORKER_ID, "channel": channel, "keys": chunk}
+                )
+                connection.execute(
+                    text("SELECT pg_notify(:name, :payload)"),
+                    {"name": NOTIFY_CHANNEL, "payload": payload},
+                )
+
+    def listen(self, stop: threading.Event) -> None:
+        """Deliver notifications until ``stop`` is set."""
+        import psycopg
+
+        url = self.engine.url.set(drivername="postgresql")
+        conninfo = url.render_as_string(hide_password=False)
+        with psycopg.connect(conninfo, autocommit=True) as connection:
+            connection.execute(f"LISTEN {NOTIFY_CHANNEL}")
+            while not stop.is_set():
+                for notify in connection.notifies(timeout=1.0):
+                    _deliver_payload(json.loads(notify.payload))
+                    if stop.is_set():
+                        break
+
+
+class PolledInvalidationTransport:
+    """Append messages to ``cache_invalidations`` and poll for new rows."""
+
+    def __init__(self, engine: Engine, *, poll_seconds: float) -> None:
+        self.engine = engine
+        self.poll_seconds = poll_seconds
+        self.last_id = self._max_id()
+
+    def _max_id(self) -> int:
+        with self.engine.connect() as connection:
+            return int(connection.scalar(select(func.max(CacheInvalidation.id))) or 0)
+
+    def publish(self, channel: str, keys: list[str]) -> None:
+        """Store a message and drop the ones every worker had time to read."""
+        cutoff = datetime.now(timezone.utc) - POLLED_RETENTION
+        with self.engine.begin() as connection:
+            connection.execute(
+                insert(CacheInvalidation).values(
+                    origin=WORKER_ID,
+                    channel=channel,
+                    keys=keys,
+                )
+            )
+            connection.execute(
+                delete(CacheInvalidation).where(CacheInvalidation.created_at < cutoff)
+            )
+
+    def poll(self) -> None:
+        """Deliver messages stored since the previous poll."""
+        with self.engine.connect() as connection:
+            rows = connection.execute(
+                select(
+                    CacheInvalidation.id,
+                    CacheInvalidation.origin,
+                    CacheInvalidation.channel,
+                    CacheInvalidation.keys,
+                )
+                .where(CacheInvalidation.id > self.last_id)
+                .order_by(CacheInvalidation.id)
+            ).all()
+        for row in rows:
+            self.last_id = row.id
+            _deliver_payload(
+                {"origin": row.origin, "channel": row.channel, "keys": row.keys}
+            )
+
+    def listen(self, stop: threading.Event) -> None:
+        """Poll until ``stop`` is set."""
+        while not stop.wait(self.poll_seconds):
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Polling cache invalidations failed")
+
+
+def _chunk_keys(keys: list[str], max_bytes: int) -> Iterable[list[str]]:
+    chunk: list[str] = []
+    size = 0
+    for key in keys:
+        key_size = len(key.encode()) + 4
+        if chunk and size + key_size > max_bytes:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(key)
+        size += key_size
+    if chunk:
+        yield chunk
+
+
+def _deliver_payload(payload: dict[str, Any]) -> None:
+    if payload.get("origin") == WORKER_ID:
+        return
+    deliver_invalidation(str(payload["channel"]), list(payload["keys"]))
+
+
+class InvalidationBus:
+    """Background listener plus publisher for one transport."""
+
+    def __init__(self, transport: InvalidationTransport) -> None:
+        self.transport = transport
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="cache-invalidation-bus",
+            daemon=True,
+        )
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.transport.listen(self._stop)
+            except Exception:
+                logger.exception("Cache invalidation listener failed; retrying")
+                self._stop.wait(DEFAULT_POLL_SECONDS)
+
+    def start(self) -> None:
+        """Start listening in a daemon thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop listening and wait for the thread to exit."""
+        self._stop.set()
+        self._thread.join(timeout=5)
+
+    def publish(self, channel: str, keys: list[str]) -> None:
+        """Send keys to the other workers; failures are logged, not raised."""
+        try:
+            self.transport.publish(channel, keys)
+        except Exception:
+            logger.exception("Publishing cache invalidation on %s failed", channel)
+
+
+def build_transport(
+    engine: Engine,
+    *,
+    poll_seconds: float = DEFAULT_POLL_SECONDS,
+) -> InvalidationTransport:
+    """Use LISTEN/NOTIFY on Postgres and the polled table elsewhere."""
+    if engine.dialect.name == "postgresql":
+        return PostgresInvalidationTransport(engine)
+    return PolledInvalidationTransport(engine, poll_seconds=poll_seconds)
+
+
+_bus: InvalidationBus | None = None
+_bus_lock = threading.Lock()
+
+
+def start_invalidation_bus(
+    engine: Engine,
+    *,
+    poll_seconds: float = DEFAULT_POLL_SECONDS,
+) -> InvalidationBus:
+    """Start the process-wide bus for the engine's database."""
+    global _bus
+    with _bus_lock:
+        if _bus is None:
+            _bus = InvalidationBus(build_transport(engine, poll_seconds=poll_seconds))
+            _bus.start()
+        return _bus
+
+
+def stop_invalidation_bus() -> None:
+    """Stop the process-wide bus if it runs."""
+    global _bus
+    with _bus_lock:
+        bus, _bus = _bus, None
+    if bus is not None:
+        bus.stop()
+
+
+def invalidation_bus_enabled() -> bool:
+    """Check CACHE_INVALIDATION_BUS, defaulting to on with several workers."""
+    mode = (os.getenv(CACHE_INVALIDATION_BUS_ENV) or "auto").strip().lower()
+    if mode in {"on", "1", "true"}:
+        return True
+    if mode != "auto":
+        return False
+    try:
+        return int(os.getenv(WEB_CONCURRENCY_ENV) or 1) > 1
+    except ValueError:
+        return False
+
+
+def start_invalidation_bus_from_env(engine: Engine) -> InvalidationBus | None:
+    """Start the bus when the environment asks for it."""
+    if not invalidation_bus_enabled():
+        return None
+    raw_poll = (os.getenv(CACHE_INVALIDATION_POLL_ENV) or "").strip()
+    poll_seconds = float(raw_poll) if raw_poll else DEFAULT_POLL_SECONDS
+    return start_invalidation_bus(engine, poll_seconds=poll_seconds)
+
+
+def publish_invalidation(channel: str, keys: Iterable[str]) -> None:
+    """Tell other workers to evict keys; a no-op while the bus is stopped."""
+    bus = _bus
+    keys = sorted(set(keys))
+    if bus is not None and keys:
+        bus.publish(channel, keys)
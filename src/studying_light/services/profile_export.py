@@ -11,20 +11,24 @@ from typing import Any, Callable
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Load, Session, undefer_group
 
-from studying_light.db.models.algorithm import Algorithm
+from studying_light.db.models.algorithm import ALGORITHM_CONTENT_GROUP, Algorithm
 from studying_light.db.models.algorithm_code_snippet import AlgorithmCodeSnippet
 from studying_light.db.models.algorithm_group import AlgorithmGroup
 from studying_light.db.models.algorithm_review_attempt import AlgorithmReviewAttempt
 from studying_light.db.models.algorithm_review_item import AlgorithmReviewItem
 from studying_light.db.models.algorithm_training_attempt import AlgorithmTrainingAttempt
 from studying_light.db.models.book import Book
-from studying_light.db.models.reading_part import ReadingPart
+from studying_light.db.models.reading_part import (
+    READING_PART_CONTENT_GROUP,
+    ReadingPart,
+)
 from studying_light.db.models.review_attempt import ReviewAttempt
 from studying_light.db.models.review_schedule_item import ReviewScheduleItem
 from studying_light.db.models.user import User
 from studying_light.db.models.user_settings import UserSettings
+from studying_light.services.review_scheduler import resolve_review_questions
 
 PROFILE_FORMAT = "studying-light-profile"
 PROFILE_FORMAT_VERSION = 1
@@ -86,7 +90,11 @@ def _write_json_array(
 
 def _books_rows(session: Session, user: User) -> list[dict[str, Any]]:
     books = (
-        session.execute(select(Book).where(Book.user_id == user.id).order_by(Book.id))
+        session.execute(
+            select(Book)
+            .where(Book.user_id == user.id, Book.deleted_at.is_(None))
+            .order_by(Book.id)
+        )
         .scalars()
         .all()
     )
@@ -109,6 +117,7 @@ def _reading_parts_rows(session: Session, user: User) -> list[dict[str, Any]]:
             select(ReadingPart)
             .where(ReadingPart.user_id == user.id)
             .order_by(ReadingPart.id)
+            .options(undefer_group(READING_PART_CONTENT_GROUP))
         )
         .scalars()
         .all()
@@ -133,15 +142,13 @@ def _reading_parts_rows(session: Session, user: User) -> list[dict[str, Any]]:
 
 
 def _review_items_rows(session: Session, user: User) -> list[dict[str, Any]]:
-    items = (
-        session.execute(
-            select(ReviewScheduleItem)
-            .where(ReviewScheduleItem.user_id == user.id)
-            .order_by(ReviewScheduleItem.id)
-        )
-        .scalars()
-        .all()
-    )
+    rows = session.execute(
+        select(ReviewScheduleItem, ReadingPart)
+        .outerjoin(ReadingPart, ReadingPart.id == ReviewScheduleItem.reading_part_id)
+        .where(ReviewScheduleItem.user_id == user.id)
+        .order_by(ReviewScheduleItem.id)
+        .options(Load(ReadingPart).undefer_group(READING_PART_CONTENT_GROUP))
+    ).all()
     return [
         {
             "legacy_id": item.id,
@@ -151,9 +158,9 @@ def _review_items_rows(session: Session, user: User) -> list[dict[str, Any]]:
             "due_date": _jsonify(item.due_date),
             "status": item.status,
             "completed_at": _jsonify(item.completed_at),
-            "questions": _jsonify(item.questions),
+            "questions": _jsonify(resolve_review_questions(item, part)),
         }
-        for item in items
+        for item, part in rows
     ]
 
 
@@ -212,7 +219,10 @@ def _algorithm_groups_rows(session: Session, user: User) -> list[dict[str, Any]]
 def _algorithms_rows(session: Session, user: User) -> list[dict[str, Any]]:
     algorithms = (
         session.execute(
-            select(Algorithm).where(Algorithm.user_id == user.id).order_by(Algorithm.id)
+            select(Algorithm)
+            .where(Algorithm.user_id == user.id)
+            .order_by(Algorithm.id)
+            .options(undefer_group(ALGORITHM_CONTENT_GROUP))
         )
         .scalars()
         .all()
@@ -230,6 +240,9 @@ def _algorithms_rows(session: Session, user: User) -> list[dict[str, Any]]:
             "invariants": _jsonify(algorithm.invariants),
             "steps": _jsonify(algorithm.steps),
             "corner_cases": _jsonify(algorithm.corner_cases),
+            "review_questions_by_interval": _jsonify(
+                algorithm.review_questions_by_interval
+            ),
             "created_at": _jsonify(algorithm.created_at),
             "updated_at": _jsonify(algorithm.updated_at),
         }
@@ -358,6 +371,7 @@ def _user_settings_rows(session: Session, user: User) -> list[dict[str, Any]]:
             "daily_goal_weekday_min": settings.daily_goal_weekday_min,
             "daily_goal_weekend_min": settings.daily_goal_weekend_min,
             "intervals_days": _jsonify(settings.intervals_days),
+            "review_scheduler": settings.review_scheduler,
         }
     ]
 
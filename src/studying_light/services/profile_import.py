@@ -7,13 +7,14 @@ import json
 import uuid
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 from io import BytesIO
 from pathlib import PurePosixPath
 from typing import Any, Literal
 from zipfile import BadZipFile, ZipFile
 
-from pydantic import BaseModel, ConfigDict, ValidationError
-from sqlalchemy import delete, func, select
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.orm import Session
 
 from studying_light.db.models.algorithm import Algorithm
@@ -31,10 +32,15 @@ from studying_light.db.models.review_attempt import ReviewAttempt
 from studying_light.db.models.review_schedule_item import ReviewScheduleItem
 from studying_light.db.models.user import User
 from studying_light.db.models.user_settings import UserSettings
+from studying_light.services.book_counters import rebuild_book_counters
 from studying_light.services.profile_export import (
     PROFILE_FORMAT,
     PROFILE_FORMAT_VERSION,
 )
+from studying_light.services.review_counters import (
+    defer_review_counters,
+    rebuild_review_counters,
+)
 
 ImportMode = Literal["merge", "replace"]
 
@@ -155,6 +161,7 @@ class AlgorithmIn(_ImportModel):
     invariants: list
     steps: list
     corner_cases: list
+    review_questions_by_interval: dict | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
@@ -208,6 +215,7 @@ class UserSettingsIn(_ImportModel):
     daily_goal_weekday_min: int | None = None
     daily_goal_weekend_min: int | None = None
     intervals_days: list | None = None
+    review_scheduler: str | None = None
 
 
 def _raise_invalid(detail: str, errors: list[dict[str, Any]] | None = None) -> None:
@@ -357,10 +365,29 @@ def _load_zip(file_bytes: bytes) -> tuple[ManifestModel, dict[str, bytes]]:
     return manifest, data_bytes
 
 
+@lru_cache(maxsize=None)
+def _rows_adapter(model: type[_ImportModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
 def _load_rows(
     raw: bytes,
     model: type[_ImportModel],
     file_name: str,
+) -> list[_ImportModel]:
+    try:
+        # Parse and validate the whole file in pydantic-core in one call.
+        return _rows_adapter(model).validate_json(raw)
+    except ValidationError:
+        pass
+    # Slow path only on failure: rebuild the per-file and per-row errors.
+    return _load_rows_with_errors(raw, model, file_name)
+
+
+def _load_rows_with_errors(
+    raw: bytes,
+    model: type[_ImportModel],
+    file_name: str,
 ) -> list[_ImportModel]:
     try:
         data = json.loads(raw)
@@ -442,6 +469,44 @@ def _delete_user_domain_data(session: Session, user_id: uuid.UUID) -> None:
     session.execute(delete(UserSettings).where(UserSettings.user_id == user_id))
 
 
+def _refresh_last_attempt_pointers(session: Session, user_id: uuid.UUID) -> None:
+    for item_model, attempt_model, rating_column in (
+        (ReviewScheduleItem, ReviewAttempt, ReviewAttempt.gpt_rating_1_to_5),
+        (
+            AlgorithmReviewItem,
+            AlgorithmReviewAttempt,
+            AlgorithmReviewAttempt.rating_1_to_5,
+        ),
+    ):
+        latest_attempt_id = (
+            select(attempt_model.id)
+            .where(attempt_model.review_item_id == item_model.id)
+            .order_by(attempt_model.created_at.desc(), attempt_model.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        session.execute(
+            update(item_model)
+            .where(item_model.user_id == user_id)
+            .values(last_attempt_id=latest_attempt_id)
+            .execution_options(synchronize_session=False)
+        )
+        latest_rating = (
+            select(rating_column)
+            .where(attempt_model.id == item_model.last_attempt_id)
+            .scalar_subquery()
+        )
+        session.execute(
+            update(item_model)
+            .where(
+                item_model.user_id == user_id,
+                item_model.last_attempt_id.is_not(None),
+            )
+            .values(last_rating=latest_rating)
+            .execution_options(synchronize_session=False)
+        )
+
+
 def _warn_existing_titles(
     session: Session,
     user: User,
@@ -453,7 +518,10 @@ def _warn_existing_titles(
     existing_book_titles = {
         title.strip().lower()
         for title in session.execute(
-            select(Book.title).where(Book.user_id == user.id)
+            select(Book.title).where(
+                Book.user_id == user.id,
+                Book.deleted_at.is_(None),
+            )
         ).scalars()
     }
     matched_books = sorted(
@@ -639,6 +707,8 @@ def import_profile_zip(
     title_adjustments_count = 0
 
     try:
+        # Rows are flushed one by one; counters are rebuilt once at the end.
+        defer_review_counters(session)
         if mode == "replace":
             _delete_user_domain_data(session, user.id)
 
@@ -773,6 +843,7 @@ def import_profile_zip(
                 invariants=row.invariants,
                 steps=row.steps,
                 corner_cases=row.corner_cases,
+                review_questions_by_interval=row.review_questions_by_interval,
                 created_at=row.created_at,
                 updated_at=row.updated_at,
             )
@@ -859,6 +930,10 @@ def import_profile_zip(
             session.flush()
             imported["algorithm_training_attempts"] += 1
 
+        _refresh_last_attempt_pointers(session, user.id)
+        rebuild_book_counters(session, user_id=user.id)
+        rebuild_review_counters(session, user_id=user.id)
+
         if settings_rows:
             settings_row = settings_rows[0]
             existing_settings = session.get(UserSettings, user.id)
@@ -870,6 +945,7 @@ def import_profile_zip(
                     "daily_goal_weekday_min",
                     "daily_goal_weekend_min",
                     "intervals_days",
+                    "review_scheduler",
                 ]:
                     setattr(existing_settings, field, getattr(settings_row, field))
             else:
@@ -882,6 +958,7 @@ def import_profile_zip(
                         daily_goal_weekday_min=settings_row.daily_goal_weekday_min,
                         daily_goal_weekend_min=settings_row.daily_goal_weekend_min,
                         intervals_days=settings_row.intervals_days,
+                        review_scheduler=settings_row.review_scheduler,
                     )
                 )
             imported["user_settings"] = 1
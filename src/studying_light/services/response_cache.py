@@ -0,0 +1,449 @@
+"""Pluggable response cache with tag-based per-user invalidation."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import time
+import uuid
+from collections import Counter, OrderedDict
+from collections.abc import Iterable
+from contextlib import closing
+from pathlib import Path
+from threading import Lock
+from typing import Protocol
+
+from studying_light.services.change_tracker import Changes, on_after_commit
+from studying_light.services.invalidation_bus import (
+    publish_invalidation,
+    subscribe_invalidations,
+)
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_BACKEND_ENV = "RESPONSE_CACHE_BACKEND"
+RESPONSE_CACHE_PATH_ENV = "RESPONSE_CACHE_PATH"
+RESPONSE_CACHE_TTL_ENV = "RESPONSE_CACHE_TTL_SECONDS"
+RESPONSE_CACHE_MAX_ENTRIES_ENV = "RESPONSE_CACHE_MAX_ENTRIES"
+INVALIDATION_CHANNEL = "response_cache"
+DEFAULT_BACKEND = "memory"
+DEFAULT_CACHE_PATH = "data/response_cache.db"
+DEFAULT_TTL_SECONDS = 60.0
+DEFAULT_MAX_ENTRIES = 2048
+
+# Cache domains by table; tables not listed are their own domain.
+DOMAIN_BY_TABLE = {
+    "books": "books",
+    "reading_parts": "books",
+    "review_schedule_items": "reviews",
+    "review_attempts": "reviews",
+    "algorithm_review_items": "reviews",
+    "algorithm_review_attempts": "reviews",
+    "algorithm_groups": "algorithms",
+    "algorithms": "algorithms",
+    "algorithm_code_snippets": "algorithms",
+    "algorithm_training_attempts": "algorithms",
+    "user_settings": "settings",
+}
+
+TagVersions = dict[str, int]
+
+
+def domain_tag(domain: str, user_id: uuid.UUID | None = None) -> str:
+    """Return the tag of a domain for one user, or for every user."""
+    if user_id is None:
+        return domain
+    return f"{domain}:{user_id}"
+
+
+def entry_tags(user_id: uuid.UUID, domains: Iterable[str]) -> list[str]:
+    """Return the tags an entry of the user over the given domains carries."""
+    tags = []
+    for domain in domains:
+        tags.extend((domain_tag(domain), domain_tag(domain, user_id)))
+    return tags
+
+
+class ResponseCache(Protocol):
+    """Cache backend storing opaque values invalidated by tag versions.
+
+    ``set`` receives the tag versions read before the value was computed and
+    drops the value if any tag was invalidated meanwhile, so a result read
+    before a write can never be stored after that write's invalidation.
+    """
+
+    def get(self, key: str) -> bytes | None: ...
+
+    def tag_versions(self, tags: Iterable[str]) -> TagVersions: ...
+
+    def set(self, key: str, value: bytes, versions: TagVersions) -> bool: ...
+
+    def invalidate(self, tags: Iterable[str]) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def stats(self) -> dict[str, int]: ...
+
+
+class MemoryResponseCache:
+    """In-process LRU cache with a TTL and an entry bound."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, bytes, TagVersions]] = (
+            OrderedDict()
+        )
+        self._versions: dict[str, int] = {}
+        self._counters: Counter[str] = Counter()
+        self._lock = Lock()
+
+    def _is_current(self, versions: TagVersions) -> bool:
+        return all(
+            self._versions.get(tag, 0) == version for tag, version in versions.items()
+        )
+
+    def get(self, key: str) -> bytes | None:
+        """Return a fresh, still-valid value or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            expires_at, value, versions = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._counters["expirations"] += 1
+                self._counters["misses"] += 1
+                return None
+            if not self._is_current(versions):
+                del self._entries[key]
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return value
+
+    def tag_versions(self, tags: Iterable[str]) -> TagVersions:
+        """Return the current version of each tag."""
+        with self._lock:
+            return {tag: self._versions.get(tag, 0) for tag in tags}
+
+    def set(self, key: str, value: bytes, versions: TagVersions) -> bool:
+        """Store a value unless one of its tags moved since ``versions``."""
+        with self._lock:
+            if not self._is_current(versions):
+                self._counters["stale_writes"] += 1
+                return False
+            self._entries[key] = (
+                time.monotonic() + self.ttl_seconds,
+                value,
+                dict(versions),
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+            return True
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """Bump tag versions; entries carrying them stop matching."""
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+                self._counters["invalidations"] += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss/eviction counters and the current size."""
+        with self._lock:
+            return {**self._counters, "entries": len(self._entries)}
+
+
+class SqliteResponseCache:
+    """Cache shared by worker processes through a SQLite file.
+
+    Tag versions live in the same file, so an invalidation in one worker is
+    seen by the others on their next lookup. Counters are per process.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._counters: Counter[str] = Counter()
+        self._lock = Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    versions TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            connection.execute(
+                """
+                CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed_at
+                ON cache_entries (accessed_at)
+                """
+            )
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_tags (
+                    tag TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5, isolation_level=None)
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    @staticmethod
+    def _read_versions(
+        connection: sqlite3.Connection,
+        tags: Iterable[str],
+    ) -> TagVersions:
+        tags = list(tags)
+        versions = dict.fromkeys(tags, 0)
+        if tags:
+            placeholders = ", ".join("?" * len(tags))
+            rows = connection.execute(
+                f"SELECT tag, version FROM cache_tags WHERE tag IN ({placeholders})",
+                tags,
+            )
+            versions.update(rows.fetchall())
+        return versions
+
+    def get(self, key: str) -> bytes | None:
+        """Return a fresh, still-valid value or None."""
+        now = time.time()
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT value, versions, expires_at FROM cache_entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self._count("misses")
+                return None
+            value, raw_versions, expires_at = row
+            versions = json.loads(raw_versions)
+            if expires_at <= now:
+                connection.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                self._count("expirations")
+                self._count("misses")
+                return None
+            if self._read_versions(connection, versions) != versions:
+                connection.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                self._count("misses")
+                return None
+            connection.execute(
+                "UPDATE cache_entries SET accessed_at = ? WHERE key = ?",
+                (now, key),
+            )
+        self._count("hits")
+        return bytes(value)
+
+    def tag_versions(self, tags: Iterable[str]) -> TagVersions:
+        """Return the current version of each tag."""
+        with closing(self._connect()) as connection:
+            return self._read_versions(connection, tags)
+
+    def set(self, key: str, value: bytes, versions: TagVersions) -> bool:
+        """Store a value unless one of its tags moved since ``versions``."""
+        now = time.time()
+        with closing(self._connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                if self._read_versions(connection, versions) != versions:
+                    connection.execute("ROLLBACK")
+                    self._count("stale_writes")
+                    return False
+                connection.execute(
+                    """
+                    INSERT INTO cache_entries (
+                        key, value, versions, expires_at, accessed_at
+                    ) VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (key) DO UPDATE SET
+                        value = excluded.value,
+                        versions = excluded.versions,
+                        expires_at = excluded.expires_at,
+                        accessed_at = excluded.accessed_at
+                    """,
+                    (key, value, json.dumps(versions), now + self.ttl_seconds, now),
+                )
+                evicted = connection.execute(
+                    """
+                    DELETE FROM cache_entries WHERE key IN (
+                        SELECT key FROM cache_entries
+                        ORDER BY accessed_at DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_entries,),
+                ).rowcount
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        if evicted:
+            self._count("evictions", evicted)
+        return True
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """Bump tag versions; entries carrying them stop matching."""
+        tags = list(tags)
+        with closing(self._connect()) as connection:
+            connection.executemany(
+                """
+                INSERT INTO cache_tags (tag, version) VALUES (?, 1)
+                ON CONFLICT (tag) DO UPDATE SET version = version + 1
+                """,
+                [(tag,) for tag in tags],
+            )
+        self._count("invalidations", len(tags))
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with closing(self._connect()) as connection:
+            connection.execute("DELETE FROM cache_entries")
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss/eviction counters and the current size."""
+        with closing(self._connect()) as connection:
+            (entries,) = connection.execute(
+                "SELECT COUNT(*) FROM cache_entries"
+            ).fetchone()
+        with self._lock:
+            return {**self._counters, "entries": int(entries)}
+
+
+class NullResponseCache:
+    """Backend that stores nothing, for deployments with caching disabled."""
+
+    def get(self, key: str) -> bytes | None:
+        """Always miss."""
+        return None
+
+    def tag_versions(self, tags: Iterable[str]) -> TagVersions:
+        """Return zero versions."""
+        return dict.fromkeys(tags, 0)
+
+    def set(self, key: str, value: bytes, versions: TagVersions) -> bool:
+        """Discard the value."""
+        return False
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """Nothing to invalidate."""
+
+    def clear(self) -> None:
+        """Nothing to clear."""
+
+    def stats(self) -> dict[str, int]:
+        """Return empty counters."""
+        return {"entries": 0}
+
+
+def _env_number(name: str, default: float) -> float:
+    raw_value = (os.getenv(name) or "").strip()
+    if not raw_value:
+        return default
+    try:
+        return float(raw_value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, raw_value)
+        return default
+
+
+def build_response_cache() -> ResponseCache:
+    """Build the backend selected by RESPONSE_CACHE_BACKEND."""
+    backend = (os.getenv(RESPONSE_CACHE_BACKEND_ENV) or DEFAULT_BACKEND).strip()
+    max_entries = int(_env_number(RESPONSE_CACHE_MAX_ENTRIES_ENV, DEFAULT_MAX_ENTRIES))
+    ttl_seconds = _env_number(RESPONSE_CACHE_TTL_ENV, DEFAULT_TTL_SECONDS)
+    if backend == "off":
+        return NullResponseCache()
+    if backend == "sqlite":
+        path = os.getenv(RESPONSE_CACHE_PATH_ENV, DEFAULT_CACHE_PATH)
+        return SqliteResponseCache(
+            path,
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+        )
+    if backend != "memory":
+        logger.warning(
+            "Unknown %s=%r, using memory", RESPONSE_CACHE_BACKEND_ENV, backend
+        )
+    return MemoryResponseCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+
+_cache: ResponseCache | None = None
+_cache_lock = Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide cache, building it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = build_response_cache()
+        return _cache
+
+
+def set_response_cache(cache: ResponseCache) -> None:
+    """Replace the process-wide cache backend."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def _table_domain(table_name: str) -> str:
+    return DOMAIN_BY_TABLE.get(table_name, table_name)
+
+
+@on_after_commit
+def _invalidate_changed_domains(changes: Changes) -> None:
+    # A None user (bulk statement outside a request) drops the whole domain.
+    dirty_tags = {
+        domain_tag(_table_domain(table_name), user_id)
+        for table_name, user_ids in changes.items()
+        for user_id in user_ids
+    }
+    get_response_cache().invalidate(dirty_tags)
+    publish_invalidation(INVALIDATION_CHANNEL, dirty_tags)
+
+
+def _invalidate_from_other_worker(tags: list[str]) -> None:
+    cache = get_response_cache()
+    # The SQLite backend already shares tag versions between workers.
+    if not isinstance(cache, SqliteResponseCache):
+        cache.invalidate(tags)
+
+
+subscribe_invalidations(INVALIDATION_CHANNEL, _invalidate_from_other_worker)
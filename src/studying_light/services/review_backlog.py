@@ -0,0 +1,131 @@
+"""Redistribution of overdue review items under a daily cap."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Mapping
+from datetime import date, timedelta
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from studying_light.db.models.algorithm_review_item import AlgorithmReviewItem
+from studying_light.db.models.review_schedule_item import ReviewScheduleItem
+from studying_light.services.book_purge import part_is_visible
+
+ReviewItemModel = type[ReviewScheduleItem] | type[AlgorithmReviewItem]
+
+SPREAD_MAX_DAYS = 365
+SPREAD_MAX_DAILY_CAP = 500
+
+
+def _planned_before(model: ReviewItemModel, user_id: UUID, end_date: date) -> list:
+    filters = [
+        model.user_id == user_id,
+        model.status == "planned",
+        model.due_date < end_date,
+    ]
+    if model is ReviewScheduleItem:
+        filters.append(part_is_visible(model.reading_part_id))
+    return filters
+
+
+def load_spread_window(
+    session: Session,
+    model: ReviewItemModel,
+    user_id: UUID,
+    *,
+    today: date,
+    days: int,
+    lock: bool = True,
+) -> tuple[list[int], dict[date, int]]:
+    """Load planned items due before the window ends and split them up.
+
+    Returns the overdue item ids, oldest first, and how many items are already
+    due on each day of the window. With ``lock`` the rows stay locked until the
+    caller's transaction ends, so the plan cannot go stale before it is applied.
+    """
+    # Out-of-range days are rejected by plan_spread; only bound the query here.
+    end_date = today + timedelta(days=min(max(days, 0), SPREAD_MAX_DAYS))
+    statement = (
+        select(model.id, model.due_date)
+        .where(*_planned_before(model, user_id, end_date))
+        .order_by(model.due_date, model.id)
+    )
+    if lock:
+        statement = statement.with_for_update()
+    rows = session.execute(statement).all()
+    overdue_ids = [item_id for item_id, due_date in rows if due_date < today]
+    due_by_day = Counter(due_date for _, due_date in rows if due_date >= today)
+    return overdue_ids, dict(due_by_day)
+
+
+def plan_spread(
+    overdue_count: int,
+    *,
+    start_date: date,
+    days: int,
+    daily_cap: int,
+    due_by_day: Mapping[date, int] | None = None,
+) -> list[tuple[date, int]]:
+    """Return how many overdue items land on each day, starting at start_date.
+
+    A day only takes what is left of daily_cap after the items already due on
+    it, so no day of the window ends up above the cap.
+    """
+    if days <= 0 or days > SPREAD_MAX_DAYS:
+        raise ValueError(f"days must be between 1 and {SPREAD_MAX_DAYS}")
+    if daily_cap <= 0 or daily_cap > SPREAD_MAX_DAILY_CAP:
+        raise ValueError(f"daily_cap must be between 1 and {SPREAD_MAX_DAILY_CAP}")
+    due_by_day = due_by_day or {}
+    free_slots = [
+        (day, max(daily_cap - due_by_day.get(day, 0), 0))
+        for day in (start_date + timedelta(days=offset) for offset in range(days))
+    ]
+    free_total = sum(free for _, free in free_slots)
+    if overdue_count > free_total:
+        raise ValueError(
+            f"{overdue_count} overdue items do not fit into {days} days with "
+            f"daily_cap {daily_cap}; only {free_total} slots are free"
+        )
+
+    plan: list[tuple[date, int]] = []
+    remaining = overdue_count
+    for day, free in free_slots:
+        if remaining <= 0:
+            break
+        count = min(free, remaining)
+        if count:
+            plan.append((day, count))
+            remaining -= count
+    return plan
+
+
+def spread_overdue(
+    session: Session,
+    model: ReviewItemModel,
+    user_id: UUID,
+    *,
+    overdue_ids: list[int],
+    plan: list[tuple[date, int]],
+) -> int:
+    """Move the locked overdue items onto the planned days.
+
+    Items keep their relative order: the oldest due dates (then lowest ids) are
+    assigned to the earliest days of the plan. Each day is one UPDATE over at
+    most daily_cap ids.
+    """
+    updated = 0
+    offset = 0
+    for due_date, count in plan:
+        item_ids = overdue_ids[offset : offset + count]
+        offset += count
+        result = session.execute(
+            update(model)
+            .where(model.user_id == user_id, model.id.in_(item_ids))
+            .values(due_date=due_date)
+            .execution_options(synchronize_session=False)
+        )
+        updated += int(result.rowcount or 0)
+    return updated
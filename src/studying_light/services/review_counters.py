@@ -0,0 +1,325 @@
+"""Maintain denormalized review counters on reading parts and algorithms."""
+
+from __future__ import annotations
+
+import uuid
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Connection,
+    ScalarSelect,
+    event,
+    func,
+    inspect,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session
+
+from studying_light.db.models.algorithm import Algorithm
+from studying_light.db.models.algorithm_review_attempt import AlgorithmReviewAttempt
+from studying_light.db.models.algorithm_review_item import AlgorithmReviewItem
+from studying_light.db.models.reading_part import ReadingPart
+from studying_light.db.models.review_attempt import ReviewAttempt
+from studying_light.db.models.review_schedule_item import ReviewScheduleItem
+from studying_light.services.change_tracker import on_transaction_end
+
+COUNTER_FIELDS = (
+    "total_reviews",
+    "completed_reviews",
+    "gpt_attempts_total",
+    "gpt_rating_sum",
+)
+
+
+@dataclass(frozen=True)
+class CounterTrack:
+    """Parent entity whose review items and rated attempts are counted."""
+
+    name: str
+    parent_model: type[ReadingPart] | type[Algorithm]
+    item_model: type[ReviewScheduleItem] | type[AlgorithmReviewItem]
+    parent_column: str
+    attempt_model: type[ReviewAttempt] | type[AlgorithmReviewAttempt]
+    rating_column: str
+
+
+THEORY_COUNTER_TRACK = CounterTrack(
+    name="theory",
+    parent_model=ReadingPart,
+    item_model=ReviewScheduleItem,
+    parent_column="reading_part_id",
+    attempt_model=ReviewAttempt,
+    rating_column="gpt_rating_1_to_5",
+)
+ALGORITHM_COUNTER_TRACK = CounterTrack(
+    name="algorithms",
+    parent_model=Algorithm,
+    item_model=AlgorithmReviewItem,
+    parent_column="algorithm_id",
+    attempt_model=AlgorithmReviewAttempt,
+    rating_column="rating_1_to_5",
+)
+COUNTER_TRACKS = (THEORY_COUNTER_TRACK, ALGORITHM_COUNTER_TRACK)
+
+_TRACK_BY_ITEM = {track.item_model: track for track in COUNTER_TRACKS}
+_TRACK_BY_ATTEMPT = {track.attempt_model: track for track in COUNTER_TRACKS}
+_DEFERRED_KEY = "review_counters_deferred"
+_UNLOADED = object()
+
+
+def average_rating(rating_sum: int, attempts_total: int) -> float | None:
+    """Return the mean rating rounded for display, or None without attempts."""
+    if not attempts_total:
+        return None
+    return round(rating_sum / attempts_total, 2)
+
+
+def _aggregates(track: CounterTrack) -> dict[str, ScalarSelect[int]]:
+    parent = track.parent_model
+    item = track.item_model
+    attempt = track.attempt_model
+    parent_id = getattr(item, track.parent_column)
+    rating = getattr(attempt, track.rating_column)
+
+    def _items(expression: ColumnElement[int]) -> ScalarSelect[int]:
+        return (
+            select(expression)
+            .where(parent_id == parent.id)
+            .correlate(parent)
+            .scalar_subquery()
+        )
+
+    def _attempts(expression: ColumnElement[int]) -> ScalarSelect[int]:
+        return (
+            select(expression)
+            .join(item, attempt.review_item_id == item.id)
+            .where(parent_id == parent.id, rating.is_not(None))
+            .correlate(parent)
+            .scalar_subquery()
+        )
+
+    return {
+        "total_reviews": _items(func.count(item.id)),
+        "completed_reviews": _items(func.count(item.id).filter(item.status == "done")),
+        "gpt_attempts_total": _attempts(func.count(attempt.id)),
+        "gpt_rating_sum": _attempts(func.coalesce(func.sum(rating), 0)),
+    }
+
+
+def rebuild_review_counters(
+    session: Session,
+    *,
+    user_id: uuid.UUID | None = None,
+    part_ids: Iterable[int] | None = None,
+    algorithm_ids: Iterable[int] | None = None,
+) -> int:
+    """Recompute review counters from review rows and return updated parents.
+
+    Without ``part_ids``/``algorithm_ids`` every part and algorithm (of the
+    user, if given) is rebuilt; otherwise only the listed ones are.
+    """
+    scoped = part_ids is not None or algorithm_ids is not None
+    ids_by_track = {
+        THEORY_COUNTER_TRACK: part_ids,
+        ALGORITHM_COUNTER_TRACK: algorithm_ids,
+    }
+    updated = 0
+    for track, parent_ids in ids_by_track.items():
+        if scoped and not parent_ids:
+            continue
+        parent = track.parent_model
+        stmt = update(parent).values(**_aggregates(track))
+        if parent_ids is not None:
+            stmt = stmt.where(parent.id.in_(list(parent_ids)))
+        if user_id is not None:
+            stmt = stmt.where(parent.user_id == user_id)
+        result = session.execute(stmt.execution_options(synchronize_session=False))
+        updated += int(result.rowcount or 0)
+    return updated
+
+
+def find_review_counter_drift(
+    session: Session,
+    *,
+    user_id: uuid.UUID | None = None,
+) -> list[tuple[str, int]]:
+    """Return ``(track, parent_id)`` pairs whose counters disagree with rows."""
+    drift: list[tuple[str, int]] = []
+    for track in COUNTER_TRACKS:
+        parent = track.parent_model
+        aggregates = _aggregates(track)
+        stmt = select(parent.id).where(
+            or_(
+                *(
+                    getattr(parent, field) != aggregates[field]
+                    for field in COUNTER_FIELDS
+                )
+            )
+        )
+        if user_id is not None:
+            stmt = stmt.where(parent.user_id == user_id)
+        drift.extend(
+            (track.name, parent_id)
+            for parent_id in session.scalars(stmt.order_by(parent.id))
+        )
+    return drift
+
+
+def defer_review_counters(session: Session) -> None:
+    """Skip per-flush counter updates until the transaction ends.
+
+    Callers that write many review rows must rebuild the affected counters
+    with ``rebuild_review_counters`` before committing.
+    """
+    session.info[_DEFERRED_KEY] = True
+
+
+def _flushed_change(instance: Any, key: str) -> tuple[Any, Any] | None:
+    """Return the old and new value of a changed attribute, or None."""
+    history = inspect(instance).attrs[key].history
+    if not history.has_changes():
+        return None
+    old = history.deleted[0] if history.deleted else _UNLOADED
+    new = history.added[0] if history.added else None
+    return old, new
+
+
+def _item_counts(status: str | None) -> Counter[str]:
+    return Counter(total_reviews=1, completed_reviews=int(status == "done"))
+
+
+def _rating_counts(rating: int | None) -> Counter[str]:
+    if rating is None:
+        return Counter()
+    return Counter(gpt_attempts_total=1, gpt_rating_sum=rating)
+
+
+class _FlushDeltas:
+    """Counter changes of one flush, keyed by parent id or review item id."""
+
+    def __init__(self) -> None:
+        self.by_parent: dict[tuple[CounterTrack, int], Counter[str]] = {}
+        self.by_item: dict[tuple[CounterTrack, int], Counter[str]] = {}
+        self.rebuild_parents: set[tuple[CounterTrack, int]] = set()
+        self.rebuild_items: set[tuple[CounterTrack, int]] = set()
+
+    def add_item(self, track: CounterTrack, item: Any, sign: int) -> None:
+        counts = _item_counts(item.status)
+        self._add(
+            self.by_parent, (track, getattr(item, track.parent_column)), counts, sign
+        )
+
+    def add_attempt(self, track: CounterTrack, attempt: Any, sign: int) -> None:
+        counts = _rating_counts(getattr(attempt, track.rating_column))
+        self._add(self.by_item, (track, attempt.review_item_id), counts, sign)
+
+    def change_item(self, track: CounterTrack, item: Any) -> None:
+        change = _flushed_change(item, "status")
+        if change is None:
+            return
+        key = (track, getattr(item, track.parent_column))
+        old, new = change
+        if old is _UNLOADED:
+            self.rebuild_parents.add(key)
+            return
+        counts = Counter(completed_reviews=int(new == "done"))
+        counts.subtract(Counter(completed_reviews=int(old == "done")))
+        self._add(self.by_parent, key, counts, 1)
+
+    def change_attempt(self, track: CounterTrack, attempt: Any) -> None:
+        change = _flushed_change(attempt, track.rating_column)
+        if change is None:
+            return
+        key = (track, attempt.review_item_id)
+        old, new = change
+        if old is _UNLOADED:
+            self.rebuild_items.add(key)
+            return
+        counts = _rating_counts(new)
+        counts.subtract(_rating_counts(old))
+        self._add(self.by_item, key, counts, 1)
+
+    @staticmethod
+    def _add(
+        target: dict[tuple[CounterTrack, int], Counter[str]],
+        key: tuple[CounterTrack, int],
+        counts: Counter[str],
+        sign: int,
+    ) -> None:
+        bucket = target.setdefault(key, Counter())
+        for field, delta in counts.items():
+            bucket[field] += sign * delta
+
+
+def _parent_of_item(track: CounterTrack, item_id: int) -> ColumnElement[bool]:
+    item = track.item_model
+    parent_id = (
+        select(getattr(item, track.parent_column))
+        .where(item.id == item_id)
+        .scalar_subquery()
+    )
+    return track.parent_model.id == parent_id
+
+
+def _apply_deltas(
+    connection: Connection,
+    track: CounterTrack,
+    condition: ColumnElement[bool],
+    counts: Counter[str],
+) -> None:
+    parent = track.parent_model
+    values = {
+        field: getattr(parent, field) + delta
+        for field, delta in counts.items()
+        if delta
+    }
+    if values:
+        connection.execute(update(parent).where(condition).values(values))
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_review_counters(session: Session, flush_context: Any) -> None:
+    if session.info.get(_DEFERRED_KEY):
+        return
+    # new/dirty/deleted and attribute history still describe the flushed
+    # changes here, and generated ids are already assigned.
+    deltas = _FlushDeltas()
+    for instances, sign in ((session.new, 1), (session.deleted, -1)):
+        for instance in instances:
+            if (track := _TRACK_BY_ITEM.get(type(instance))) is not None:
+                deltas.add_item(track, instance, sign)
+            elif (track := _TRACK_BY_ATTEMPT.get(type(instance))) is not None:
+                deltas.add_attempt(track, instance, sign)
+    for instance in session.dirty:
+        if (track := _TRACK_BY_ITEM.get(type(instance))) is not None:
+            deltas.change_item(track, instance)
+        elif (track := _TRACK_BY_ATTEMPT.get(type(instance))) is not None:
+            deltas.change_attempt(track, instance)
+
+    connection = session.connection()
+    for (track, parent_id), counts in deltas.by_parent.items():
+        _apply_deltas(connection, track, track.parent_model.id == parent_id, counts)
+    for (track, item_id), counts in deltas.by_item.items():
+        _apply_deltas(connection, track, _parent_of_item(track, item_id), counts)
+    rebuild_conditions = [
+        (track, track.parent_model.id == parent_id)
+        for track, parent_id in deltas.rebuild_parents
+    ] + [
+        (track, _parent_of_item(track, item_id))
+        for track, item_id in deltas.rebuild_items
+    ]
+    for track, condition in rebuild_conditions:
+        connection.execute(
+            update(track.parent_model).where(condition).values(**_aggregates(track))
+        )
+
+
+@on_transaction_end
+def _resume_review_counters(session: Session) -> None:
+    session.info.pop(_DEFERRED_KEY, None)
@@ -0,0 +1,182 @@
+"""Review workload forecast with per-user caching."""
+
+from __future__ import annotations
+
+import json
+from collections import deque
+from datetime import date, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from studying_light.db.models.algorithm_review_item import AlgorithmReviewItem
+from studying_light.db.models.review_schedule_item import ReviewScheduleItem
+from studying_light.services.book_purge import part_is_visible
+from studying_light.services.response_cache import entry_tags, get_response_cache
+
+FORECAST_MAX_DAYS = 180
+FORECAST_MAX_DAILY_CAPACITY = 500
+# Retention assumed when an item is reviewed exactly on its due date.
+TARGET_RETENTION = 0.9
+# Schedule writes and book deletions change the planned items counted here.
+FORECAST_CACHE_DOMAINS = ("reviews", "books")
+
+
+def _due_groups(
+    session: Session,
+    model: type[ReviewScheduleItem] | type[AlgorithmReviewItem],
+    user_id: UUID | None,
+    end_date: date,
+) -> list[tuple[date, int, int]]:
+    filters = [model.status == "planned", model.due_date < end_date]
+    if user_id is not None:
+        filters.append(model.user_id == user_id)
+    if model is ReviewScheduleItem:
+        filters.append(part_is_visible(model.reading_part_id))
+    rows = session.execute(
+        select(model.due_date, model.interval_days, func.count(model.id))
+        .where(*filters)
+        .group_by(model.due_date, model.interval_days)
+    ).all()
+    return [(due_date, int(interval), int(count)) for due_date, interval, count in rows]
+
+
+def _retention(interval_days: int, delay_days: int) -> float:
+    interval = max(interval_days, 1)
+    return TARGET_RETENTION ** ((interval + max(delay_days, 0)) / interval)
+
+
+def compute_review_forecast(
+    session: Session,
+    *,
+    user_id: UUID | None,
+    today: date,
+    days: int,
+    daily_capacity: int | None = None,
+) -> dict[str, Any]:
+    """Forecast daily review load, backlog and expected retention.
+
+    Planned items are aggregated by (due_date, interval_days) in SQL, so the
+    simulation runs over day buckets rather than individual items. Without a
+    daily capacity every due item is reviewed on its due day (overdue ones
+    today); with a capacity the queue is drained oldest-first.
+    """
+    if days <= 0 or days > FORECAST_MAX_DAYS:
+        raise ValueError(f"days must be between 1 and {FORECAST_MAX_DAYS}")
+    if daily_capacity is not None and (
+        daily_capacity <= 0 or daily_capacity > FORECAST_MAX_DAILY_CAPACITY
+    ):
+        raise ValueError(
+            f"daily_capacity must be between 1 and {FORECAST_MAX_DAILY_CAPACITY}"
+        )
+
+    end_date = today + timedelta(days=days)
+    theory_due = [0] * days
+    algorithm_due = [0] * days
+    arrivals: list[list[tuple[date, int, int]]] = [[] for _ in range(days)]
+    overdue_count = 0
+    for model, due_by_day in (
+        (ReviewScheduleItem, theory_due),
+        (AlgorithmReviewItem, algorithm_due),
+    ):
+        for due_date, interval, count in _due_groups(session, model, user_id, end_date):
+            offset = max((due_date - today).days, 0)
+            if due_date < today:
+                overdue_count += count
+            due_by_day[offset] += count
+            arrivals[offset].append((due_date, interval, count))
+
+    queue: deque[list] = deque()
+    forecast_days: list[dict[str, Any]] = []
+    reviewed_total = 0
+    retention_total = 0.0
+    for offset in range(days):
+        day = today + timedelta(days=offset)
+        queue.extend([list(group) for group in sorted(arrivals[offset])])
+        reviewed = 0
+        retention_sum = 0.0
+        while queue and (daily_capacity is None or reviewed < daily_capacity):
+            group = queue[0]
+            take = group[2]
+            if daily_capacity is not None:
+                take = min(take, daily_capacity - reviewed)
+            retention_sum += take * _retention(group[1], (day - group[0]).days)
+            reviewed += take
+            group[2] -= take
+            if group[2] == 0:
+                queue.popleft()
+        reviewed_total += reviewed
+        retention_total += retention_sum
+        forecast_days.append(
+            {
+                "date": day,
+                "theory_due": theory_due[offset],
+                "algorithm_due": algorithm_due[offset],
+                "due": theory_due[offset] + algorithm_due[offset],
+                "reviewed": reviewed,
+                "backlog": sum(group[2] for group in queue),
+                "expected_retention": (
+                    round(retention_sum / reviewed, 4) if reviewed else None
+                ),
+            }
+        )
+
+    return {
+        "start_date": today,
+        "days": days,
+        "daily_capacity": daily_capacity,
+        "overdue_count": overdue_count,
+        "total_due": sum(theory_due) + sum(algorithm_due),
+        "expected_retention": (
+            round(retention_total / reviewed_total, 4) if reviewed_total else None
+        ),
+        "backlog_end": forecast_days[-1]["backlog"] if forecast_days else 0,
+        "forecast": forecast_days,
+    }
+
+
+def _load_forecast(raw: bytes) -> dict[str, Any]:
+    forecast = json.loads(raw)
+    forecast["start_date"] = date.fromisoformat(forecast["start_date"])
+    for day in forecast["forecast"]:
+        day["date"] = date.fromisoformat(day["date"])
+    return forecast
+
+
+def get_review_forecast(
+    session: Session,
+    *,
+    user_id: UUID | None,
+    today: date,
+    days: int,
+    daily_capacity: int | None = None,
+) -> dict[str, Any]:
+    """Return a cached forecast, computing it on a miss or after expiry."""
+    if user_id is None:
+        # Per-user tags cannot invalidate the all-users view; always compute.
+        return compute_review_forecast(
+            session,
+            user_id=None,
+            today=today,
+            days=days,
+            daily_capacity=daily_capacity,
+        )
+
+    cache = get_response_cache()
+    key = f"review_forecast:{user_id}:{today}:{days}:{daily_capacity}"
+    cached = cache.get(key)
+    if cached is not None:
+        return _load_forecast(cached)
+
+    versions = cache.tag_versions(entry_tags(user_id, FORECAST_CACHE_DOMAINS))
+    result = compute_review_forecast(
+        session,
+        user_id=user_id,
+        today=today,
+        days=days,
+        daily_capacity=daily_capacity,
+    )
+    cache.set(key, json.dumps(result, default=date.isoformat).encode(), versions)
+    return result
@@ -0,0 +1,358 @@
+"""Pluggable spaced-repetition schedulers for review items."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Protocol
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, undefer
+
+from studying_light.db.constants import (
+    REVIEW_SCHEDULER_FIXED,
+    REVIEW_SCHEDULER_SM2,
+)
+from studying_light.db.models.algorithm import Algorithm
+from studying_light.db.models.algorithm_review_item import AlgorithmReviewItem
+from studying_light.db.models.reading_part import ReadingPart
+from studying_light.db.models.review_schedule_item import ReviewScheduleItem
+from studying_light.services.user_settings import (
+    DEFAULT_SETTINGS,
+    UserSettingsSnapshot,
+    get_settings_snapshot,
+)
+
+DEFAULT_INTERVALS: list[int] = DEFAULT_SETTINGS["intervals_days"]
+
+RATING_WITHOUT_FEEDBACK = 4
+PASSING_RATING = 3
+SM2_INITIAL_EASE = 2.5
+SM2_MIN_EASE = 1.3
+MAX_INTERVAL_DAYS = 365
+
+
+@dataclass(frozen=True)
+class NextReview:
+    """Next review to materialize for a reading part or algorithm."""
+
+    step: int
+    interval_days: int
+
+
+class ReviewScheduler(Protocol):
+    """Strategy deciding which review items exist and when they are due."""
+
+    name: str
+    materializes_all: bool
+
+    def initial_steps(self, intervals: list[int]) -> list[int]:
+        """Return interval indexes to create right after an import."""
+
+    def next_review(
+        self,
+        intervals: list[int],
+        ratings: list[int | None],
+    ) -> NextReview | None:
+        """Return the review following the completed ones, if any."""
+
+
+class FixedIntervalScheduler:
+    """Create every configured interval up front (classic behaviour)."""
+
+    name = REVIEW_SCHEDULER_FIXED
+    materializes_all = True
+
+    def initial_steps(self, intervals: list[int]) -> list[int]:
+        """Materialize all configured intervals."""
+        return list(range(len(intervals)))
+
+    def next_review(
+        self,
+        intervals: list[int],
+        ratings: list[int | None],
+    ) -> NextReview | None:
+        """Nothing is created lazily."""
+        return None
+
+
+class Sm2Scheduler:
+    """SM-2 style scheduler creating only the next review item.
+
+    The configured intervals seed the first two repetitions, later intervals
+    grow by the ease factor, which in turn follows the review ratings. Each
+    passed review moves to the next question set; a failed one repeats it.
+    """
+
+    name = REVIEW_SCHEDULER_SM2
+    materializes_all = False
+
+    def initial_steps(self, intervals: list[int]) -> list[int]:
+        """Materialize only the first interval."""
+        return [0] if intervals else []
+
+    def next_review(
+        self,
+        intervals: list[int],
+        ratings: list[int | None],
+    ) -> NextReview | None:
+        """Replay the rating history and return the upcoming review."""
+        if not intervals:
+            return None
+
+        ease = SM2_INITIAL_EASE
+        repetition = 0
+        passed = 0
+        interval = intervals[0]
+        for rating in ratings:
+            quality = RATING_WITHOUT_FEEDBACK if rating is None else rating
+            ease = max(
+                SM2_MIN_EASE,
+                ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02),
+            )
+            if quality < PASSING_RATING:
+                repetition = 0
+                interval = intervals[0]
+                continue
+            repetition += 1
+            passed += 1
+            if repetition == 1:
+                interval = intervals[min(1, len(intervals) - 1)]
+            else:
+                interval = int(round(interval * ease))
+            interval = min(max(interval, 1), MAX_INTERVAL_DAYS)
+
+        if passed >= len(intervals):
+            return None
+        return NextReview(step=passed, interval_days=interval)
+
+
+REVIEW_SCHEDULER_REGISTRY: dict[str, ReviewScheduler] = {
+    REVIEW_SCHEDULER_FIXED: FixedIntervalScheduler(),
+    REVIEW_SCHEDULER_SM2: Sm2Scheduler(),
+}
+
+
+def get_review_scheduler(name: str | None) -> ReviewScheduler:
+    """Return a scheduler by name, falling back to the fixed one."""
+    return REVIEW_SCHEDULER_REGISTRY.get(
+        name or REVIEW_SCHEDULER_FIXED,
+        REVIEW_SCHEDULER_REGISTRY[REVIEW_SCHEDULER_FIXED],
+    )
+
+
+def get_user_review_scheduler(
+    settings: UserSettingsSnapshot | None,
+) -> ReviewScheduler:
+    """Return the scheduler configured in user settings."""
+    return get_review_scheduler(settings.review_scheduler if settings else None)
+
+
+def get_user_intervals(settings: UserSettingsSnapshot | None) -> list[int]:
+    """Return configured review intervals for a user.
+
+    Raises ValueError when the stored intervals are not integers.
+    """
+    if settings is None:
+        return list(DEFAULT_INTERVALS)
+    if settings.review_intervals is None:
+        raise ValueError("Invalid intervals configuration")
+    return list(settings.review_intervals)
+
+
+def questions_for_interval(
+    questions_by_interval: dict | None,
+    interval_days: int,
+) -> list | None:
+    """Return questions stored for an interval (int or str keyed)."""
+    if not questions_by_interval:
+        return None
+    questions = questions_by_interval.get(interval_days)
+    if questions is None:
+        questions = questions_by_interval.get(str(interval_days))
+    return questions
+
+
+def resolve_review_questions(
+    item: ReviewScheduleItem,
+    part: ReadingPart | None,
+) -> list | None:
+    """Return questions stored on the item or derived from its reading part.
+
+    Theory items leave ``questions`` empty when the part's question set for
+    ``interval_days`` applies, so the JSON is not duplicated into every row.
+    """
+    if item.questions is not None:
+        return item.questions
+    return questions_for_interval(
+        part.gpt_questions_by_interval if part else None,
+        item.interval_days,
+    )
+
+
+@dataclass(frozen=True)
+class ReviewTrack:
+    """Review item table scheduled per parent entity."""
+
+    item_model: type[ReviewScheduleItem] | type[AlgorithmReviewItem]
+    parent_column: str
+    derives_questions: bool = False
+
+
+THEORY_REVIEW_TRACK = ReviewTrack(
+    item_model=ReviewScheduleItem,
+    parent_column="reading_part_id",
+    derives_questions=True,
+)
+ALGORITHM_REVIEW_TRACK = ReviewTrack(
+    item_model=AlgorithmReviewItem,
+    parent_column="algorithm_id",
+)
+
+
+def _sync_next_review(
+    session: Session,
+    track: ReviewTrack,
+    scheduler: ReviewScheduler,
+    *,
+    user_id: UUID,
+    parent_id: int,
+    intervals: list[int],
+    questions_by_interval: dict | None,
+) -> None:
+    # Sessions run with autoflush disabled; pending ratings must be visible.
+    session.flush()
+    item_model = track.item_model
+    parent_column = getattr(item_model, track.parent_column)
+    done_items = (
+        session.execute(
+            select(item_model)
+            .where(
+                parent_column == parent_id,
+                item_model.user_id == user_id,
+                item_model.status == "done",
+            )
+            .order_by(item_model.completed_at, item_model.id)
+        )
+        .scalars()
+        .all()
+    )
+    planned_items = (
+        session.execute(
+            select(item_model).where(
+                parent_column == parent_id,
+                item_model.user_id == user_id,
+                item_model.status == "planned",
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if len(planned_items) > 1:
+        # Items materialized by the fixed scheduler are left untouched.
+        return
+
+    next_review = scheduler.next_review(
+        intervals,
+        [item.last_rating for item in done_items],
+    )
+    planned_item = planned_items[0] if planned_items else None
+    if next_review is None:
+        if planned_item is not None and done_items:
+            session.delete(planned_item)
+        return
+
+    last_done = done_items[-1] if done_items else None
+    base_date = (
+        last_done.completed_at.date()
+        if last_done is not None and last_done.completed_at
+        else date.today()
+    )
+    questions_interval = intervals[min(next_review.step, len(intervals) - 1)]
+    questions = questions_for_interval(questions_by_interval, questions_interval)
+    if questions is None and last_done is not None:
+        questions = last_done.questions
+        if questions is None:
+            questions = questions_for_interval(
+                questions_by_interval,
+                last_done.interval_days,
+            )
+    elif track.derives_questions and questions_interval == next_review.interval_days:
+        # The item view derives this set from the parent on read.
+        questions = None
+
+    if planned_item is None:
+        planned_item = item_model(
+            user_id=user_id,
+            status="planned",
+        )
+        setattr(planned_item, track.parent_column, parent_id)
+        session.add(planned_item)
+    planned_item.interval_days = next_review.interval_days
+    planned_item.due_date = base_date + timedelta(days=next_review.interval_days)
+    planned_item.questions = questions
+    session.flush()
+
+
+def sync_theory_review_schedule(
+    session: Session,
+    *,
+    user_id: UUID,
+    reading_part_id: int,
+) -> None:
+    """Create or move the next theory review after a completion or feedback."""
+    settings = get_settings_snapshot(session, user_id)
+    scheduler = get_user_review_scheduler(settings)
+    if scheduler.materializes_all:
+        return
+    part = session.execute(
+        select(ReadingPart)
+        .where(
+            ReadingPart.id == reading_part_id,
+            ReadingPart.user_id == user_id,
+        )
+        .options(undefer(ReadingPart.gpt_questions_by_interval))
+    ).scalar_one_or_none()
+    if part is None:
+        return
+    _sync_next_review(
+        session,
+        THEORY_REVIEW_TRACK,
+        scheduler,
+        user_id=user_id,
+        parent_id=part.id,
+        intervals=get_user_intervals(settings),
+        questions_by_interval=part.gpt_questions_by_interval,
+    )
+
+
+def sync_algorithm_review_schedule(
+    session: Session,
+    *,
+    user_id: UUID,
+    algorithm_id: int,
+) -> None:
+    """Create or move the next algorithm review after a completion or feedback."""
+    scheduler = get_user_review_scheduler(get_settings_snapshot(session, user_id))
+    if scheduler.materializes_all:
+        return
+    algorithm = session.execute(
+        select(Algorithm)
+        .where(
+            Algorithm.id == algorithm_id,
+            Algorithm.user_id == user_id,
+        )
+        .options(undefer(Algorithm.review_questions_by_interval))
+    ).scalar_one_or_none()
+    if algorithm is None:
+        return
+    _sync_next_review(
+        session,
+        ALGORITHM_REVIEW_TRACK,
+        scheduler,
+        user_id=user_id,
+        parent_id=algorithm.id,
+        intervals=DEFAULT_INTERVALS,
+        questions_by_interval=algorithm.review_questions_by_interval,
+    )
@@ -0,0 +1,115 @@
+"""Review statistics overview with per-user caching."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, literal, select, true, union_all
+from sqlalchemy.orm import Session
+
+from studying_light.db.models.algorithm_review_attempt import AlgorithmReviewAttempt
+from studying_light.db.models.algorithm_review_item import AlgorithmReviewItem
+from studying_light.db.models.review_attempt import ReviewAttempt
+from studying_light.db.models.review_schedule_item import ReviewScheduleItem
+from studying_light.services.book_purge import (
+    part_is_visible,
+    review_item_is_visible,
+)
+from studying_light.services.response_cache import entry_tags, get_response_cache
+
+# Review writes and book deletions invalidate the overview; rating windows
+# slide with time, so entries also expire with the cache TTL.
+STATS_CACHE_DOMAINS = ("reviews", "books")
+
+
+def _round_average(value: float | None) -> float | None:
+    if value is None:
+        return None
+    return round(float(value), 2)
+
+
+def compute_stats_overview(
+    session: Session,
+    *,
+    user_id: UUID,
+    now: datetime,
+) -> dict[str, Any]:
+    """Aggregate rating averages and item counts in two statements."""
+    since_7d = now - timedelta(days=7)
+    since_30d = now - timedelta(days=30)
+    rating_selects = [
+        select(
+            literal(kind).label("kind"),
+            func.avg(rating).filter(created_at >= since_7d).label("average_7d"),
+            func.avg(rating).label("average_30d"),
+        ).where(
+            user_column == user_id,
+            rating.is_not(None),
+            created_at >= since_30d,
+            visible,
+        )
+        for kind, rating, user_column, created_at, visible in (
+            (
+                "theory",
+                ReviewAttempt.gpt_rating_1_to_5,
+                ReviewAttempt.user_id,
+                ReviewAttempt.created_at,
+                review_item_is_visible(ReviewAttempt.review_item_id),
+            ),
+            (
+                "algorithms",
+                AlgorithmReviewAttempt.rating_1_to_5,
+                AlgorithmReviewAttempt.user_id,
+                AlgorithmReviewAttempt.created_at,
+                true(),
+            ),
+        )
+    ]
+    count_selects = [
+        select(
+            literal(kind).label("kind"),
+            func.count(model.id).filter(model.status == "planned").label("planned"),
+            func.count(model.id).filter(model.status == "done").label("completed"),
+        ).where(model.user_id == user_id, visible)
+        for kind, model, visible in (
+            (
+                "theory",
+                ReviewScheduleItem,
+                part_is_visible(ReviewScheduleItem.reading_part_id),
+            ),
+            ("algorithms", AlgorithmReviewItem, true()),
+        )
+    ]
+
+    overview: dict[str, dict[str, Any]] = {
+        kind: {} for kind in ("theory", "algorithms")
+    }
+    for kind, average_7d, average_30d in session.execute(union_all(*rating_selects)):
+        overview[kind]["average_rating_7d"] = _round_average(average_7d)
+        overview[kind]["average_rating_30d"] = _round_average(average_30d)
+    for kind, planned, completed in session.execute(union_all(*count_selects)):
+        overview[kind]["planned_count"] = int(planned or 0)
+        overview[kind]["completed_count"] = int(completed or 0)
+    return overview
+
+
+def get_stats_overview(
+    session: Session,
+    *,
+    user_id: UUID,
+    now: datetime,
+) -> dict[str, Any]:
+    """Return a cached overview, computing it on a miss or after expiry."""
+    cache = get_response_cache()
+    key = f"stats_overview:{user_id}"
+    cached = cache.get(key)
+    if cached is not None:
+        return json.loads(cached)
+
+    versions = cache.tag_versions(entry_tags(user_id, STATS_CACHE_DOMAINS))
+    result = compute_stats_overview(session, user_id=user_id, now=now)
+    cache.set(key, json.dumps(result).encode(), versions)
+    return result
@@ -1,8 +1,21 @@
-"""User settings defaults and helpers."""
+"""User settings defaults, snapshots and the per-user settings cache."""
+
+from __future__ import annotations
 
 import uuid
+from dataclasses import dataclass, replace
+from threading import Lock
+from typing import Any
+
+from sqlalchemy.orm import Session
 
+from studying_light.db.constants import REVIEW_SCHEDULER_FIXED
 from studying_light.db.models.user_settings import UserSettings
+from studying_light.services.change_tracker import Changes, on_after_commit
+from studying_light.services.invalidation_bus import (
+    publish_invalidation,
+    subscribe_invalidations,
+)
 
 DEFAULT_SETTINGS = {
     "timezone": "Europe/Amsterdam",
@@ -11,9 +24,142 @@ DEFAULT_SETTINGS = {
     "daily_goal_weekday_min": 40,
     "daily_goal_weekend_min": 60,
     "intervals_days": [1, 7, 16, 35, 90],
+    "review_scheduler": REVIEW_SCHEDULER_FIXED,
 }
+SETTINGS_CACHE_MAX_ENTRIES = 4096
+INVALIDATION_CHANNEL = "user_settings"
+ALL_USERS_KEY = "*"
 
 
 def build_default_settings(user_id: uuid.UUID) -> UserSettings:
     """Build default settings for a user."""
     return UserSettings(user_id=user_id, **DEFAULT_SETTINGS)
+
+
+def _parse_intervals(intervals: Any) -> tuple[int, ...] | None:
+    if not intervals:
+        intervals = DEFAULT_SETTINGS["intervals_days"]
+    try:
+        return tuple(int(value) for value in intervals)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class UserSettingsSnapshot:
+    """Immutable copy of a user's settings, defaults when no row exists.
+
+    ``review_intervals`` holds the parsed intervals with defaults applied,
+    or None when the stored ``intervals_days`` are not integers.
+    """
+
+    user_id: uuid.UUID
+    timezone: str | None
+    pomodoro_work_min: int | None
+    pomodoro_break_min: int | None
+    daily_goal_weekday_min: int | None
+    daily_goal_weekend_min: int | None
+    intervals_days: tuple[Any, ...] | None
+    review_scheduler: str | None
+    review_intervals: tuple[int, ...] | None
+    persisted: bool
+
+    @classmethod
+    def from_row(cls, settings: UserSettings) -> UserSettingsSnapshot:
+        """Copy a settings row."""
+        intervals = settings.intervals_days
+        return cls(
+            user_id=settings.user_id,
+            timezone=settings.timezone,
+            pomodoro_work_min=settings.pomodoro_work_min,
+            pomodoro_break_min=settings.pomodoro_break_min,
+            daily_goal_weekday_min=settings.daily_goal_weekday_min,
+            daily_goal_weekend_min=settings.daily_goal_weekend_min,
+            intervals_days=tuple(intervals) if intervals is not None else None,
+            review_scheduler=settings.review_scheduler,
+            review_intervals=_parse_intervals(intervals),
+            persisted=True,
+        )
+
+    @classmethod
+    def defaults(cls, user_id: uuid.UUID) -> UserSettingsSnapshot:
+        """Return the settings a user without a row gets."""
+        return replace(
+            cls.from_row(build_default_settings(user_id)),
+            persisted=False,
+        )
+
+
+_cache: dict[uuid.UUID, UserSettingsSnapshot] = {}
+_versions: dict[uuid.UUID, int] = {}
+_generation = 0
+_cache_lock = Lock()
+
+
+def get_settings_snapshot(
+    session: Session,
+    user_id: uuid.UUID,
+) -> UserSettingsSnapshot:
+    """Return the user's settings, loading them once per change.
+
+    Never writes: users without a settings row get the defaults.
+    """
+    with _cache_lock:
+        cached = _cache.get(user_id)
+        version = (_generation, _versions.get(user_id, 0))
+    if cached is not None:
+        return cached
+
+    settings = session.get(UserSettings, user_id)
+    if settings is None:
+        snapshot = UserSettingsSnapshot.defaults(user_id)
+    else:
+        snapshot = UserSettingsSnapshot.from_row(settings)
+        # Uncommitted edits of this session must not leak to other requests.
+        if settings in session.new or session.is_modified(settings):
+            return snapshot
+    with _cache_lock:
+        # Skip the store if an invalidation ran while the row was read.
+        if version == (_generation, _versions.get(user_id, 0)):
+            if len(_cache) >= SETTINGS_CACHE_MAX_ENTRIES:
+                _cache.pop(next(iter(_cache)))
+            _cache[user_id] = snapshot
+    return snapshot
+
+
+def invalidate_settings_snapshot(user_id: uuid.UUID | None = None) -> None:
+    """Drop the cached settings of a user, or of everyone."""
+    global _generation
+    with _cache_lock:
+        if user_id is None:
+            _generation += 1
+            _cache.clear()
+            return
+        _versions[user_id] = _versions.get(user_id, 0) + 1
+        _cache.pop(user_id, None)
+
+
+@on_after_commit
+def _invalidate_changed_settings(changes: Changes) -> None:
+    user_ids = changes.get(UserSettings.__tablename__)
+    if not user_ids:
+        return
+    # A None user (bulk statement outside a request) drops every snapshot.
+    if None in user_ids:
+        invalidate_settings_snapshot()
+        publish_invalidation(INVALIDATION_CHANNEL, [ALL_USERS_KEY])
+        return
+    for user_id in user_ids:
+        invalidate_settings_snapshot(user_id)
+    publish_invalidation(INVALIDATION_CHANNEL, map(str, user_ids))
+
+
+def _invalidate_from_other_worker(keys: list[str]) -> None:
+    if ALL_USERS_KEY in keys:
+        invalidate_settings_snapshot()
+        return
+    for key in keys:
+        invalidate_settings_snapshot(uuid.UUID(key))
+
+
+subscribe_invalidations(INVALIDATION_CHANNEL, _invalidate_from_other_worker)
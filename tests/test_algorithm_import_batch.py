@@ -0,0 +1,198 @@
+"""Batched algorithm import tests."""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from studying_light.db.models.algorithm import Algorithm
+from studying_light.db.models.algorithm_code_snippet import AlgorithmCodeSnippet
+from studying_light.db.models.algorithm_group import AlgorithmGroup
+from studying_light.db.models.algorithm_review_item import AlgorithmReviewItem
+
+
+def _algorithm(
+    title: str,
+    *,
+    group_id: int | None = None,
+    group_title_new: str | None = None,
+    source_part_id: int | None = None,
+) -> dict[str, object]:
+    return {
+        "title": title,
+        "summary": "Summary",
+        "when_to_use": "When to use",
+        "complexity": "O(n)",
+        "invariants": ["Always holds"],
+        "steps": ["Step 1"],
+        "corner_cases": ["None"],
+        "review_questions_by_interval": {
+            1: [f"{title} Q1"],
+            7: ["Q2"],
+            16: ["Q3"],
+            35: ["Q4"],
+            90: ["Q5"],
+        },
+        "code": {"code_kind": "pseudocode", "language": "text", "code_text": title},
+        "group_id": group_id,
+        "group_title_new": group_title_new,
+        "source_part_id": source_part_id,
+    }
+
+
+def _create_part(client: TestClient, headers: dict[str, str]) -> int:
+    book_id = client.post(
+        "/api/v1/books",
+        json={"title": "Algorithms Book"},
+        headers=headers,
+    ).json()["id"]
+    return client.post(
+        "/api/v1/parts",
+        json={"book_id": book_id, "label": "Chapter 1"},
+        headers=headers,
+    ).json()["id"]
+
+
+def test_import_algorithms_uses_bulk_statements(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """Lookups and inserts run once per table regardless of item count."""
+    part_id = _create_part(client, auth_headers)
+    existing_group_id = client.post(
+        "/api/v1/algorithm-groups",
+        json={"title": "Graphs"},
+        headers=auth_headers,
+    ).json()["id"]
+    algorithms = [
+        _algorithm(
+            f"Graph {index}",
+            group_id=existing_group_id,
+            source_part_id=part_id,
+        )
+        for index in range(5)
+    ]
+    algorithms += [
+        _algorithm(f"Sort {index}", group_title_new="Sorting") for index in range(5)
+    ]
+    algorithms.append(_algorithm("Trees", group_title_new=" graphs "))
+
+    statements: list[str] = []
+    engine = session.get_bind()
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        response = client.post(
+            "/api/v1/algorithms/import",
+            json={
+                "groups": [{"title": "Sorting", "description": "Orderings"}],
+                "algorithms": algorithms,
+            },
+            headers=auth_headers,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert response.status_code == 201
+    payload = response.json()
+    assert payload["groups_created"] == 1
+    assert payload["review_items_created"] == 55
+    created = payload["algorithms_created"]
+    assert len(created) == 11
+    assert {item["group_id"] for item in created[:5]} == {existing_group_id}
+    assert created[-1]["group_id"] == existing_group_id
+
+    # Without an implicit insert sentinel (SQLite), SQLAlchemy keeps RETURNING
+    # in parameter order by inserting the algorithms one row at a time.
+    ordered_batches = engine.dialect.name != "sqlite"
+    for table, expected_inserts in (
+        ("algorithm_groups", 1),
+        ("algorithms", 1 if ordered_batches else len(algorithms)),
+        ("algorithm_code_snippets", 1),
+        ("algorithm_review_items", 1),
+    ):
+        inserts = [sql for sql in statements if sql.startswith(f"INSERT INTO {table} ")]
+        assert len(inserts) == expected_inserts, table
+    part_lookups = [
+        sql for sql in statements if "FROM reading_parts" in sql and "IN" in sql
+    ]
+    assert len(part_lookups) == 1
+
+    session.expire_all()
+    titles = dict(
+        session.execute(
+            select(Algorithm.id, Algorithm.title).where(
+                Algorithm.id.in_([item["algorithm_id"] for item in created])
+            )
+        ).all()
+    )
+    assert [titles[item["algorithm_id"]] for item in created] == [
+        algorithm["title"] for algorithm in algorithms
+    ]
+    snippet_texts = dict(
+        session.execute(
+            select(AlgorithmCodeSnippet.algorithm_id, AlgorithmCodeSnippet.code_text)
+        ).all()
+    )
+    assert all(snippet_texts[item_id] == title for item_id, title in titles.items())
+    sorting = session.execute(
+        select(AlgorithmGroup).where(AlgorithmGroup.title_norm == "sorting")
+    ).scalar_one()
+    assert sorting.title == "Sorting"
+    assert sorting.description == "Orderings"
+    first_questions = session.execute(
+        select(AlgorithmReviewItem.questions).where(
+            AlgorithmReviewItem.algorithm_id == created[0]["algorithm_id"],
+            AlgorithmReviewItem.interval_days == 1,
+        )
+    ).scalar_one()
+    assert first_questions == ["Graph 0 Q1"]
+
+
+def test_import_algorithms_rejects_foreign_references_before_writing(
+    client: TestClient,
+    session: Session,
+    user_pair_headers: tuple[dict[str, str], dict[str, str]],
+) -> None:
+    """Unknown group or source part ids reject the whole import."""
+    owner_headers, other_headers = user_pair_headers
+    owner_part = _create_part(client, owner_headers)
+    other_part = _create_part(client, other_headers)
+    other_group_id = client.post(
+        "/api/v1/algorithm-groups",
+        json={"title": "Theirs"},
+        headers=other_headers,
+    ).json()["id"]
+
+    foreign_part = client.post(
+        "/api/v1/algorithms/import",
+        json={
+            "algorithms": [
+                _algorithm("Mine", group_title_new="New", source_part_id=owner_part),
+                _algorithm("Theirs", group_title_new="New", source_part_id=other_part),
+            ]
+        },
+        headers=owner_headers,
+    )
+    assert foreign_part.status_code == 404
+    assert foreign_part.json()["detail"] == "Reading part not found"
+
+    foreign_group = client.post(
+        "/api/v1/algorithms/import",
+        json={
+            "algorithms": [
+                _algorithm("Mine", group_title_new="New"),
+                _algorithm("Theirs", group_id=other_group_id),
+            ]
+        },
+        headers=owner_headers,
+    )
+    assert foreign_group.status_code == 404
+    assert foreign_group.json()["detail"] == "Algorithm group not found"
+
+    session.expire_all()
+    assert session.execute(select(func.count(Algorithm.id))).scalar_one() == 0
+    assert session.execute(select(func.count(AlgorithmGroup.id))).scalar_one() == 1
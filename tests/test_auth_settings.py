@@ -1,7 +1,7 @@
 """Auth and settings tests."""
 
 from fastapi.testclient import TestClient
-from sqlalchemy import select
+from sqlalchemy import delete, event, select, update
 from sqlalchemy.orm import Session
 
 from studying_light.db.models.user import User
@@ -46,3 +46,68 @@ def test_login_inactive_returns_account_inactive(client: TestClient) -> None:
     )
     assert login_response.status_code == 403
     assert login_response.json()["code"] == "ACCOUNT_INACTIVE"
+
+
+def test_settings_snapshot_is_cached_until_settings_change(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """Reads skip user_settings until a PATCH or bulk write invalidates them."""
+    assert client.get("/api/v1/settings", headers=auth_headers).status_code == 200
+
+    statements: list[str] = []
+    engine = session.get_bind()
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        cached = client.get("/api/v1/settings", headers=auth_headers)
+        me = client.get("/api/v1/auth/me", headers=auth_headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    assert cached.json()["timezone"] == "Europe/Amsterdam"
+    assert me.json()["timezone"] == "Europe/Amsterdam"
+    assert not [sql for sql in statements if "user_settings" in sql]
+
+    updated = client.patch(
+        "/api/v1/settings",
+        json={"timezone": "Asia/Tokyo"},
+        headers=auth_headers,
+    )
+    assert updated.json()["timezone"] == "Asia/Tokyo"
+    settings = client.get("/api/v1/settings", headers=auth_headers).json()
+    assert settings["timezone"] == "Asia/Tokyo"
+
+    # Bulk statements (as used by profile import) invalidate as well.
+    session.execute(update(UserSettings).values(timezone="UTC"))
+    session.commit()
+    settings = client.get("/api/v1/settings", headers=auth_headers).json()
+    assert settings["timezone"] == "UTC"
+
+
+def test_get_settings_serves_defaults_without_creating_a_row(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """GET /settings never writes; the first PATCH creates the row."""
+    session.execute(delete(UserSettings))
+    session.commit()
+
+    response = client.get("/api/v1/settings", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["intervals_days"] == [1, 7, 16, 35, 90]
+    assert session.scalars(select(UserSettings)).all() == []
+
+    response = client.patch(
+        "/api/v1/settings",
+        json={"daily_goal_weekday_min": 30},
+        headers=auth_headers,
+    )
+    assert response.json()["daily_goal_weekday_min"] == 30
+    assert response.json()["pomodoro_work_min"] == 25
+    (settings,) = session.scalars(select(UserSettings)).all()
+    assert settings.daily_goal_weekday_min == 30
@@ -0,0 +1,154 @@
+"""Book counter maintenance tests."""
+
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from alembic.config import Config
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.orm import Session
+
+from alembic import command
+from studying_light.db.models.book import Book
+from studying_light.services.book_counters import rebuild_book_counters
+
+COUNTER_COLUMNS = (
+    Book.parts_total,
+    Book.sessions_total,
+    Book.reading_seconds_total,
+    Book.pages_read_sum,
+    Book.last_page_end,
+    Book.next_part_index,
+)
+
+
+def test_part_creation_maintains_book_counters(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """Counters follow part writes and match a rebuild from reading_parts."""
+    book_id = client.post(
+        "/api/v1/books",
+        json={"title": "Counted", "pages_total": 300},
+        headers=auth_headers,
+    ).json()["id"]
+    parts = [
+        {"page_end": 20, "session_seconds": 600},
+        {"page_end": 45, "session_seconds": 900},
+        {"pages_read": 5},
+    ]
+    created = [
+        client.post(
+            "/api/v1/parts",
+            json={"book_id": book_id, **part},
+            headers=auth_headers,
+        ).json()
+        for part in parts
+    ]
+    assert [part["part_index"] for part in created] == [1, 2, 3]
+    assert [part["pages_read"] for part in created] == [20, 25, 5]
+
+    statements: list[str] = []
+    engine = session.get_bind()
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        response = client.get("/api/v1/books", headers=auth_headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert response.status_code == 200
+    (book,) = response.json()
+    assert book["parts_total"] == 3
+    assert book["sessions_total"] == 2
+    assert book["reading_seconds_total"] == 1500
+    assert book["pages_read_total"] == 45
+    assert not [sql for sql in statements if "reading_parts" in sql]
+
+    session.expire_all()
+    maintained = session.execute(select(*COUNTER_COLUMNS)).one()
+    assert maintained == (3, 2, 1500, 50, 45, 4)
+    assert rebuild_book_counters(session) == 1
+    assert session.execute(select(*COUNTER_COLUMNS)).one() == maintained
+
+
+def test_book_counters_migration_backfills_existing_parts(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Migration 0019 should derive counters from existing reading parts."""
+    db_url = f"sqlite:///{tmp_path / 'migration-book-counters.db'}"
+    monkeypatch.setenv("DATABASE_URL", db_url)
+    alembic_cfg = Config("alembic.ini")
+
+    command.upgrade(alembic_cfg, "0018_add_review_item_last_attempt")
+    engine = create_engine(db_url)
+    user_id = str(uuid4())
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                """
+                INSERT INTO users (id, email, password_hash)
+                VALUES (:id, 'counters@local', 'hash')
+                """
+            ),
+            {"id": user_id},
+        )
+        for book_id in (1, 2):
+            connection.execute(
+                text(
+                    """
+                    INSERT INTO books (id, user_id, title, status)
+                    VALUES (:id, :user_id, 'Book', 'active')
+                    """
+                ),
+                {"id": book_id, "user_id": user_id},
+            )
+        for part_index, pages_read, seconds, page_end in (
+            (1, 10, 300, None),
+            (4, 7, None, 60),
+        ):
+            connection.execute(
+                text(
+                    """
+                    INSERT INTO reading_parts (
+                        user_id, book_id, part_index, pages_read,
+                        session_seconds, page_end
+                    ) VALUES (
+                        :user_id, 1, :part_index, :pages_read, :seconds, :page_end
+                    )
+                    """
+                ),
+                {
+                    "user_id": user_id,
+                    "part_index": part_index,
+                    "pages_read": pages_read,
+                    "seconds": seconds,
+                    "page_end": page_end,
+                },
+            )
+
+    command.upgrade(alembic_cfg, "0019_add_book_counters")
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text(
+                """
+                SELECT id, parts_total, sessions_total, reading_seconds_total,
+                    pages_read_sum, last_page_end, next_part_index
+                FROM books
+                ORDER BY id
+                """
+            )
+        ).all()
+    assert [tuple(row) for row in rows] == [
+        (1, 2, 1, 300, 17, 60, 5),
+        (2, 0, 0, 0, 0, None, 1),
+    ]
+
+    command.downgrade(alembic_cfg, "0018_add_review_item_last_attempt")
+    engine.dispose()
@@ -0,0 +1,304 @@
+"""Book soft delete and background purge tests."""
+
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, func, select, update
+from sqlalchemy.orm import Session
+
+from studying_light.db.models.algorithm import Algorithm
+from studying_light.db.models.book import Book
+from studying_light.db.models.reading_part import ReadingPart
+from studying_light.db.models.review_attempt import ReviewAttempt
+from studying_light.db.models.review_schedule_item import ReviewScheduleItem
+from studying_light.services.book_purge import (
+    PURGE_DONE,
+    PURGE_FAILED,
+    purge_book,
+    purge_unfinished_books,
+    soft_delete_book,
+)
+
+QUESTIONS_BY_INTERVAL = {
+    "1": ["Q1"],
+    "7": ["Q2"],
+    "16": ["Q3"],
+    "35": ["Q4"],
+    "90": ["Q5"],
+}
+
+FEEDBACK = {
+    "gpt_check_result": {
+        "meta": {
+            "book_title": "Doomed",
+            "part_index": 1,
+            "part_label": "Part 1",
+            "interval_days": 1,
+            "review_date": "2026-01-01",
+        },
+        "overall": {
+            "rating_1_to_5": 4,
+            "score_0_to_100": 80,
+            "verdict": "PASS",
+            "key_gaps": [],
+            "next_steps": [],
+            "limitations": [],
+        },
+        "items": [
+            {
+                "question": "Q1",
+                "user_answer": "A1",
+                "rating_1_to_5": 4,
+                "is_answered": True,
+                "mistakes": [],
+                "short_feedback": "",
+                "correct_answer": "A1",
+            }
+        ],
+    }
+}
+
+
+def _create_book_with_reviews(
+    client: TestClient,
+    headers: dict[str, str],
+    parts: int,
+) -> tuple[int, list[int]]:
+    book_id = client.post(
+        "/api/v1/books",
+        json={"title": "Doomed"},
+        headers=headers,
+    ).json()["id"]
+    part_ids = []
+    for index in range(parts):
+        part_id = client.post(
+            "/api/v1/parts",
+            json={"book_id": book_id, "label": f"Part {index + 1}"},
+            headers=headers,
+        ).json()["id"]
+        client.post(
+            f"/api/v1/parts/{part_id}/import_gpt",
+            json={
+                "gpt_summary": "Summary",
+                "gpt_questions_by_interval": QUESTIONS_BY_INTERVAL,
+            },
+            headers=headers,
+        )
+        part_ids.append(part_id)
+    return book_id, part_ids
+
+
+def test_delete_book_hides_it_and_purges_in_background(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """The book disappears at once and its rows are purged after the response."""
+    book_id, part_ids = _create_book_with_reviews(client, auth_headers, 3)
+    today = client.get("/api/v1/reviews/today", headers=auth_headers).json()
+    review_id = today[0]["id"]
+    complete = client.post(
+        f"/api/v1/reviews/{review_id}/complete",
+        json={"answers": {"Q1": "A1"}},
+        headers=auth_headers,
+    )
+    assert complete.status_code == 200
+    algorithm_response = client.post(
+        "/api/v1/algorithms/import",
+        json={
+            "algorithms": [
+                {
+                    "title": "Kept",
+                    "summary": "Summary",
+                    "when_to_use": "Always",
+                    "complexity": "O(1)",
+                    "invariants": ["I"],
+                    "steps": ["S"],
+                    "corner_cases": ["C"],
+                    "review_questions_by_interval": QUESTIONS_BY_INTERVAL,
+                    "code": {
+                        "code_kind": "pseudocode",
+                        "language": "text",
+                        "code_text": "code",
+                    },
+                    "group_title_new": "Group",
+                    "source_part_id": part_ids[0],
+                }
+            ]
+        },
+        headers=auth_headers,
+    )
+    assert algorithm_response.status_code == 201
+
+    response = client.delete(f"/api/v1/books/{book_id}", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "deleted", "purge_status": "pending"}
+    assert client.get("/api/v1/books", headers=auth_headers).json() == []
+    assert client.get("/api/v1/reviews/today", headers=auth_headers).json() == []
+    assert (
+        client.delete(f"/api/v1/books/{book_id}", headers=auth_headers).status_code
+        == 404
+    )
+    purge = client.get(f"/api/v1/books/{book_id}/purge", headers=auth_headers).json()
+    assert purge["purge_status"] == PURGE_DONE
+    assert purge["purged_rows"] == 3 + 15 + 1
+
+    session.expire_all()
+    for model in (ReadingPart, ReviewScheduleItem, ReviewAttempt):
+        assert session.execute(select(func.count(model.id))).scalar_one() == 0
+    assert session.execute(select(Algorithm.source_part_id)).scalar_one() is None
+
+
+def test_purge_book_commits_chunks_and_resumes_failed_purges(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """Each chunk of parts is deleted in its own statement and transaction."""
+    book_id, _ = _create_book_with_reviews(client, auth_headers, 3)
+    book = session.get(Book, book_id)
+    soft_delete_book(book)
+    session.commit()
+
+    statements: list[str] = []
+    engine = session.get_bind()
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        purged = purge_book(session, book_id, chunk_size=2)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert purged == 3 + 15
+    part_deletes = [
+        sql for sql in statements if sql.startswith("DELETE FROM reading_parts")
+    ]
+    assert len(part_deletes) == 2
+
+    other_book_id, _ = _create_book_with_reviews(client, auth_headers, 1)
+    other_book = session.get(Book, other_book_id)
+    soft_delete_book(other_book)
+    other_book.purge_status = PURGE_FAILED
+    session.commit()
+
+    assert purge_unfinished_books(session) == [other_book_id]
+    session.expire_all()
+    assert session.get(Book, other_book_id).purge_status == PURGE_DONE
+    assert session.execute(select(func.count(ReadingPart.id))).scalar_one() == 0
+
+
+def test_soft_deleted_book_is_hidden_before_the_purge_runs(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """Until its rows are purged, a deleted book's parts and reviews are gone."""
+    book_id, part_ids = _create_book_with_reviews(client, auth_headers, 2)
+    review_ids = list(
+        session.scalars(select(ReviewScheduleItem.id).order_by(ReviewScheduleItem.id))
+    )
+    rated = client.post(
+        f"/api/v1/reviews/{review_ids[0]}/save_gpt_feedback",
+        json=FEEDBACK,
+        headers=auth_headers,
+    )
+    assert rated.status_code == 200
+    session.execute(
+        update(ReviewScheduleItem).values(due_date=date.today() - timedelta(days=3))
+    )
+    session.commit()
+    client.get("/api/v1/stats", headers=auth_headers)
+    client.get("/api/v1/reviews/forecast", headers=auth_headers)
+
+    # Soft delete without the background purge that DELETE /books schedules.
+    soft_delete_book(session.get(Book, book_id))
+    session.commit()
+
+    assert (
+        client.get(
+            "/api/v1/parts", params={"book_id": book_id}, headers=auth_headers
+        ).json()
+        == []
+    )
+    import_payload = {
+        "gpt_summary": "Summary",
+        "gpt_questions_by_interval": QUESTIONS_BY_INTERVAL,
+    }
+    assert (
+        client.post(
+            f"/api/v1/parts/{part_ids[0]}/import_gpt",
+            json=import_payload,
+            headers=auth_headers,
+        ).status_code
+        == 404
+    )
+    assert (
+        client.post(
+            "/api/v1/parts/import_gpt_batch",
+            json={"items": [{**import_payload, "reading_part_id": part_ids[0]}]},
+            headers=auth_headers,
+        ).status_code
+        == 404
+    )
+
+    review_id = review_ids[1]
+    assert (
+        client.get(f"/api/v1/reviews/{review_id}", headers=auth_headers).status_code
+        == 404
+    )
+    assert (
+        client.post(
+            f"/api/v1/reviews/{review_id}/complete",
+            json={"answers": {"Q1": "A1"}},
+            headers=auth_headers,
+        ).status_code
+        == 404
+    )
+    assert (
+        client.post(
+            f"/api/v1/reviews/{review_id}/save_gpt_feedback",
+            json=FEEDBACK,
+            headers=auth_headers,
+        ).status_code
+        == 404
+    )
+    batch = client.post(
+        "/api/v1/reviews/complete-batch",
+        json={"items": [{"review_id": review_id, "answers": {}}]},
+        headers=auth_headers,
+    )
+    assert batch.json()["completed"] == 0
+    assert (
+        client.get(
+            "/api/v1/reviews/schedule",
+            params={"reading_part_id": part_ids[0]},
+            headers=auth_headers,
+        ).json()
+        == []
+    )
+
+    theory = client.get("/api/v1/stats", headers=auth_headers).json()["theory"]
+    assert theory["planned_count"] == 0
+    assert theory["completed_count"] == 0
+    assert theory["average_rating_30d"] is None
+    forecast = client.get("/api/v1/reviews/forecast", headers=auth_headers).json()
+    assert forecast["overdue_count"] == 0
+    assert forecast["total_due"] == 0
+    spread = client.post(
+        "/api/v1/reviews/spread-overdue",
+        json={"days": 3, "daily_cap": 5},
+        headers=auth_headers,
+    ).json()
+    assert spread["overdue_count"] == 0
+    assert spread["updated_count"] == 0
+
+    session.expire_all()
+    assert session.execute(
+        select(func.count(ReviewScheduleItem.id)).where(
+            ReviewScheduleItem.status == "planned"
+        )
+    ).scalar_one() == len(review_ids)
@@ -0,0 +1,62 @@
+"""Shared change tracker tests."""
+
+import copy
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from studying_light.db.models.book import Book
+from studying_light.db.models.user import User
+from studying_light.services import change_tracker
+from studying_light.services.change_tracker import (
+    Changes,
+    on_after_commit,
+    set_session_user,
+)
+
+
+@pytest.fixture()
+def committed() -> Iterator[list[Changes]]:
+    """Collect the changes of every commit while the test runs."""
+    seen: list[Changes] = []
+
+    def _collect(changes: Changes) -> None:
+        seen.append(copy.deepcopy(changes))
+
+    on_after_commit(_collect)
+    try:
+        yield seen
+    finally:
+        change_tracker._after_commit_callbacks.remove(_collect)
+
+
+def test_tracker_reports_flushed_and_bulk_changes_per_user(
+    session: Session,
+    committed: list[Changes],
+    user_pair_headers: tuple[dict[str, str], dict[str, str]],
+) -> None:
+    """Rows are charged to their owner, bulk statements to the request user."""
+    user_a, user_b = session.scalars(select(User).order_by(User.email)).all()
+    committed.clear()
+
+    session.add(Book(user_id=user_a.id, title="Mine"))
+    session.commit()
+    assert committed == [{"books": {user_a.id}}]
+
+    set_session_user(session, user_b.id)
+    session.execute(update(Book).values(title="Renamed"))
+    session.commit()
+    assert committed[-1] == {"books": {user_b.id}}
+
+    session.info.clear()
+    session.execute(update(Book).values(title="Again"))
+    session.commit()
+    assert committed[-1] == {"books": {None}}
+
+    session.add(Book(user_id=user_a.id, title="Dropped"))
+    session.flush()
+    session.rollback()
+    session.commit()
+    assert len(committed) == 3
@@ -0,0 +1,158 @@
+"""Gzip response compression middleware tests."""
+
+import gzip
+import json
+from uuid import uuid4
+
+import anyio
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+from starlette.types import Message
+
+from studying_light.api.compression import CompressionMiddleware
+from studying_light.db.models.user import User
+from studying_light.services.compression_stats import CompressionStats
+
+ROWS = [{"id": index, "title": f"Book {index}"} for index in range(200)]
+# Random ids keep the stream from compressing into a single tiny chunk.
+STREAM_ROWS = [f"{index},{uuid4().hex}\n" for index in range(5000)]
+
+
+async def _large_json(request) -> Response:
+    return JSONResponse(ROWS, headers={"ETag": '"rows"'})
+
+
+async def _small_json(request) -> Response:
+    return JSONResponse({"status": "ok"})
+
+
+async def _zip_archive(request) -> Response:
+    return Response(b"PK" * 4096, media_type="application/zip")
+
+
+async def _csv_stream(request) -> Response:
+    async def rows():
+        for row in STREAM_ROWS:
+            yield row.encode()
+
+    return StreamingResponse(rows(), media_type="text/csv; charset=utf-8")
+
+
+@pytest.fixture()
+def stats() -> CompressionStats:
+    """Provide counters private to the test app."""
+    return CompressionStats()
+
+
+@pytest.fixture()
+def app(stats: CompressionStats) -> CompressionMiddleware:
+    """Wrap a few representative endpoints in the middleware."""
+    routes = Starlette(
+        routes=[
+            Route("/large", _large_json),
+            Route("/small", _small_json),
+            Route("/archive", _zip_archive),
+            Route("/stream", _csv_stream),
+        ]
+    )
+    return CompressionMiddleware(routes, minimum_size=512, stats=stats)
+
+
+def test_large_bodies_are_gzipped_and_small_or_zip_bodies_are_not(
+    app: CompressionMiddleware,
+    stats: CompressionStats,
+) -> None:
+    """Only compressible bodies above the threshold are encoded."""
+    client = TestClient(app)
+    large = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert large.headers["content-encoding"] == "gzip"
+    assert large.headers["vary"] == "Accept-Encoding"
+    assert large.headers["etag"] == 'W/"rows"'
+    assert large.json() == ROWS
+
+    refused = client.get("/large", headers={"Accept-Encoding": "br, gzip;q=0"})
+    assert "content-encoding" not in refused.headers
+    assert refused.headers["etag"] == '"rows"'
+
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    archive = client.get("/archive", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in archive.headers
+    assert archive.content == b"PK" * 4096
+
+    snapshot = stats.snapshot()
+    assert snapshot["responses"] == 1
+    assert snapshot["bytes_in"] == len(json.dumps(ROWS, separators=(",", ":")))
+    assert 0 < snapshot["ratio"] < 0.5
+
+
+def test_streaming_bodies_are_compressed_chunk_by_chunk(
+    app: CompressionMiddleware,
+    stats: CompressionStats,
+) -> None:
+    """The body goes out in pieces as it streams instead of in one buffer."""
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"accept-encoding", b"gzip")],
+        "client": ("testclient", 123),
+        "server": ("testserver", 80),
+    }
+    anyio.run(app, scope, receive, send)
+
+    start, *bodies = messages
+    assert (b"content-encoding", b"gzip") in start["headers"]
+    chunks = [message["body"] for message in bodies if message["body"]]
+    assert len(chunks) > 1
+    expected = "".join(STREAM_ROWS)
+    assert gzip.decompress(b"".join(chunks)).decode() == expected
+    snapshot = stats.snapshot()
+    assert snapshot["responses"] == 1
+    assert snapshot["streamed"] == 1
+    assert snapshot["bytes_in"] == len(expected)
+    assert snapshot["bytes_out"] == sum(map(len, chunks))
+
+
+def test_app_compresses_csv_exports_and_reports_the_ratio(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """The CSV export streams gzipped, the ZIP export goes out as is."""
+    headers = {**auth_headers, "Accept-Encoding": "gzip"}
+    for index in range(30):
+        client.post("/api/v1/books", json={"title": f"Book {index}"}, headers=headers)
+
+    csv_export = client.get("/api/v1/export.csv", headers=headers)
+    assert csv_export.headers["content-encoding"] == "gzip"
+    assert "Book 29" in csv_export.text
+    zip_export = client.get("/api/v1/export.zip", headers=headers)
+    assert "content-encoding" not in zip_export.headers
+
+    admin = session.scalars(select(User).where(User.email == "user@local")).one()
+    admin.is_admin = True
+    session.commit()
+    stats = client.get("/api/v1/admin/compression", headers=headers)
+    assert stats.status_code == 200
+    assert stats.json()["responses"] >= 1
+    assert 0 < stats.json()["ratio"] < 1
@@ -0,0 +1,117 @@
+"""Data generation ETag and conditional GET tests."""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+CONDITIONAL_ROUTES = (
+    "/api/v1/today",
+    "/api/v1/books",
+    "/api/v1/algorithm-groups",
+    "/api/v1/settings",
+)
+
+
+def test_conditional_get_answers_304_without_domain_queries(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """A matching ETag costs only the user lookup."""
+    client.post("/api/v1/books", json={"title": "Cached"}, headers=auth_headers)
+    etags = {}
+    for route in CONDITIONAL_ROUTES:
+        response = client.get(route, headers=auth_headers)
+        assert response.status_code == 200
+        etags[route] = response.headers["etag"]
+        assert etags[route].startswith('W/"')
+    assert len(set(etags.values())) == len(CONDITIONAL_ROUTES)
+
+    statements: list[str] = []
+    engine = session.get_bind()
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        for route, etag in etags.items():
+            response = client.get(
+                route,
+                headers={**auth_headers, "If-None-Match": etag},
+            )
+            assert response.status_code == 304
+            assert response.headers["etag"] == etag
+            assert response.content == b""
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert statements
+    assert all("FROM users" in sql or "UPDATE users" in sql for sql in statements)
+
+
+def test_writes_bump_the_generation_per_user(
+    client: TestClient,
+    user_pair_headers: tuple[dict[str, str], dict[str, str]],
+) -> None:
+    """ORM and bulk writes invalidate the writer's ETags only."""
+    user_a, user_b = user_pair_headers
+    books_etag = client.get("/api/v1/books", headers=user_a).headers["etag"]
+    groups = client.get("/api/v1/algorithm-groups", headers=user_a)
+    groups_etag = groups.headers["etag"]
+    other_etag = client.get("/api/v1/books", headers=user_b).headers["etag"]
+    assert other_etag != books_etag
+
+    client.post("/api/v1/books", json={"title": "New"}, headers=user_a)
+    response = client.get(
+        "/api/v1/books",
+        headers={**user_a, "If-None-Match": books_etag},
+    )
+    assert response.status_code == 200
+    assert [book["title"] for book in response.json()] == ["New"]
+    assert response.headers["etag"] != books_etag
+
+    # Algorithm import writes through bulk INSERT statements.
+    imported = client.post(
+        "/api/v1/algorithms/import",
+        json={
+            "algorithms": [
+                {
+                    "title": "BFS",
+                    "summary": "Summary",
+                    "when_to_use": "Always",
+                    "complexity": "O(n)",
+                    "invariants": ["I"],
+                    "steps": ["S"],
+                    "corner_cases": ["C"],
+                    "review_questions_by_interval": {
+                        "1": ["Q1"],
+                        "7": ["Q2"],
+                        "16": ["Q3"],
+                        "35": ["Q4"],
+                        "90": ["Q5"],
+                    },
+                    "code": {
+                        "code_kind": "pseudocode",
+                        "language": "text",
+                        "code_text": "code",
+                    },
+                    "group_title_new": "Graphs",
+                }
+            ]
+        },
+        headers=user_a,
+    )
+    assert imported.status_code == 201
+    response = client.get(
+        "/api/v1/algorithm-groups",
+        headers={**user_a, "If-None-Match": groups_etag},
+    )
+    assert response.status_code == 200
+    assert [group["title"] for group in response.json()] == ["Graphs"]
+
+    response = client.get(
+        "/api/v1/books",
+        headers={**user_b, "If-None-Match": other_etag},
+    )
+    assert response.status_code == 304
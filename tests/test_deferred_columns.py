@@ -0,0 +1,82 @@
+"""Deferred loading of heavy part columns in list endpoints."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+QUESTIONS_BY_INTERVAL = {
+    "1": ["Q1"],
+    "7": ["Q2"],
+    "16": ["Q3"],
+    "35": ["Q4"],
+    "90": ["Q5"],
+}
+
+
+@contextmanager
+def _captured_statements(session: Session) -> Iterator[list[str]]:
+    statements: list[str] = []
+    engine = session.get_bind()
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+
+def test_review_list_skips_part_content_columns(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """Today's reviews do not fetch notes or summaries; the detail view does."""
+    book_id = client.post(
+        "/api/v1/books",
+        json={"title": "Deferred Book"},
+        headers=auth_headers,
+    ).json()["id"]
+    part_id = client.post(
+        "/api/v1/parts",
+        json={
+            "book_id": book_id,
+            "label": "Part 1",
+            "raw_notes": {"keywords": ["x" * 2000]},
+        },
+        headers=auth_headers,
+    ).json()["id"]
+    review_items = client.post(
+        f"/api/v1/parts/{part_id}/import_gpt",
+        json={
+            "gpt_summary": "Summary " * 500,
+            "gpt_questions_by_interval": QUESTIONS_BY_INTERVAL,
+        },
+        headers=auth_headers,
+    ).json()["review_items"]
+    session.expunge_all()
+
+    with _captured_statements(session) as statements:
+        response = client.get("/api/v1/reviews/today", headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.json()) == len(review_items)
+    selects = [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+    assert selects
+    assert not any("gpt_summary" in sql or "raw_notes" in sql for sql in selects)
+
+    session.expunge_all()
+    with _captured_statements(session) as statements:
+        detail = client.get(
+            f"/api/v1/reviews/{review_items[0]['id']}",
+            headers=auth_headers,
+        )
+    assert detail.status_code == 200
+    assert detail.json()["summary"].startswith("Summary")
+    content_selects = [sql for sql in statements if "gpt_summary" in sql]
+    assert len(content_selects) == 1
+    assert "raw_notes" in content_selects[0]
@@ -0,0 +1,167 @@
+"""Batch GPT import tests."""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from studying_light.db.models.reading_part import ReadingPart
+from studying_light.db.models.review_attempt import ReviewAttempt
+from studying_light.db.models.review_schedule_item import ReviewScheduleItem
+
+QUESTIONS_BY_INTERVAL = {
+    "1": ["Q1"],
+    "7": ["Q2"],
+    "16": ["Q3"],
+    "35": ["Q4"],
+    "90": ["Q5"],
+}
+
+
+def _create_parts(
+    client: TestClient,
+    headers: dict[str, str],
+    count: int,
+) -> list[int]:
+    book_id = client.post(
+        "/api/v1/books",
+        json={"title": "Batch Book"},
+        headers=headers,
+    ).json()["id"]
+    return [
+        client.post(
+            "/api/v1/parts",
+            json={"book_id": book_id, "label": f"Part {index + 1}"},
+            headers=headers,
+        ).json()["id"]
+        for index in range(count)
+    ]
+
+
+def _batch_item(part_id: int, summary: str) -> dict[str, object]:
+    return {
+        "reading_part_id": part_id,
+        "gpt_summary": summary,
+        "gpt_questions_by_interval": QUESTIONS_BY_INTERVAL,
+    }
+
+
+def test_import_gpt_batch_reuses_replaces_and_creates_schedules(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """One batch call updates parts and writes schedules with single statements."""
+    reused_part, replaced_part, fresh_part = _create_parts(client, auth_headers, 3)
+    reused_ids = [
+        item["id"]
+        for item in client.post(
+            f"/api/v1/parts/{reused_part}/import_gpt",
+            json={
+                "gpt_summary": "Old",
+                "gpt_questions_by_interval": QUESTIONS_BY_INTERVAL,
+            },
+            headers=auth_headers,
+        ).json()["review_items"]
+    ]
+    replaced_items = client.post(
+        f"/api/v1/parts/{replaced_part}/import_gpt",
+        json={"gpt_summary": "Old", "gpt_questions_by_interval": QUESTIONS_BY_INTERVAL},
+        headers=auth_headers,
+    ).json()["review_items"]
+    complete_response = client.post(
+        f"/api/v1/reviews/{replaced_items[0]['id']}/complete",
+        json={"answers": {"Q1": "A1"}},
+        headers=auth_headers,
+    )
+    assert complete_response.status_code == 200
+
+    statements: list[str] = []
+    engine = session.get_bind()
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        response = client.post(
+            "/api/v1/parts/import_gpt_batch",
+            json={
+                "items": [
+                    _batch_item(reused_part, "Reused"),
+                    _batch_item(replaced_part, "Replaced"),
+                    _batch_item(fresh_part, "Fresh"),
+                ]
+            },
+            headers=auth_headers,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["imported"] == 3
+    results = {result["reading_part"]["id"]: result for result in payload["results"]}
+    assert [item["id"] for item in results[reused_part]["review_items"]] == reused_ids
+    assert len(results[replaced_part]["review_items"]) == 5
+    assert len(results[fresh_part]["review_items"]) == 5
+    assert results[fresh_part]["reading_part"]["gpt_summary"] == "Fresh"
+
+    item_inserts = [
+        sql for sql in statements if sql.startswith("INSERT INTO review_schedule_items")
+    ]
+    item_deletes = [
+        sql for sql in statements if sql.startswith("DELETE FROM review_schedule_items")
+    ]
+    assert len(item_inserts) == 1
+    assert len(item_deletes) == 1
+
+    session.expire_all()
+    assert session.execute(select(func.count(ReviewAttempt.id))).scalar_one() == 0
+    assert session.execute(select(func.count(ReviewScheduleItem.id))).scalar_one() == 15
+    summaries = dict(
+        session.execute(select(ReadingPart.id, ReadingPart.gpt_summary)).all()
+    )
+    assert summaries[replaced_part] == "Replaced"
+
+
+def test_import_gpt_batch_validates_before_writing(
+    client: TestClient,
+    session: Session,
+    user_pair_headers: tuple[dict[str, str], dict[str, str]],
+) -> None:
+    """Foreign parts, duplicates and missing questions reject the whole batch."""
+    owner_headers, other_headers = user_pair_headers
+    (owner_part,) = _create_parts(client, owner_headers, 1)
+    (other_part,) = _create_parts(client, other_headers, 1)
+
+    foreign = client.post(
+        "/api/v1/parts/import_gpt_batch",
+        json={
+            "items": [
+                _batch_item(owner_part, "Mine"),
+                _batch_item(other_part, "Theirs"),
+            ]
+        },
+        headers=owner_headers,
+    )
+    assert foreign.status_code == 404
+
+    duplicate = client.post(
+        "/api/v1/parts/import_gpt_batch",
+        json={"items": [_batch_item(owner_part, "A"), _batch_item(owner_part, "B")]},
+        headers=owner_headers,
+    )
+    assert duplicate.status_code == 422
+
+    incomplete = _batch_item(owner_part, "Incomplete")
+    incomplete["gpt_questions_by_interval"] = {"1": ["Q1"]}
+    missing_questions = client.post(
+        "/api/v1/parts/import_gpt_batch",
+        json={"items": [incomplete]},
+        headers=owner_headers,
+    )
+    assert missing_questions.status_code == 422
+    assert missing_questions.json()["code"] == "INVALID_JSON_BUSINESS_RULES"
+
+    session.expire_all()
+    assert session.execute(select(func.count(ReviewScheduleItem.id))).scalar_one() == 0
@@ -4,8 +4,15 @@ from __future__ import annotations
 
 import json
 
+import pytest
 from fastapi.testclient import TestClient
 
+from studying_light.services.gpt_json_parser import (
+    MAX_INPUT_CHARS,
+    GptJsonParseError,
+    parse_gpt_json_output,
+)
+
 
 def _create_part(client: TestClient, auth_headers: dict[str, str]) -> int:
     book_response = client.post(
@@ -170,3 +177,17 @@ def test_import_gpt_returns_invalid_json_schema_for_missing_required_field(
     assert response.status_code == 422
     body = response.json()
     assert body["code"] == "INVALID_JSON_SCHEMA"
+
+
+def test_gpt_json_scanner_handles_adversarial_text() -> None:
+    """Scanner skips bracket noise, respects strings and caps input size."""
+    assert parse_gpt_json_output('Use {name} or [x]: {"a": "} ]", "b": [1]}') == {
+        "a": "} ]",
+        "b": [1],
+    }
+    assert parse_gpt_json_output('note {draft: {"a": 1}} end') == {"a": 1}
+    assert parse_gpt_json_output("{" * 50_000 + '{"a": 1}' + "}" * 50_000) == {"a": 1}
+    with pytest.raises(GptJsonParseError):
+        parse_gpt_json_output('{"a": ' * 20_000)
+    with pytest.raises(GptJsonParseError, match="too large"):
+        parse_gpt_json_output("x" * (MAX_INPUT_CHARS + 1))
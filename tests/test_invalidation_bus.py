@@ -0,0 +1,92 @@
+"""Cross-worker cache invalidation bus tests."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from alembic.config import Config
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from alembic import command
+from studying_light.db.models.book import Book
+from studying_light.db.models.user import User
+from studying_light.services.invalidation_bus import (
+    start_invalidation_bus,
+    stop_invalidation_bus,
+)
+
+WORKERS = 3
+WORKER_SCRIPT = """
+import sys
+import time
+
+from sqlalchemy import create_engine
+
+from studying_light.services.invalidation_bus import start_invalidation_bus
+from studying_light.services.response_cache import (
+    MemoryResponseCache,
+    entry_tags,
+    set_response_cache,
+)
+
+database_url, user_id = sys.argv[1:]
+cache = MemoryResponseCache()
+set_response_cache(cache)
+cache.set("books", b"[]", cache.tag_versions(entry_tags(user_id, ["books"])))
+cache.set("other", b"[]", cache.tag_versions(entry_tags("other", ["books"])))
+start_invalidation_bus(create_engine(database_url), poll_seconds=0.05)
+print("ready", flush=True)
+
+deadline = time.monotonic() + 20
+while cache.get("books") is not None:
+    if time.monotonic() > deadline:
+        sys.exit("timed out")
+    time.sleep(0.02)
+print("evicted" if cache.get("other") == b"[]" else "overevicted", flush=True)
+"""
+
+
+def test_commit_evicts_cached_entries_in_other_worker_processes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A write in one process reaches the in-process caches of the others."""
+    database_url = f"sqlite:///{tmp_path / 'bus.db'}"
+    monkeypatch.setenv("DATABASE_URL", database_url)
+    command.upgrade(Config("alembic.ini"), "head")
+    user_id = uuid4()
+
+    workers = [
+        subprocess.Popen(
+            [sys.executable, "-c", WORKER_SCRIPT, database_url, str(user_id)],
+            stdout=subprocess.PIPE,
+            text=True,
+            env=os.environ.copy(),
+        )
+        for _ in range(WORKERS)
+    ]
+    engine = create_engine(database_url)
+    try:
+        for worker in workers:
+            assert worker.stdout.readline().strip() == "ready"
+
+        start_invalidation_bus(engine)
+        with Session(engine) as session:
+            session.add(User(id=user_id, email="bus@local", password_hash="hash"))
+            session.add(Book(user_id=user_id, title="Shared", status="active"))
+            session.commit()
+
+        for worker in workers:
+            output, _ = worker.communicate(timeout=30)
+            assert worker.returncode == 0
+            assert output.strip() == "evicted"
+    finally:
+        stop_invalidation_bus()
+        for worker in workers:
+            if worker.poll() is None:
+                worker.kill()
+        engine.dispose()
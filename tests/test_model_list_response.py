@@ -0,0 +1,40 @@
+"""Fast list response encoding tests."""
+
+from datetime import date
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from studying_light.api.v1.responses import ModelListResponse
+from studying_light.api.v1.schemas import ReviewItemOut
+
+
+def _item(item_id: int) -> ReviewItemOut:
+    return ReviewItemOut.model_construct(
+        id=item_id,
+        reading_part_id=1,
+        interval_days=7,
+        due_date=date(2026, 1, 8),
+        status="planned",
+        book_id=1,
+        book_title="Книга",
+        part_index=1,
+        label=None,
+        gpt_rating_1_to_5=None,
+    )
+
+
+def test_model_list_response_matches_default_encoding() -> None:
+    """Fast path emits the same bytes as FastAPI's default JSON encoding."""
+    items = [_item(1), _item(2)]
+
+    fast = ModelListResponse(items)
+    default = JSONResponse(content=jsonable_encoder(items))
+
+    assert fast.body == default.body
+    assert fast.media_type == "application/json"
+    assert ModelListResponse([]).body == b"[]"
+    projected = ModelListResponse(items, fields={"id", "due_date"})
+    assert projected.body == (
+        b'[{"id":1,"due_date":"2026-01-08"},{"id":2,"due_date":"2026-01-08"}]'
+    )
@@ -0,0 +1,197 @@
+"""Keyset pagination and sparse fieldset tests for list endpoints."""
+
+from datetime import date, datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from studying_light.api.v1.pagination import NEXT_CURSOR_HEADER
+from studying_light.db.models.review_schedule_item import ReviewScheduleItem
+from studying_light.db.models.user import User
+
+QUESTIONS_BY_INTERVAL = {
+    "1": ["Q1"],
+    "7": ["Q2"],
+    "16": ["Q3"],
+    "35": ["Q4"],
+    "90": ["Q5"],
+}
+
+
+def _collect_pages(
+    client: TestClient,
+    url: str,
+    headers: dict[str, str],
+    params: dict[str, object],
+) -> list[list[dict]]:
+    pages: list[list[dict]] = []
+    cursor = None
+    while True:
+        page_params = dict(params)
+        if cursor:
+            page_params["cursor"] = cursor
+        response = client.get(url, params=page_params, headers=headers)
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return pages
+
+
+def test_books_keyset_pages_and_field_projection(
+    client: TestClient,
+    auth_headers: dict[str, str],
+) -> None:
+    """Books are paged by cursor and trimmed to the requested fields."""
+    book_ids = [
+        client.post(
+            "/api/v1/books",
+            json={"title": f"Book {index}"},
+            headers=auth_headers,
+        ).json()["id"]
+        for index in range(5)
+    ]
+
+    pages = _collect_pages(client, "/api/v1/books", auth_headers, {"limit": 2})
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [book["id"] for page in pages for book in page] == book_ids
+
+    unpaged = client.get("/api/v1/books", headers=auth_headers)
+    assert len(unpaged.json()) == 5
+    assert NEXT_CURSOR_HEADER not in unpaged.headers
+
+    projected = client.get(
+        "/api/v1/books",
+        params={"fields": "title", "limit": 1},
+        headers=auth_headers,
+    ).json()
+    assert projected == [{"id": book_ids[0], "title": "Book 0"}]
+
+    unknown = client.get(
+        "/api/v1/books",
+        params={"fields": "title,secret"},
+        headers=auth_headers,
+    )
+    assert unknown.status_code == 422
+    assert unknown.json()["code"] == "VALIDATION_ERROR"
+    invalid_cursor = client.get(
+        "/api/v1/books",
+        params={"cursor": "not-a-cursor"},
+        headers=auth_headers,
+    )
+    assert invalid_cursor.status_code == 422
+    too_large = client.get(
+        "/api/v1/books",
+        params={"limit": 10_000},
+        headers=auth_headers,
+    )
+    assert too_large.status_code == 422
+
+
+def test_review_lists_page_by_due_date(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """Review lists keep (due_date, id) order across pages, including overdue."""
+    book_id = client.post(
+        "/api/v1/books",
+        json={"title": "Paged Reviews"},
+        headers=auth_headers,
+    ).json()["id"]
+    for label in ("Part 1", "Part 2"):
+        part = client.post(
+            "/api/v1/parts",
+            json={
+                "book_id": book_id,
+                "label": label,
+                "raw_notes": {"keywords": ["note"]},
+            },
+            headers=auth_headers,
+        ).json()
+        client.post(
+            f"/api/v1/parts/{part['id']}/import_gpt",
+            json={
+                "gpt_summary": "Summary",
+                "gpt_questions_by_interval": QUESTIONS_BY_INTERVAL,
+            },
+            headers=auth_headers,
+        )
+
+    expected = client.get("/api/v1/reviews/today", headers=auth_headers).json()
+    pages = _collect_pages(
+        client,
+        "/api/v1/reviews/today",
+        auth_headers,
+        {"limit": 3, "fields": "due_date"},
+    )
+    assert [len(page) for page in pages] == [3, 3, 3, 1]
+    flattened = [item for page in pages for item in page]
+    assert flattened == [
+        {"id": item["id"], "due_date": item["due_date"]} for item in expected
+    ]
+
+    parts = client.get(
+        "/api/v1/parts",
+        params={"book_id": book_id, "fields": "label", "limit": 1},
+        headers=auth_headers,
+    )
+    assert parts.json() == [{"id": parts.json()[0]["id"], "label": "Part 1"}]
+    assert NEXT_CURSOR_HEADER in parts.headers
+
+    items = session.execute(select(ReviewScheduleItem)).scalars().all()
+    for offset, item in enumerate(items):
+        item.due_date = date.today() - timedelta(days=offset + 1)
+    session.commit()
+    today_pages = []
+    cursor = None
+    while True:
+        params: dict[str, object] = {"limit": 4}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/today", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        today_pages.append(response.json()["overdue_review_items"])
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            break
+    assert [len(page) for page in today_pages] == [4, 4, 2]
+    due_dates = [item["due_date"] for page in today_pages for item in page]
+    assert due_dates == sorted(due_dates)
+
+
+def test_admin_users_page_newest_first(
+    client: TestClient,
+    session: Session,
+) -> None:
+    """Admin user list pages by created_at descending with a stable tie-break."""
+    for index in range(4):
+        response = client.post(
+            "/api/v1/auth/register",
+            json={"email": f"paged{index}@local", "password": "strongpass123"},
+        )
+        assert response.status_code == 201
+    users = session.execute(select(User).order_by(User.email)).scalars().all()
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for index, user in enumerate(users):
+        user.created_at = base + timedelta(days=index // 2)
+        user.is_active = True
+    users[0].is_admin = True
+    session.commit()
+    token = client.post(
+        "/api/v1/auth/login",
+        json={"email": "paged0@local", "password": "strongpass123"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    pages = _collect_pages(
+        client,
+        "/api/v1/admin/users",
+        headers,
+        {"limit": 3, "fields": "email"},
+    )
+    emails = [user["email"] for page in pages for user in page]
+    assert sorted(emails) == [f"paged{index}@local" for index in range(4)]
+    assert set(emails[:2]) == {"paged2@local", "paged3@local"}
+    assert set(emails[2:]) == {"paged0@local", "paged1@local"}
@@ -0,0 +1,97 @@
+"""Concurrent reading part index allocation tests."""
+
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+import studying_light.db.models  # noqa: F401
+from studying_light.db.base import Base
+from studying_light.db.models.book import Book
+from studying_light.db.models.reading_part import ReadingPart
+from studying_light.db.models.user import User
+from studying_light.db.session import get_session
+from studying_light.main import app
+
+PARALLEL_PARTS = 24
+
+
+@pytest.fixture()
+def file_session_local(tmp_path: Path) -> Iterator[sessionmaker[Session]]:
+    """Provide a file database so each request gets its own connection."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'parts.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    engine.dispose()
+
+
+@pytest.fixture()
+def file_client(file_session_local: sessionmaker[Session]) -> Iterator[TestClient]:
+    """Provide a test client that opens a session per request."""
+
+    def _get_session() -> Iterator[Session]:
+        db = file_session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_session] = _get_session
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+def _login(client: TestClient, session_local: sessionmaker[Session]) -> dict[str, str]:
+    credentials = {"email": "parallel@local", "password": "strongpass123"}
+    assert client.post("/api/v1/auth/register", json=credentials).status_code == 201
+    with session_local() as session:
+        user = session.execute(
+            select(User).where(User.email == credentials["email"])
+        ).scalar_one()
+        user.is_active = True
+        session.commit()
+    token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_parallel_part_creation_allocates_distinct_indexes(
+    file_client: TestClient,
+    file_session_local: sessionmaker[Session],
+) -> None:
+    """Concurrent POST /parts calls get consecutive, unique part indexes."""
+    headers = _login(file_client, file_session_local)
+    book_id = file_client.post(
+        "/api/v1/books",
+        json={"title": "Parallel"},
+        headers=headers,
+    ).json()["id"]
+
+    def _create(number: int) -> int:
+        response = file_client.post(
+            "/api/v1/parts",
+            json={"book_id": book_id, "label": f"Part {number}"},
+            headers=headers,
+        )
+        assert response.status_code == 201
+        return response.json()["part_index"]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        indexes = list(executor.map(_create, range(PARALLEL_PARTS)))
+
+    assert sorted(indexes) == list(range(1, PARALLEL_PARTS + 1))
+    with file_session_local() as session:
+        stored = session.execute(
+            select(ReadingPart.part_index).where(ReadingPart.book_id == book_id)
+        ).scalars()
+        assert sorted(stored) == sorted(indexes)
+        book = session.get(Book, book_id)
+        assert book.parts_total == PARALLEL_PARTS
+        assert book.next_part_index == PARALLEL_PARTS + 1
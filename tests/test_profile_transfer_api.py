@@ -9,6 +9,7 @@ import uuid
 from datetime import date, datetime, timezone
 from zipfile import ZIP_DEFLATED, ZipFile
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
@@ -283,6 +284,27 @@ def test_profile_export_zip_contains_manifest_and_sha256(
         assert hashlib.sha256(entries[file_name]).hexdigest() == digest
 
 
+def test_profile_export_resolves_review_questions_from_the_part(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    user = _get_user(session, "user@local")
+    _seed_full_profile(session, user, "SRC")
+    review_item = session.execute(
+        select(ReviewScheduleItem).where(ReviewScheduleItem.user_id == user.id)
+    ).scalar_one()
+    review_item.questions = None
+    session.commit()
+
+    response = client.get("/api/v1/profile-export.zip", headers=auth_headers)
+    assert response.status_code == 200
+
+    entries = _read_zip_entries(response.content)
+    rows = json.loads(entries["data/review_schedule_items.json"])
+    assert [row["questions"] for row in rows] == [["q"]]
+
+
 def test_profile_import_merge_roundtrip_preserves_counts(
     client: TestClient,
     session: Session,
@@ -586,3 +608,37 @@ def test_profile_import_compat_missing_file_when_manifest_indicates_empty(
     )
     assert response.status_code == 200
     assert response.json()["status"] == "ok"
+
+
+def test_profile_import_rows_report_invalid_rows_by_index() -> None:
+    """Bulk row validation keeps per-row indexes in its error report."""
+    file_name = "data/review_attempts.json"
+    rows = [
+        {"legacy_id": 1, "review_item_legacy_id": 10, "answers": {"q": "a"}},
+        {"legacy_id": "x", "review_item_legacy_id": 10},
+        {"legacy_id": 3, "review_item_legacy_id": 10, "created_at": "2026-01-02"},
+    ]
+    valid = profile_import_service._load_rows(
+        json.dumps([rows[0], rows[2]]).encode("utf-8"),
+        profile_import_service.ReviewAttemptIn,
+        file_name,
+    )
+    assert [row.legacy_id for row in valid] == [1, 3]
+    assert valid[1].created_at == datetime(2026, 1, 2)
+
+    cases = [
+        (json.dumps(rows).encode("utf-8"), "Validation failed", [1]),
+        (b'{"legacy_id": 1}', "must contain a JSON array", None),
+        (b"[{", "Invalid JSON", None),
+    ]
+    for raw, detail, indexes in cases:
+        with pytest.raises(profile_import_service.ProfileImportError) as exc_info:
+            profile_import_service._load_rows(
+                raw,
+                profile_import_service.ReviewAttemptIn,
+                file_name,
+            )
+        assert detail in exc_info.value.detail
+        assert exc_info.value.errors[0]["file"] == file_name
+        if indexes is not None:
+            assert [error["index"] for error in exc_info.value.errors] == indexes
@@ -0,0 +1,56 @@
+"""Prompt template endpoint tests."""
+
+import gzip
+from importlib import resources
+
+from fastapi.testclient import TestClient
+
+
+def test_prompt_is_served_from_memory_with_etag_and_gzip(
+    client: TestClient,
+) -> None:
+    """Templates come precompressed, revalidate with 304 and pin by version."""
+    expected = (
+        resources.files("studying_light.prompts")
+        .joinpath("check_answers.txt")
+        .read_text(encoding="utf-8")
+    )
+
+    plain = client.get(
+        "/prompts/check_answers",
+        headers={"Accept-Encoding": "identity"},
+    )
+    assert plain.status_code == 200
+    assert plain.text == expected
+    assert plain.headers["content-type"] == "text/plain; charset=utf-8"
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["cache-control"] == "public, no-cache"
+    etag = plain.headers["etag"]
+    assert not etag.startswith("W/")
+
+    compressed = client.get(
+        "/prompts/check_answers",
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert compressed.headers["etag"] != etag
+    assert compressed.text == expected
+    assert int(compressed.headers["content-length"]) == len(
+        gzip.compress(expected.encode(), compresslevel=9, mtime=0)
+    )
+
+    not_modified = client.get(
+        "/prompts/check_answers",
+        headers={"Accept-Encoding": "identity", "If-None-Match": etag},
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    version = client.get("/prompts/version").json()["version"]
+    pinned = client.get(f"/prompts/check_answers?v={version}")
+    assert pinned.headers["cache-control"] == "public, max-age=31536000, immutable"
+    stale = client.get("/prompts/check_answers?v=old")
+    assert stale.headers["cache-control"] == "public, no-cache"
+
+    assert client.get("/prompts/unknown").status_code == 404
@@ -0,0 +1,157 @@
+"""Response cache backend and invalidation tests."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from studying_light.db.models.user import User
+from studying_light.services.response_cache import (
+    MemoryResponseCache,
+    ResponseCache,
+    SqliteResponseCache,
+    get_response_cache,
+    set_response_cache,
+)
+
+CACHED_ROUTES = (
+    "/api/v1/today",
+    "/api/v1/books",
+    "/api/v1/algorithm-groups",
+    "/api/v1/stats",
+)
+
+
+@pytest.fixture()
+def cache() -> Iterator[MemoryResponseCache]:
+    """Install a fresh in-process cache for the test."""
+    previous = get_response_cache()
+    cache = MemoryResponseCache(max_entries=64, ttl_seconds=60)
+    set_response_cache(cache)
+    try:
+        yield cache
+    finally:
+        set_response_cache(previous)
+
+
+def test_reads_hit_the_cache_and_writes_invalidate_it(
+    client: TestClient,
+    session: Session,
+    cache: MemoryResponseCache,
+    user_pair_headers: tuple[dict[str, str], dict[str, str]],
+) -> None:
+    """Repeated reads skip domain queries; a write is visible right away."""
+    user_a, user_b = user_pair_headers
+    client.post("/api/v1/books", json={"title": "First"}, headers=user_a)
+    client.post("/api/v1/books", json={"title": "Other"}, headers=user_b)
+    first = {route: client.get(route, headers=user_a) for route in CACHED_ROUTES}
+    client.get("/api/v1/books", headers=user_b)
+
+    statements: list[str] = []
+    engine = session.get_bind()
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        for route, response in first.items():
+            cached = client.get(route, headers=user_a)
+            assert cached.status_code == 200
+            assert cached.json() == response.json()
+            assert cached.headers["etag"] == response.headers["etag"]
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    assert all("FROM users" in sql or "UPDATE users" in sql for sql in statements)
+    hits = cache.stats()["hits"]
+    assert hits >= len(CACHED_ROUTES)
+
+    # Never serve the pre-write copy, not even once.
+    client.post("/api/v1/books", json={"title": "Second"}, headers=user_a)
+    books = client.get("/api/v1/books", headers=user_a)
+    assert [book["title"] for book in books.json()] == ["First", "Second"]
+    today = client.get("/api/v1/today", headers=user_a)
+    assert [book["title"] for book in today.json()["active_books"]] == [
+        "First",
+        "Second",
+    ]
+
+    # Another user's entries survive the write.
+    other = client.get("/api/v1/books", headers=user_b)
+    assert [book["title"] for book in other.json()] == ["Other"]
+    assert cache.stats()["hits"] == hits + 1
+
+    admin = session.scalars(select(User).where(User.email == "user-a@local")).one()
+    admin.is_admin = True
+    session.commit()
+    stats = client.get("/api/v1/admin/response-cache", headers=user_a)
+    assert stats.status_code == 200
+    assert stats.json()["hits"] == hits + 1
+    assert stats.json()["invalidations"] > 0
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request: pytest.FixtureRequest, tmp_path: Path) -> ResponseCache:
+    """Provide each cache backend with room for two entries."""
+    if request.param == "sqlite":
+        return SqliteResponseCache(tmp_path / "cache.db", max_entries=2)
+    return MemoryResponseCache(max_entries=2)
+
+
+def test_backend_rejects_values_computed_before_an_invalidation(
+    backend: ResponseCache,
+) -> None:
+    """A write landing while a value is computed keeps it out of the cache."""
+    versions = backend.tag_versions(["books", "books:u1"])
+    backend.invalidate(["books:u1"])
+    assert backend.set("key", b"stale", versions) is False
+    assert backend.get("key") is None
+
+    versions = backend.tag_versions(["books", "books:u1"])
+    assert backend.set("key", b"fresh", versions) is True
+    assert backend.get("key") == b"fresh"
+    backend.invalidate(["books"])
+    assert backend.get("key") is None
+
+
+def test_backend_evicts_least_recently_used_entries(backend: ResponseCache) -> None:
+    """The entry bound drops the least recently read entry first."""
+    versions = backend.tag_versions(["books"])
+    backend.set("a", b"a", versions)
+    backend.set("b", b"b", versions)
+    assert backend.get("a") == b"a"
+    backend.set("c", b"c", versions)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == b"a"
+    assert backend.get("c") == b"c"
+    stats = backend.stats()
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+
+
+def test_backend_expires_entries_after_ttl(backend: ResponseCache) -> None:
+    """Entries older than the TTL are misses."""
+    backend.ttl_seconds = 0
+    backend.set("key", b"value", backend.tag_versions(["books"]))
+    assert backend.get("key") is None
+    assert backend.stats()["expirations"] == 1
+
+
+def test_sqlite_backend_shares_invalidations_between_workers(
+    tmp_path: Path,
+) -> None:
+    """An invalidation in one worker hides the entry from the others."""
+    path = tmp_path / "shared.db"
+    worker_a = SqliteResponseCache(path)
+    worker_b = SqliteResponseCache(path)
+    worker_a.set("key", b"value", worker_a.tag_versions(["books:u1"]))
+    assert worker_b.get("key") == b"value"
+
+    worker_b.invalidate(["books:u1"])
+    assert worker_a.get("key") is None
@@ -0,0 +1,222 @@
+"""Batch review completion tests."""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from studying_light.db.constants import (
+    ACTIVITY_KIND_REVIEW_ALGORITHM_THEORY,
+    ACTIVITY_KIND_REVIEW_THEORY,
+)
+from studying_light.db.models.algorithm_review_attempt import AlgorithmReviewAttempt
+from studying_light.db.models.algorithm_review_item import AlgorithmReviewItem
+from studying_light.db.models.review_attempt import ReviewAttempt
+from studying_light.db.models.review_schedule_item import ReviewScheduleItem
+from studying_light.db.models.user_activity_event import UserActivityEvent
+
+QUESTIONS_BY_INTERVAL = {
+    "1": ["Q1"],
+    "7": ["Q2"],
+    "16": ["Q3"],
+    "35": ["Q4"],
+    "90": ["Q5"],
+}
+
+
+def _create_review_items(client: TestClient, headers: dict[str, str]) -> list[int]:
+    book_response = client.post(
+        "/api/v1/books",
+        json={"title": "Batch Book"},
+        headers=headers,
+    )
+    assert book_response.status_code == 201
+    part_response = client.post(
+        "/api/v1/parts",
+        json={"book_id": book_response.json()["id"], "label": "Part 1"},
+        headers=headers,
+    )
+    assert part_response.status_code == 201
+    import_response = client.post(
+        f"/api/v1/parts/{part_response.json()['id']}/import_gpt",
+        json={
+            "gpt_summary": "Summary",
+            "gpt_questions_by_interval": QUESTIONS_BY_INTERVAL,
+        },
+        headers=headers,
+    )
+    assert import_response.status_code == 200
+    return [item["id"] for item in import_response.json()["review_items"]]
+
+
+def _create_algorithm_review_items(
+    client: TestClient,
+    session: Session,
+    headers: dict[str, str],
+) -> list[int]:
+    response = client.post(
+        "/api/v1/algorithms/import",
+        json={
+            "groups": [],
+            "algorithms": [
+                {
+                    "title": "BFS",
+                    "summary": "Summary",
+                    "when_to_use": "When to use",
+                    "complexity": "O(1)",
+                    "invariants": ["Always"],
+                    "steps": ["Step 1"],
+                    "corner_cases": ["None"],
+                    "review_questions_by_interval": QUESTIONS_BY_INTERVAL,
+                    "code": {
+                        "code_kind": "pseudocode",
+                        "language": "text",
+                        "code_text": "code",
+                    },
+                    "group_title_new": "Graphs",
+                }
+            ],
+        },
+        headers=headers,
+    )
+    assert response.status_code == 201
+    algorithm_id = response.json()["algorithms_created"][0]["algorithm_id"]
+    return list(
+        session.execute(
+            select(AlgorithmReviewItem.id)
+            .where(AlgorithmReviewItem.algorithm_id == algorithm_id)
+            .order_by(AlgorithmReviewItem.id)
+        )
+        .scalars()
+        .all()
+    )
+
+
+def test_complete_reviews_batch_reports_per_item_results(
+    client: TestClient,
+    session: Session,
+    user_pair_headers: tuple[dict[str, str], dict[str, str]],
+) -> None:
+    """Owned items are completed together; foreign ids are reported missing."""
+    owner_headers, other_headers = user_pair_headers
+    review_ids = _create_review_items(client, owner_headers)
+    foreign_ids = _create_review_items(client, other_headers)
+
+    response = client.post(
+        "/api/v1/reviews/complete-batch",
+        json={
+            "items": [
+                {"review_id": review_ids[0], "answers": {"q1": "a1"}},
+                {"review_id": foreign_ids[0], "answers": {}},
+                {"review_id": review_ids[1], "answers": {"q2": "a2"}},
+            ]
+        },
+        headers=owner_headers,
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["completed"] == 2
+    assert [result["status"] for result in payload["results"]] == [
+        "completed",
+        "not_found",
+        "completed",
+    ]
+    assert payload["results"][0]["review_item"]["status"] == "done"
+    assert payload["results"][1]["review_item"] is None
+
+    done_ids = set(
+        session.execute(
+            select(ReviewScheduleItem.id).where(ReviewScheduleItem.status == "done")
+        )
+        .scalars()
+        .all()
+    )
+    assert done_ids == {review_ids[0], review_ids[1]}
+    attempts = session.execute(select(ReviewAttempt)).scalars().all()
+    assert {attempt.review_item_id: attempt.answers for attempt in attempts} == {
+        review_ids[0]: {"q1": "a1"},
+        review_ids[1]: {"q2": "a2"},
+    }
+    # Theory review events are unique per reading part, like single completions.
+    events = (
+        session.execute(
+            select(UserActivityEvent).where(
+                UserActivityEvent.activity_kind == ACTIVITY_KIND_REVIEW_THEORY
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert len(events) == 1
+    assert events[0].review_item_id == review_ids[0]
+
+
+def test_complete_reviews_batch_rejects_duplicate_ids(
+    client: TestClient,
+    auth_headers: dict[str, str],
+) -> None:
+    """Duplicate review ids are rejected before touching the database."""
+    review_ids = _create_review_items(client, auth_headers)
+
+    response = client.post(
+        "/api/v1/reviews/complete-batch",
+        json={
+            "items": [
+                {"review_id": review_ids[0], "answers": {}},
+                {"review_id": review_ids[0], "answers": {}},
+            ]
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 422
+    assert response.json()["code"] == "VALIDATION_ERROR"
+
+    empty_response = client.post(
+        "/api/v1/reviews/complete-batch",
+        json={"items": []},
+        headers=auth_headers,
+    )
+    assert empty_response.status_code == 422
+
+
+def test_complete_algorithm_reviews_batch(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """Algorithm review items can be completed in one request."""
+    review_ids = _create_algorithm_review_items(client, session, auth_headers)
+
+    response = client.post(
+        "/api/v1/algorithm-reviews/complete-batch",
+        json={
+            "items": [
+                {"review_id": review_id, "answers": {"q": "a"}}
+                for review_id in review_ids[:3]
+            ]
+            + [{"review_id": 999999, "answers": {}}]
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["completed"] == 3
+    assert payload["results"][-1] == {
+        "review_id": 999999,
+        "status": "not_found",
+        "review_item": None,
+    }
+    assert all(
+        result["review_item"]["group_title"] == "Graphs"
+        for result in payload["results"][:3]
+    )
+
+    attempts_total = session.execute(
+        select(func.count(AlgorithmReviewAttempt.id))
+    ).scalar_one()
+    assert attempts_total == 3
+    events_total = session.execute(
+        select(func.count(UserActivityEvent.id)).where(
+            UserActivityEvent.activity_kind == ACTIVITY_KIND_REVIEW_ALGORITHM_THEORY
+        )
+    ).scalar_one()
+    assert events_total == 3
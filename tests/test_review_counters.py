@@ -0,0 +1,284 @@
+"""Review counter maintenance tests."""
+
+from datetime import date
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from alembic.config import Config
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, select, text, update
+from sqlalchemy.orm import Session
+
+from alembic import command
+from studying_light.db.models.algorithm import Algorithm
+from studying_light.db.models.algorithm_review_item import AlgorithmReviewItem
+from studying_light.db.models.reading_part import ReadingPart
+from studying_light.services.review_counters import (
+    find_review_counter_drift,
+    rebuild_review_counters,
+)
+
+QUESTIONS_BY_INTERVAL = {
+    "1": ["Q1"],
+    "7": ["Q2"],
+    "16": ["Q3"],
+    "35": ["Q4"],
+    "90": ["Q5"],
+}
+REVIEW_TABLES = ("review_schedule_items", "review_attempts")
+
+
+def _theory_feedback(rating: int) -> dict:
+    return {
+        "gpt_check_result": {
+            "meta": {
+                "book_title": "Counted",
+                "part_index": 1,
+                "part_label": "Part 1",
+                "interval_days": 1,
+                "review_date": date.today().isoformat(),
+            },
+            "overall": {
+                "rating_1_to_5": rating,
+                "score_0_to_100": rating * 20,
+                "verdict": "PASS",
+                "key_gaps": [],
+                "next_steps": [],
+                "limitations": [],
+            },
+            "items": [
+                {
+                    "question": "Q1",
+                    "user_answer": "A1",
+                    "rating_1_to_5": rating,
+                    "is_answered": True,
+                    "mistakes": [],
+                    "short_feedback": "",
+                    "correct_answer": "A1",
+                }
+            ],
+        }
+    }
+
+
+def _algorithm_feedback(rating: int) -> dict:
+    return {
+        "gpt_check_result": {
+            "meta": {
+                "group_title": "Graphs",
+                "algorithm_title": "BFS",
+                "interval_days": 1,
+                "review_date": date.today().isoformat(),
+            },
+            "overall": {
+                "rating_1_to_5": rating,
+                "key_gaps": [],
+                "next_steps": [],
+                "limitations": [],
+            },
+            "items": [
+                {
+                    "question": "Q1",
+                    "user_answer": "A1",
+                    "rating_1_to_5": rating,
+                    "is_answered": True,
+                    "short_feedback": "",
+                    "correct_answer": "A1",
+                    "mistakes": [],
+                }
+            ],
+        }
+    }
+
+
+def test_theory_review_writes_maintain_part_counters(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """Completions and feedback update counters read by /reviews/stats."""
+    book_id = client.post(
+        "/api/v1/books",
+        json={"title": "Counted"},
+        headers=auth_headers,
+    ).json()["id"]
+    part_id = client.post(
+        "/api/v1/parts",
+        json={"book_id": book_id, "label": "Part 1"},
+        headers=auth_headers,
+    ).json()["id"]
+    client.post(
+        f"/api/v1/parts/{part_id}/import_gpt",
+        json={
+            "gpt_summary": "Summary",
+            "gpt_questions_by_interval": QUESTIONS_BY_INTERVAL,
+        },
+        headers=auth_headers,
+    )
+    today = client.get("/api/v1/reviews/today", headers=auth_headers).json()
+    review_id = today[0]["id"]
+    client.post(
+        f"/api/v1/reviews/{review_id}/complete",
+        json={"answers": {"Q1": "A1"}},
+        headers=auth_headers,
+    )
+    # The second feedback replaces the attempt's rating instead of adding one.
+    for rating in (2, 5):
+        client.post(
+            f"/api/v1/reviews/{review_id}/save_gpt_feedback",
+            json=_theory_feedback(rating),
+            headers=auth_headers,
+        )
+
+    statements: list[str] = []
+    engine = session.get_bind()
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        response = client.get("/api/v1/reviews/stats", headers=auth_headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert response.status_code == 200
+    (stats,) = response.json()
+    assert stats["total_reviews"] == 5
+    assert stats["completed_reviews"] == 1
+    assert stats["gpt_attempts_total"] == 1
+    assert stats["gpt_average_rating"] == 5.0
+    assert not [
+        sql for sql in statements if any(table in sql for table in REVIEW_TABLES)
+    ]
+
+    session.expire_all()
+    assert find_review_counter_drift(session) == []
+    session.execute(
+        update(ReadingPart).where(ReadingPart.id == part_id).values(total_reviews=0)
+    )
+    assert find_review_counter_drift(session) == [("theory", part_id)]
+    assert rebuild_review_counters(session) == 1
+    assert find_review_counter_drift(session) == []
+    assert session.get(ReadingPart, part_id).total_reviews == 5
+
+
+def test_algorithm_review_writes_maintain_algorithm_counters(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """Bulk-imported algorithms start with counters that match their items."""
+    response = client.post(
+        "/api/v1/algorithms/import",
+        json={
+            "algorithms": [
+                {
+                    "title": "BFS",
+                    "summary": "Summary",
+                    "when_to_use": "Always",
+                    "complexity": "O(n)",
+                    "invariants": ["I"],
+                    "steps": ["S"],
+                    "corner_cases": ["C"],
+                    "review_questions_by_interval": QUESTIONS_BY_INTERVAL,
+                    "code": {
+                        "code_kind": "pseudocode",
+                        "language": "text",
+                        "code_text": "code",
+                    },
+                    "group_title_new": "Graphs",
+                }
+            ]
+        },
+        headers=auth_headers,
+    )
+    algorithm_id = response.json()["algorithms_created"][0]["algorithm_id"]
+    review_item_id = session.scalars(
+        select(AlgorithmReviewItem.id)
+        .where(AlgorithmReviewItem.algorithm_id == algorithm_id)
+        .order_by(AlgorithmReviewItem.id)
+    ).first()
+    client.post(
+        f"/api/v1/algorithm-reviews/{review_item_id}/complete",
+        json={"answers": {"Q1": "A1"}},
+        headers=auth_headers,
+    )
+    client.post(
+        f"/api/v1/algorithm-reviews/{review_item_id}/save_gpt_feedback",
+        json=_algorithm_feedback(4),
+        headers=auth_headers,
+    )
+
+    (stats,) = client.get(
+        "/api/v1/algorithm-reviews/stats",
+        headers=auth_headers,
+    ).json()
+    assert stats["total_reviews"] == 5
+    assert stats["completed_reviews"] == 1
+    assert stats["gpt_attempts_total"] == 1
+    assert stats["gpt_average_rating"] == 4.0
+
+    session.expire_all()
+    assert session.get(Algorithm, algorithm_id).gpt_rating_sum == 4
+    assert find_review_counter_drift(session) == []
+
+
+def test_review_counters_migration_backfills_existing_reviews(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Migration 0022 should derive counters from existing review rows."""
+    db_url = f"sqlite:///{tmp_path / 'migration-review-counters.db'}"
+    monkeypatch.setenv("DATABASE_URL", db_url)
+    alembic_cfg = Config("alembic.ini")
+
+    command.upgrade(alembic_cfg, "0021_add_book_soft_delete")
+    engine = create_engine(db_url)
+    user_id = str(uuid4())
+    statements = [
+        """
+        INSERT INTO users (id, email, password_hash)
+        VALUES (:user_id, 'review-counters@local', 'hash')
+        """,
+        """
+        INSERT INTO books (id, user_id, title, status)
+        VALUES (1, :user_id, 'Book', 'active')
+        """,
+        """
+        INSERT INTO reading_parts (id, user_id, book_id, part_index)
+        VALUES (1, :user_id, 1, 1), (2, :user_id, 1, 2)
+        """,
+        """
+        INSERT INTO review_schedule_items (
+            id, user_id, reading_part_id, interval_days, due_date, status
+        ) VALUES
+            (1, :user_id, 1, 1, '2026-01-02', 'done'),
+            (2, :user_id, 1, 7, '2026-01-08', 'planned')
+        """,
+        """
+        INSERT INTO review_attempts (user_id, review_item_id, gpt_rating_1_to_5)
+        VALUES (:user_id, 1, 3), (:user_id, 1, 5), (:user_id, 1, NULL)
+        """,
+    ]
+    with engine.begin() as connection:
+        for statement in statements:
+            connection.execute(text(statement), {"user_id": user_id})
+
+    command.upgrade(alembic_cfg, "0022_add_review_counters")
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text(
+                """
+                SELECT id, total_reviews, completed_reviews,
+                    gpt_attempts_total, gpt_rating_sum
+                FROM reading_parts
+                ORDER BY id
+                """
+            )
+        ).all()
+    assert [tuple(row) for row in rows] == [(1, 2, 1, 2, 8), (2, 0, 0, 0, 0)]
+
+    command.downgrade(alembic_cfg, "0021_add_book_soft_delete")
+    engine.dispose()
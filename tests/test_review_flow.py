@@ -1,5 +1,6 @@
 """Review flow integration tests."""
 
+from collections import Counter
 from datetime import date, datetime, timedelta
 
 from fastapi.testclient import TestClient
@@ -8,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from studying_light.db.models.reading_part import ReadingPart
 from studying_light.db.models.review_schedule_item import ReviewScheduleItem
+from studying_light.services.review_scheduler import resolve_review_questions
 
 
 def test_part_import_creates_reviews_and_today(
@@ -102,11 +104,42 @@ def test_part_import_creates_reviews_and_today(
     stored_part = session.get(ReadingPart, part_id)
     assert stored_part is not None
     assert stored_part.gpt_summary == markdown_summary
+    # Questions live on the part; items only reference them by interval.
+    assert all(item.questions is None for item in stored_items)
     questions_by_interval = {
-        item.interval_days: item.questions for item in stored_items
+        item.interval_days: resolve_review_questions(item, stored_part)
+        for item in stored_items
     }
     assert questions_by_interval[1] == ["Q1"]
     assert questions_by_interval[7] == ["Q2"]
+    detail_response = client.get(
+        f"/api/v1/reviews/{review_items[0]['id']}",
+        headers=auth_headers,
+    )
+    assert detail_response.status_code == 200
+    assert detail_response.json()["questions"] == ["Q1"]
+
+    reimport_payload = {
+        **import_payload,
+        "gpt_questions_by_interval": {
+            **import_payload["gpt_questions_by_interval"],
+            "1": ["Q1 updated"],
+        },
+    }
+    reimport_response = client.post(
+        f"/api/v1/parts/{part_id}/import_gpt",
+        json=reimport_payload,
+        headers=auth_headers,
+    )
+    assert reimport_response.status_code == 200
+    assert [item["id"] for item in reimport_response.json()["review_items"]] == [
+        item["id"] for item in review_items
+    ]
+    detail_response = client.get(
+        f"/api/v1/reviews/{review_items[0]['id']}",
+        headers=auth_headers,
+    )
+    assert detail_response.json()["questions"] == ["Q1 updated"]
 
     overdue_item = next(
         item for item in stored_items if item.interval_days == 7
@@ -124,3 +157,177 @@ def test_part_import_creates_reviews_and_today(
     assert len(overdue_items) == 1
     assert overdue_items[0]["interval_days"] == 7
     assert date.fromisoformat(overdue_items[0]["due_date"]) < date.today()
+
+
+def test_spread_overdue_reviews_preview_and_apply(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """Overdue items are redistributed across days with a daily cap."""
+    book_response = client.post(
+        "/api/v1/books",
+        json={"title": "Backlog Book"},
+        headers=auth_headers,
+    )
+    book_id = book_response.json()["id"]
+    part_response = client.post(
+        "/api/v1/parts",
+        json={"book_id": book_id, "label": "Part 1"},
+        headers=auth_headers,
+    )
+    part_id = part_response.json()["id"]
+    import_response = client.post(
+        f"/api/v1/parts/{part_id}/import_gpt",
+        json={
+            "gpt_summary": "Summary",
+            "gpt_questions_by_interval": {
+                "1": ["Q1"],
+                "7": ["Q2"],
+                "16": ["Q3"],
+                "35": ["Q4"],
+                "90": ["Q5"],
+            },
+        },
+        headers=auth_headers,
+    )
+    assert import_response.status_code == 200
+
+    today = date.today()
+    stored_items = (
+        session.execute(
+            select(ReviewScheduleItem)
+            .where(ReviewScheduleItem.reading_part_id == part_id)
+            .order_by(ReviewScheduleItem.id)
+        )
+        .scalars()
+        .all()
+    )
+    for offset, item in enumerate(stored_items, start=1):
+        item.due_date = today - timedelta(days=offset)
+    session.commit()
+
+    preview = client.post(
+        "/api/v1/reviews/spread-overdue",
+        json={"days": 3, "daily_cap": 2, "dry_run": True},
+        headers=auth_headers,
+    )
+    assert preview.status_code == 200
+    preview_payload = preview.json()
+    assert preview_payload["overdue_count"] == 5
+    assert preview_payload["updated_count"] == 0
+    assert [day["count"] for day in preview_payload["days"]] == [2, 2, 1]
+    session.expire_all()
+    assert all(item.due_date < today for item in stored_items)
+
+    too_small = client.post(
+        "/api/v1/reviews/spread-overdue",
+        json={"days": 2, "daily_cap": 2},
+        headers=auth_headers,
+    )
+    assert too_small.status_code == 422
+
+    applied = client.post(
+        "/api/v1/reviews/spread-overdue",
+        json={"days": 3, "daily_cap": 2},
+        headers=auth_headers,
+    )
+    assert applied.status_code == 200
+    assert applied.json()["updated_count"] == 5
+    session.expire_all()
+    due_dates = [item.due_date for item in stored_items]
+    # The most overdue items (last in id order here) move to today first.
+    assert due_dates == [
+        today + timedelta(days=2),
+        today + timedelta(days=1),
+        today + timedelta(days=1),
+        today,
+        today,
+    ]
+
+
+def test_spread_overdue_counts_reviews_already_due_on_target_days(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """A target day only takes what its already due reviews leave of the cap."""
+    book_id = client.post(
+        "/api/v1/books",
+        json={"title": "Busy Book"},
+        headers=auth_headers,
+    ).json()["id"]
+    part_ids = []
+    for label in ("Overdue", "Scheduled"):
+        part_id = client.post(
+            "/api/v1/parts",
+            json={"book_id": book_id, "label": label},
+            headers=auth_headers,
+        ).json()["id"]
+        client.post(
+            f"/api/v1/parts/{part_id}/import_gpt",
+            json={
+                "gpt_summary": "Summary",
+                "gpt_questions_by_interval": {
+                    "1": ["Q1"],
+                    "7": ["Q2"],
+                    "16": ["Q3"],
+                    "35": ["Q4"],
+                    "90": ["Q5"],
+                },
+            },
+            headers=auth_headers,
+        )
+        part_ids.append(part_id)
+
+    today = date.today()
+    overdue_part, scheduled_part = part_ids
+    items = session.scalars(
+        select(ReviewScheduleItem).order_by(ReviewScheduleItem.id)
+    ).all()
+    overdue = [item for item in items if item.reading_part_id == overdue_part]
+    scheduled = [item for item in items if item.reading_part_id == scheduled_part]
+    for offset, item in enumerate(overdue, start=1):
+        item.due_date = today - timedelta(days=offset)
+    # Two reviews already fill today, one takes a slot tomorrow.
+    for item, offset in zip(scheduled, (0, 0, 1, 30, 60), strict=True):
+        item.due_date = today + timedelta(days=offset)
+    session.commit()
+
+    too_small = client.post(
+        "/api/v1/reviews/spread-overdue",
+        json={"days": 3, "daily_cap": 2},
+        headers=auth_headers,
+    )
+    assert too_small.status_code == 422
+
+    applied = client.post(
+        "/api/v1/reviews/spread-overdue",
+        json={"days": 4, "daily_cap": 2},
+        headers=auth_headers,
+    )
+    assert applied.status_code == 200
+    assert applied.json()["updated_count"] == 5
+    assert [
+        (date.fromisoformat(day["due_date"]), day["count"])
+        for day in applied.json()["days"]
+    ] == [
+        (today + timedelta(days=1), 1),
+        (today + timedelta(days=2), 2),
+        (today + timedelta(days=3), 2),
+    ]
+
+    session.expire_all()
+    due_per_day = Counter(
+        session.scalars(
+            select(ReviewScheduleItem.due_date).where(
+                ReviewScheduleItem.due_date < today + timedelta(days=4)
+            )
+        )
+    )
+    assert due_per_day == {
+        today: 2,
+        today + timedelta(days=1): 2,
+        today + timedelta(days=2): 2,
+        today + timedelta(days=3): 2,
+    }
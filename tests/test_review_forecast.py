@@ -0,0 +1,169 @@
+"""Review workload forecast tests."""
+
+from collections.abc import Iterator
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from studying_light.db.models.review_schedule_item import ReviewScheduleItem
+from studying_light.db.models.user import User
+from studying_light.services.response_cache import (
+    MemoryResponseCache,
+    get_response_cache,
+    set_response_cache,
+)
+
+QUESTIONS_BY_INTERVAL = {
+    "1": ["Q1"],
+    "7": ["Q2"],
+    "16": ["Q3"],
+    "35": ["Q4"],
+    "90": ["Q5"],
+}
+
+
+@pytest.fixture()
+def cache() -> Iterator[MemoryResponseCache]:
+    """Install a fresh in-process cache for the test."""
+    previous = get_response_cache()
+    cache = MemoryResponseCache(max_entries=64, ttl_seconds=60)
+    set_response_cache(cache)
+    try:
+        yield cache
+    finally:
+        set_response_cache(previous)
+
+
+def _import_part(client: TestClient, headers: dict[str, str]) -> list[dict]:
+    book_id = client.post(
+        "/api/v1/books",
+        json={"title": "Forecast Book"},
+        headers=headers,
+    ).json()["id"]
+    part_id = client.post(
+        "/api/v1/parts",
+        json={"book_id": book_id, "label": "Part 1"},
+        headers=headers,
+    ).json()["id"]
+    response = client.post(
+        f"/api/v1/parts/{part_id}/import_gpt",
+        json={
+            "gpt_summary": "Summary",
+            "gpt_questions_by_interval": QUESTIONS_BY_INTERVAL,
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200
+    return response.json()["review_items"]
+
+
+def test_review_forecast_histogram_and_invalidation(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """Forecast buckets due items per day and refreshes after schedule changes."""
+    review_items = _import_part(client, auth_headers)
+
+    response = client.get(
+        "/api/v1/reviews/forecast",
+        params={"days": 30},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["total_due"] == 3
+    assert payload["overdue_count"] == 0
+    due_by_offset = {
+        offset: day["due"]
+        for offset, day in enumerate(payload["forecast"])
+        if day["due"]
+    }
+    assert due_by_offset == {1: 1, 7: 1, 16: 1}
+    assert payload["forecast"][1]["expected_retention"] == 0.9
+
+    complete_response = client.post(
+        f"/api/v1/reviews/{review_items[0]['id']}/complete",
+        json={"answers": {}},
+        headers=auth_headers,
+    )
+    assert complete_response.status_code == 200
+    refreshed = client.get(
+        "/api/v1/reviews/forecast",
+        params={"days": 30},
+        headers=auth_headers,
+    ).json()
+    assert refreshed["total_due"] == 2
+
+
+def test_review_forecast_simulates_backlog_with_capacity(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """A daily capacity carries overdue items forward and lowers retention."""
+    _import_part(client, auth_headers)
+    items = session.execute(select(ReviewScheduleItem)).scalars().all()
+    for item in items:
+        item.due_date = date.today() - timedelta(days=2)
+    session.commit()
+
+    response = client.get(
+        "/api/v1/reviews/forecast",
+        params={"days": 7, "daily_capacity": 2},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["overdue_count"] == 5
+    assert [day["reviewed"] for day in payload["forecast"][:4]] == [2, 2, 1, 0]
+    assert [day["backlog"] for day in payload["forecast"][:3]] == [3, 1, 0]
+    assert payload["backlog_end"] == 0
+    assert payload["expected_retention"] < 0.9
+
+    invalid_response = client.get(
+        "/api/v1/reviews/forecast",
+        params={"days": 0},
+        headers=auth_headers,
+    )
+    assert invalid_response.status_code == 422
+
+
+def test_review_forecast_spread_invalidates_only_its_user(
+    client: TestClient,
+    session: Session,
+    cache: MemoryResponseCache,
+    user_pair_headers: tuple[dict[str, str], dict[str, str]],
+) -> None:
+    """A bulk spread by one user keeps the other user's forecast cached."""
+    user_a, user_b = user_pair_headers
+    _import_part(client, user_a)
+    _import_part(client, user_b)
+    owner = session.scalars(select(User).where(User.email == "user-a@local")).one()
+    for item in session.scalars(
+        select(ReviewScheduleItem).where(ReviewScheduleItem.user_id == owner.id)
+    ):
+        item.due_date = date.today() - timedelta(days=1)
+    session.commit()
+
+    before_a = client.get("/api/v1/reviews/forecast", headers=user_a).json()
+    before_b = client.get("/api/v1/reviews/forecast", headers=user_b).json()
+    assert before_a["overdue_count"] == 5
+    assert client.get("/api/v1/reviews/forecast", headers=user_b).json() == before_b
+    hits = cache.stats()["hits"]
+
+    spread = client.post(
+        "/api/v1/reviews/spread-overdue",
+        json={"days": 5, "daily_cap": 1},
+        headers=user_a,
+    )
+    assert spread.status_code == 200
+    assert spread.json()["updated_count"] == 5
+
+    after_a = client.get("/api/v1/reviews/forecast", headers=user_a).json()
+    assert after_a["overdue_count"] == 0
+    assert client.get("/api/v1/reviews/forecast", headers=user_b).json() == before_b
+    assert cache.stats()["hits"] == hits + 1
@@ -0,0 +1,103 @@
+"""Migration tests for review item latest attempt pointers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+
+from alembic import command
+
+
+def test_last_attempt_migration_backfills_pointer(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Migration 0018 should point items at their newest attempt and rating."""
+    db_path = tmp_path / "migration-last-attempt.db"
+    db_url = f"sqlite:///{db_path}"
+    monkeypatch.setenv("DATABASE_URL", db_url)
+    alembic_cfg = Config("alembic.ini")
+
+    command.upgrade(alembic_cfg, "0017_add_review_scheduler")
+    engine = create_engine(db_url)
+
+    user_id = str(uuid4())
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                """
+                INSERT INTO users (id, email, password_hash)
+                VALUES (:id, 'pointer@local', 'hash')
+                """
+            ),
+            {"id": user_id},
+        )
+        connection.execute(
+            text(
+                """
+                INSERT INTO books (id, user_id, title, status)
+                VALUES (1, :user_id, 'Book', 'active')
+                """
+            ),
+            {"user_id": user_id},
+        )
+        connection.execute(
+            text(
+                """
+                INSERT INTO reading_parts (id, user_id, book_id, part_index)
+                VALUES (1, :user_id, 1, 1)
+                """
+            ),
+            {"user_id": user_id},
+        )
+        for item_id in (1, 2):
+            connection.execute(
+                text(
+                    """
+                    INSERT INTO review_schedule_items (
+                        id, user_id, reading_part_id, interval_days, due_date, status
+                    ) VALUES (:id, :user_id, 1, 1, '2026-01-02', 'done')
+                    """
+                ),
+                {"id": item_id, "user_id": user_id},
+            )
+        for attempt_id, created_at, rating in (
+            (10, "2026-01-02 10:00:00", 2),
+            (11, "2026-01-03 10:00:00", 5),
+        ):
+            connection.execute(
+                text(
+                    """
+                    INSERT INTO review_attempts (
+                        id, user_id, review_item_id, answers, created_at,
+                        gpt_rating_1_to_5
+                    ) VALUES (:id, :user_id, 1, '{}', :created_at, :rating)
+                    """
+                ),
+                {
+                    "id": attempt_id,
+                    "user_id": user_id,
+                    "created_at": created_at,
+                    "rating": rating,
+                },
+            )
+
+    command.upgrade(alembic_cfg, "0018_add_review_item_last_attempt")
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text(
+                """
+                SELECT id, last_attempt_id, last_rating
+                FROM review_schedule_items
+                ORDER BY id
+                """
+            )
+        ).all()
+    assert [tuple(row) for row in rows] == [(1, 11, 5), (2, None, None)]
+
+    command.downgrade(alembic_cfg, "0017_add_review_scheduler")
+    engine.dispose()
@@ -0,0 +1,153 @@
+"""Adaptive review scheduler tests."""
+
+from datetime import date
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from studying_light.db.models.reading_part import ReadingPart
+from studying_light.db.models.review_schedule_item import ReviewScheduleItem
+from studying_light.services.review_scheduler import (
+    Sm2Scheduler,
+    resolve_review_questions,
+)
+
+QUESTIONS_BY_INTERVAL = {
+    "1": ["Q1"],
+    "7": ["Q2"],
+    "16": ["Q3"],
+    "35": ["Q4"],
+    "90": ["Q5"],
+}
+
+
+def _feedback(rating: int) -> dict:
+    return {
+        "gpt_check_result": {
+            "meta": {
+                "book_title": "SM-2 Book",
+                "part_index": 1,
+                "part_label": "Part 1",
+                "interval_days": 1,
+                "review_date": date.today().isoformat(),
+            },
+            "overall": {
+                "rating_1_to_5": rating,
+                "score_0_to_100": rating * 20,
+                "verdict": "FAIL",
+                "key_gaps": [],
+                "next_steps": [],
+                "limitations": [],
+            },
+            "items": [
+                {
+                    "question": "Q1",
+                    "user_answer": "A1",
+                    "rating_1_to_5": rating,
+                    "is_answered": True,
+                    "mistakes": [],
+                    "short_feedback": "",
+                    "correct_answer": "A1",
+                }
+            ],
+        }
+    }
+
+
+def _planned_items(session: Session, part_id: int) -> list[ReviewScheduleItem]:
+    session.expire_all()
+    return (
+        session.execute(
+            select(ReviewScheduleItem).where(
+                ReviewScheduleItem.reading_part_id == part_id,
+                ReviewScheduleItem.status == "planned",
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+
+def test_sm2_scheduler_replays_ratings() -> None:
+    """Passed reviews advance the step; failures reset the interval."""
+    scheduler = Sm2Scheduler()
+    intervals = [1, 7, 16, 35, 90]
+
+    assert scheduler.next_review(intervals, []).interval_days == 1
+    first = scheduler.next_review(intervals, [5])
+    assert (first.step, first.interval_days) == (1, 7)
+    assert scheduler.next_review(intervals, [5, 5]).interval_days > 16
+    failed = scheduler.next_review(intervals, [5, 1])
+    assert (failed.step, failed.interval_days) == (1, 1)
+    assert scheduler.next_review(intervals, [4] * 5) is None
+
+
+def test_sm2_import_creates_next_item_lazily(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """With SM-2 only the next review exists and feedback reschedules it."""
+    settings_response = client.patch(
+        "/api/v1/settings",
+        json={"review_scheduler": "sm2"},
+        headers=auth_headers,
+    )
+    assert settings_response.status_code == 200
+    assert settings_response.json()["review_scheduler"] == "sm2"
+
+    book_id = client.post(
+        "/api/v1/books",
+        json={"title": "SM-2 Book"},
+        headers=auth_headers,
+    ).json()["id"]
+    part_id = client.post(
+        "/api/v1/parts",
+        json={"book_id": book_id, "label": "Part 1"},
+        headers=auth_headers,
+    ).json()["id"]
+    import_response = client.post(
+        f"/api/v1/parts/{part_id}/import_gpt",
+        json={
+            "gpt_summary": "Summary",
+            "gpt_questions_by_interval": QUESTIONS_BY_INTERVAL,
+        },
+        headers=auth_headers,
+    )
+    assert import_response.status_code == 200
+    review_items = import_response.json()["review_items"]
+    assert [item["interval_days"] for item in review_items] == [1]
+
+    complete_response = client.post(
+        f"/api/v1/reviews/{review_items[0]['id']}/complete",
+        json={"answers": {"Q1": "A1"}},
+        headers=auth_headers,
+    )
+    assert complete_response.status_code == 200
+    planned = _planned_items(session, part_id)
+    part = session.get(ReadingPart, part_id)
+    assert len(planned) == 1
+    assert planned[0].interval_days == 7
+    assert resolve_review_questions(planned[0], part) == ["Q2"]
+
+    feedback_response = client.post(
+        f"/api/v1/reviews/{review_items[0]['id']}/save_gpt_feedback",
+        json=_feedback(1),
+        headers=auth_headers,
+    )
+    assert feedback_response.status_code == 200
+    completed_item = session.get(ReviewScheduleItem, review_items[0]["id"])
+    assert completed_item.last_attempt_id == feedback_response.json()["id"]
+    assert completed_item.last_rating == 1
+    planned = _planned_items(session, part_id)
+    assert len(planned) == 1
+    assert planned[0].interval_days == 1
+    assert resolve_review_questions(planned[0], part) == ["Q1"]
+
+    invalid_response = client.patch(
+        "/api/v1/settings",
+        json={"review_scheduler": "unknown"},
+        headers=auth_headers,
+    )
+    assert invalid_response.status_code == 422
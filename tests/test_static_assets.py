@@ -0,0 +1,135 @@
+"""SPA entrypoint and static asset serving tests."""
+
+import gzip
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from studying_light import main
+from studying_light.api.static import PrecompressedStaticFiles, load_spa_index
+
+INDEX_HTML = b"<!doctype html><div id='root'></div>" * 64
+ASSET_JS = b"console.log('studying light');\n" * 256
+
+
+@pytest.fixture()
+def static_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Point the app at a built frontend in a temporary directory."""
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    (tmp_path / "index.html").write_bytes(INDEX_HTML)
+    (assets / "index-B4x9Kq2L.js").write_bytes(ASSET_JS)
+    (assets / "index-B4x9Kq2L.js.gz").write_bytes(gzip.compress(ASSET_JS))
+    (assets / "favicon.svg").write_bytes(b"<svg></svg>")
+    monkeypatch.setattr(main, "STATIC_DIR", tmp_path)
+    load_spa_index.cache_clear()
+    try:
+        yield tmp_path
+    finally:
+        load_spa_index.cache_clear()
+
+
+def test_spa_index_is_served_from_memory_with_etag(
+    client: TestClient,
+    static_dir: Path,
+) -> None:
+    """index.html revalidates by ETag and survives the file going away."""
+    first = client.get("/", headers={"Accept-Encoding": "identity"})
+    assert first.status_code == 200
+    assert first.content == INDEX_HTML
+    assert first.headers["content-type"] == "text/html; charset=utf-8"
+    assert first.headers["cache-control"] == "no-cache"
+    etag = first.headers["etag"]
+
+    (static_dir / "index.html").unlink()
+    fallback = client.get("/books/1", headers={"Accept-Encoding": "identity"})
+    assert fallback.content == INDEX_HTML
+    assert fallback.headers["etag"] == etag
+
+    not_modified = client.get(
+        "/reviews",
+        headers={"Accept-Encoding": "identity", "If-None-Match": etag},
+    )
+    assert not_modified.status_code == 304
+
+    compressed = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert compressed.content == INDEX_HTML
+    assert compressed.headers["etag"] != etag
+
+    assert client.get("/api/unknown").status_code == 404
+
+
+def test_missing_spa_index_is_not_found(
+    client: TestClient,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Without a frontend build the fallback answers 404, not 500."""
+    monkeypatch.setattr(main, "STATIC_DIR", tmp_path)
+    load_spa_index.cache_clear()
+    response = client.get("/")
+    load_spa_index.cache_clear()
+    assert response.status_code == 404
+    assert response.json()["code"] == "NOT_FOUND"
+
+
+def test_hashed_assets_are_immutable_and_precompressed(static_dir: Path) -> None:
+    """Hashed names cache for a year; .gz siblings follow Accept-Encoding."""
+    app = Starlette(
+        routes=[
+            Mount(
+                "/assets",
+                PrecompressedStaticFiles(
+                    directory=static_dir / "assets",
+                    immutable_hashed_assets=True,
+                ),
+            ),
+            Mount(
+                "/landing",
+                PrecompressedStaticFiles(directory=static_dir / "assets"),
+            ),
+        ]
+    )
+    with TestClient(app) as assets_client:
+        compressed = assets_client.get(
+            "/assets/index-B4x9Kq2L.js",
+            headers={"Accept-Encoding": "br, gzip"},
+        )
+        assert compressed.status_code == 200
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert compressed.headers["content-type"].startswith("text/javascript")
+        assert compressed.headers["cache-control"] == (
+            "public, max-age=31536000, immutable"
+        )
+        assert compressed.content == ASSET_JS
+
+        plain = assets_client.get(
+            "/assets/index-B4x9Kq2L.js",
+            headers={"Accept-Encoding": "identity"},
+        )
+        assert "content-encoding" not in plain.headers
+        assert plain.content == ASSET_JS
+        assert plain.headers["etag"] != compressed.headers["etag"]
+
+        not_modified = assets_client.get(
+            "/assets/index-B4x9Kq2L.js",
+            headers={
+                "Accept-Encoding": "gzip",
+                "If-None-Match": compressed.headers["etag"],
+            },
+        )
+        assert not_modified.status_code == 304
+
+        icon = assets_client.get("/assets/favicon.svg")
+        assert icon.headers["cache-control"] == "no-cache"
+
+        # Hand-named files may look hashed; only the build output is immutable.
+        landing = assets_client.get("/landing/index-B4x9Kq2L.js")
+        assert landing.status_code == 200
+        assert landing.headers["cache-control"] == "no-cache"
@@ -0,0 +1,147 @@
+"""Stats overview aggregation, caching and ETag tests."""
+
+from datetime import date
+
+from fastapi.testclient import TestClient
+from httpx import Response
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+QUESTIONS_BY_INTERVAL = {
+    "1": ["Q1"],
+    "7": ["Q2"],
+    "16": ["Q3"],
+    "35": ["Q4"],
+    "90": ["Q5"],
+}
+REVIEW_TABLES = (
+    "review_schedule_items",
+    "review_attempts",
+    "algorithm_review_items",
+    "algorithm_review_attempts",
+)
+
+
+def _feedback(rating: int) -> dict:
+    return {
+        "gpt_check_result": {
+            "meta": {
+                "book_title": "Stats Book",
+                "part_index": 1,
+                "part_label": "Part 1",
+                "interval_days": 1,
+                "review_date": date.today().isoformat(),
+            },
+            "overall": {
+                "rating_1_to_5": rating,
+                "score_0_to_100": rating * 20,
+                "verdict": "PASS",
+                "key_gaps": [],
+                "next_steps": [],
+                "limitations": [],
+            },
+            "items": [
+                {
+                    "question": "Q1",
+                    "user_answer": "A1",
+                    "rating_1_to_5": rating,
+                    "is_answered": True,
+                    "mistakes": [],
+                    "short_feedback": "",
+                    "correct_answer": "A1",
+                }
+            ],
+        }
+    }
+
+
+def _review_statements(
+    client: TestClient,
+    session: Session,
+    headers: dict[str, str],
+    if_none_match: str | None = None,
+) -> tuple[Response, list[str]]:
+    statements: list[str] = []
+    engine = session.get_bind()
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        if any(table in statement for table in REVIEW_TABLES):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        if if_none_match is not None:
+            headers = {**headers, "If-None-Match": if_none_match}
+        response = client.get("/api/v1/stats", headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    return response, statements
+
+
+def test_stats_overview_runs_two_queries_and_is_cached(
+    client: TestClient,
+    session: Session,
+    auth_headers: dict[str, str],
+) -> None:
+    """The overview costs two statements, then serves from cache with an ETag."""
+    book_id = client.post(
+        "/api/v1/books",
+        json={"title": "Stats Book"},
+        headers=auth_headers,
+    ).json()["id"]
+    part_id = client.post(
+        "/api/v1/parts",
+        json={"book_id": book_id, "label": "Part 1"},
+        headers=auth_headers,
+    ).json()["id"]
+    client.post(
+        f"/api/v1/parts/{part_id}/import_gpt",
+        json={
+            "gpt_summary": "Summary",
+            "gpt_questions_by_interval": QUESTIONS_BY_INTERVAL,
+        },
+        headers=auth_headers,
+    )
+
+    first, statements = _review_statements(client, session, auth_headers)
+    assert first.status_code == 200
+    assert len(statements) == 2
+    assert first.json()["theory"] == {
+        "average_rating_7d": None,
+        "average_rating_30d": None,
+        "planned_count": 5,
+        "completed_count": 0,
+    }
+    etag = first.headers["etag"]
+
+    second, statements = _review_statements(client, session, auth_headers)
+    assert statements == []
+    assert second.headers["etag"] == etag
+    assert second.json() == first.json()
+
+    not_modified, _ = _review_statements(client, session, auth_headers, etag)
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+
+    today = client.get("/api/v1/reviews/today", headers=auth_headers).json()
+    review_id = today[0]["id"]
+    client.post(
+        f"/api/v1/reviews/{review_id}/complete",
+        json={"answers": {"Q1": "A1"}},
+        headers=auth_headers,
+    )
+    client.post(
+        f"/api/v1/reviews/{review_id}/save_gpt_feedback",
+        json=_feedback(4),
+        headers=auth_headers,
+    )
+
+    refreshed, statements = _review_statements(client, session, auth_headers, etag)
+    assert refreshed.status_code == 200
+    assert len(statements) == 2
+    assert refreshed.headers["etag"] != etag
+    theory = refreshed.json()["theory"]
+    assert theory["completed_count"] == 1
+    assert theory["average_rating_7d"] == 4.0
+    assert theory["average_rating_30d"] == 4.0